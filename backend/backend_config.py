@@ -7,6 +7,8 @@ import os
 # ==========================================
 WEBSOCKET_HOST = "0.0.0.0"
 WEBSOCKET_PORT = 8000
+WEBSOCKET_DEFAULT_PROTOCOL = "json"  # "json" (base64 data URLs) or "binary"
+WEBSOCKET_DEFAULT_RESPONSE_MODE = "image"  # "image" (annotated JPEG) or "landmarks"
 
 # ==========================================
 # CORS configuration
@@ -22,14 +24,97 @@ CORS_CONFIG = {
 # Image saving configuration (for debugging)
 # ==========================================
 SAVE_IMAGES = False
-SAVE_DIR = "saved_images"
+SAVE_DIR = "saved_images"  # With FRAME_EXECUTOR = "process", each worker uses SAVE_DIR/worker_<index>
+SAVE_MODE = "image"  # "image" (annotated JPEG), "landmarks" (JSON) or "both"
+SAVE_EVERY_N_FRAMES = 1  # Save every Nth frame with a hand
+SAVE_MAX_PER_SECOND = None  # Captures per second and worker, None for no limit
+SAVE_QUEUE_SIZE = 32  # Captures waiting for the background writer; more are dropped
+SAVE_MAX_BYTES = 500 * 1024 * 1024  # Oldest captures are deleted beyond this total size (split across worker processes), None for no limit
+SAVE_MAX_AGE = None  # seconds after which captures are deleted, None to keep them
 
 # ==========================================
 # ASL Recognition configuration
 # ==========================================
 ENABLE_ASL_PREDICTION = False
-ASL_MODEL_TYPE = "online"  # "custom" or "online"
+ASL_MODEL_TYPE = "online"  # "custom", "online" or "student"
+ASL_TOP_K = None  # Number of letters in asl_probabilities, None for all
+ASL_INFERENCE_BACKEND = "sklearn"  # "sklearn" (joblib) or "onnx" (requires onnxruntime and an ONNX export)
+ASL_ONNX_INTRA_OP_THREADS = 1  # onnxruntime threads per prediction
+ASL_COMPILED_FOREST = True  # Evaluate RandomForest models with the flat-array engine
+ASL_CASCADE_TREES = None  # Trees in the cascade's first stage (compiled forests only), None disables it
+ASL_CASCADE_THRESHOLD = 0.8  # Top first-stage probability needed to skip the remaining trees
+ASL_PREDICTION_CACHE_SIZE = 256  # Cached predictions of recent poses, 0 disables the cache
+ASL_PREDICTION_CACHE_STEP = 0.005  # Grid size used to match nearly identical poses (normalized coordinates)
+ASL_MODEL_CACHE_MAX_MODELS = 2  # Models kept loaded at once (least recently used are evicted)
+ASL_MODEL_CACHE_MAX_BYTES = None  # Combined size limit of loaded models, None for no limit
+ASL_MODEL_MMAP_MODE = None  # "r" memory-maps model arrays (compiled forests copy them anyway)
+ASL_MODEL_WATCH_INTERVAL = 2.0  # seconds between checks for updated model files, None to disable
 ASL_MODELS = {
     "custom": os.path.join("models", "custom_handsignimages.joblib"),
-    "online": os.path.join("models", "online_marxulia_asl_sign_languages_alphabets_v03.joblib")
+    "online": os.path.join("models", "online_marxulia_asl_sign_languages_alphabets_v03.joblib"),
+    # Compact forest distilled from the online model (make distill)
+    "student": os.path.join("models", "student_online_marxulia_asl_sign_languages_alphabets_v03.joblib")
 }
+
+# ==========================================
+# Frame processing configuration
+# ==========================================
+FRAME_EXECUTOR = "thread"  # "thread" or "process"
+FRAME_EXECUTOR_WORKERS = os.cpu_count() or 1
+FRAME_EXECUTOR_MAX_PENDING = 32  # Frames queued or running across all sessions
+
+# ==========================================
+# Hand detector pool configuration
+# ==========================================
+HANDS_POOL_MAX_SIZE = 8  # Maximum detectors per worker (leased + idle)
+HANDS_POOL_IDLE_TIMEOUT = 60.0  # seconds before an idle detector is closed
+HANDS_MODEL_COMPLEXITY = 1  # MediaPipe hand landmark model: 0 (lite) or 1 (full)
+
+# ==========================================
+# Keyframe tracking configuration
+# ==========================================
+KEYFRAME_INTERVAL = 1  # Run full hand detection every N frames (1 disables tracking)
+KEYFRAME_MIN_TRACKED_RATIO = 0.9  # Re-detect when optical flow loses more landmarks
+KEYFRAME_MAX_FLOW_ERROR = 20.0  # Re-detect when the mean optical flow error is higher
+
+# ==========================================
+# Region of interest configuration
+# ==========================================
+ROI_ENABLED = True  # Detect around the previous hand before scanning the full frame
+ROI_PADDING = 0.5  # Fraction of the hand box size added on each side
+ROI_MAX_SIZE = 320  # Longest side, in pixels, of the crop passed to MediaPipe
+ROI_MIN_SIZE = 96  # Smallest side, in frame pixels, of the region
+
+# ==========================================
+# Scene change gating configuration
+# ==========================================
+SCENE_GATE_ENABLED = True  # Skip hand detection while the camera sees a static scene
+SCENE_GATE_WIDTH = 64  # Width, in pixels, of the thumbnails compared between frames
+SCENE_GATE_PIXEL_THRESHOLD = 15  # Gray level difference that counts as a changed thumbnail pixel
+SCENE_GATE_CHANGED_RATIO = 0.002  # Fraction of changed thumbnail pixels that counts as a scene change
+SCENE_GATE_MAX_FRAMES = 15  # Run detection at least every N frames, even on a static scene
+
+# ==========================================
+# Motion gating configuration
+# ==========================================
+MOTION_GATE_ENABLED = True  # Reuse the previous hand analysis while the hand stays still
+MOTION_GATE_THRESHOLD = 0.03  # Mean landmark displacement, as a fraction of the hand size, that counts as movement
+MOTION_GATE_MAX_FRAMES = 30  # Re-analyze a still hand at least every N frames
+
+# ==========================================
+# Frame resolution configuration
+# ==========================================
+PROCESSING_MAX_WIDTH = 640  # Frames are decoded at most this wide (None keeps full size)
+PROCESSING_MIN_WIDTH = 160  # Smallest processing width a client may request
+CAPTURE_JPEG_QUALITY = 0.7  # JPEG quality (0-1) clients are asked to encode frames with
+
+# ==========================================
+# MQTT publishing configuration
+# ==========================================
+MQTT_PUBLISH_QUEUE_SIZE = 256  # Queued messages above which hand status updates are dropped; gesture events are never dropped
+MQTT_HAND_STATUS_HEARTBEAT = 5.0  # seconds after which an unchanged hand status is republished, None for changes only
+
+# ==========================================
+# Metrics Configuration
+# ==========================================
+METRICS_INCLUDE_TIMINGS = False  # Add per-stage timings (ms) to every response by default
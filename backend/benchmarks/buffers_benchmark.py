@@ -0,0 +1,122 @@
+"""
+Allocation rate of the per-frame image stages, with and without session buffers.
+
+Replays recorded frames, re-encoded as JPEG like a client would send them,
+through the pipeline's image stages (decode, scene thumbnail, grayscale and
+RGB conversion, region of interest crop and JPEG encoding) once allocating
+fresh arrays as before and once writing into a session's `FrameBuffers`.
+MediaPipe itself is not run. Allocations are measured with tracemalloc,
+which sees NumPy and OpenCV arrays: each stage contributes the peak memory
+it allocated on top of what was already live.
+
+Usage:
+    python backend/benchmarks/buffers_benchmark.py --source <video|dir> --width 640 --capture-width 960 --cameras 4
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+from benchmarks.frames import load_frames
+from pipeline.buffers import FrameBuffers
+from pipeline.decode import decode_frame
+from pipeline.roi import HandRegion
+from pipeline.scene import SceneChangeGate
+
+
+class AllocationMeter:
+    """Sums the peak memory each measured stage allocates."""
+
+    def __init__(self):
+        self.bytes = 0
+
+    def measure(self, stage, *args, **kwargs):
+        """Run `stage` and add the memory it allocated at its peak."""
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = stage(*args, **kwargs)
+        self.bytes += tracemalloc.get_traced_memory()[1] - before
+        return result
+
+
+def process_image_stages(jpeg, width, meter, gate, region, buffers=None):
+    """Run the image stages of `process_frame` on one frame."""
+    frame = meter.measure(decode_frame, jpeg, width, buffers)
+    meter.measure(gate.thumbnail, frame, buffers)
+    shape = frame.shape
+    meter.measure(
+        cv2.cvtColor, frame, cv2.COLOR_BGR2GRAY,
+        dst=buffers.swap("gray", shape[:2]) if buffers is not None else None
+    )
+    crop = meter.measure(region.crop, frame, buffers)
+    meter.measure(
+        cv2.cvtColor, crop, cv2.COLOR_BGR2RGB,
+        dst=buffers.get("rgb_crop", crop.shape) if buffers is not None else None
+    )
+    meter.measure(
+        cv2.cvtColor, frame, cv2.COLOR_BGR2RGB,
+        dst=buffers.get("rgb", shape) if buffers is not None else None
+    )
+    meter.measure(cv2.imencode, ".jpg", frame)
+
+
+def run(jpegs, width, use_buffers):
+    """Process all frames and return (bytes allocated per frame, seconds per frame)."""
+    meter = AllocationMeter()
+    gate = SceneChangeGate()
+    region = HandRegion()
+    buffers = FrameBuffers() if use_buffers else None
+
+    # A fixed square region in the middle of the frame, large enough to be downscaled
+    height = decode_frame(jpegs[0], width).shape[0]
+    side = height * 3 // 4
+    region.box = (width // 2 - side // 2, height // 8, width // 2 - side // 2 + side, height // 8 + side)
+
+    # The first frame allocates the buffers; steady state is what matters
+    process_image_stages(jpegs[0], width, AllocationMeter(), gate, region, buffers)
+
+    start = time.perf_counter()
+    for jpeg in jpegs:
+        process_image_stages(jpeg, width, meter, gate, region, buffers)
+    elapsed = time.perf_counter() - start
+    return meter.bytes / len(jpegs), elapsed / len(jpegs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-frame allocations of the image stages")
+    parser.add_argument("--source", required=True, help="Video file or directory of images")
+    parser.add_argument("--max-frames", type=int, default=300, help="Maximum number of frames to load")
+    parser.add_argument("--width", type=int, default=640, help="Processing width")
+    parser.add_argument("--capture-width", type=int, default=960, help="Width of the frames sent by the client")
+    parser.add_argument("--quality", type=int, default=70, help="JPEG quality of the replayed frames (0-100)")
+    parser.add_argument("--fps", type=float, default=30, help="Frame rate per camera used for the rates")
+    parser.add_argument("--cameras", type=int, default=1, help="Number of cameras used for the rates")
+    args = parser.parse_args()
+
+    # Frames at the capture width, as clients send them
+    frames = load_frames(args.source, args.max_frames)
+    jpegs = []
+    for frame in frames:
+        height = round(frame.shape[0] * args.capture_width / frame.shape[1])
+        frame = cv2.resize(frame, (args.capture_width, height))
+        jpegs.append(cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, args.quality])[1].tobytes())
+    print(f"Loaded {len(jpegs)} frames from {args.source}")
+
+    tracemalloc.start()
+    rate = args.fps * args.cameras
+    print(f"\nRates at {args.fps:g} fps x {args.cameras} camera(s)")
+    print(f"{'':>16} {'KB/frame':>10} {'MB/s':>8} {'ms/frame':>9}")
+    for label, use_buffers in (("fresh arrays", False), ("session buffers", True)):
+        per_frame, seconds = run(jpegs, args.width, use_buffers)
+        print(f"{label:>16} {per_frame / 1e3:>10.1f} {per_frame * rate / 1e6:>8.1f} {seconds * 1000:>9.2f}")
+    tracemalloc.stop()
+    print("\nRemaining allocations are the decoder's output and the encoded JPEG, which OpenCV always allocates.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Escalation rate, accuracy and latency of the two-stage ASL cascade.
+
+Evaluates a trained forest on the test split its trainer saved next to it,
+once with every tree and once per (first-stage trees, threshold) cascade
+setting, one sample at a time as in the backend.
+
+Usage:
+    python backend/benchmarks/cascade_benchmark.py --model online --trees 5,10,20 --thresholds 0.6,0.7,0.8,0.9
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from backend_config import ASL_MODELS
+from inference.forest import CompiledForest
+from inference.model_loader import load_model
+
+
+def test_split_path_for(model_path):
+    """Return the path of the test split saved next to a model (see training/splits.py)."""
+    return os.path.splitext(model_path)[0] + "_test.npz"
+
+
+def time_per_sample(predict, X):
+    """Run `predict` on each sample separately.
+
+    Returns:
+        tuple: (stacked outputs, mean seconds per sample)
+    """
+    outputs = []
+    start = time.perf_counter()
+    for row in X:
+        outputs.append(predict(row.reshape(1, -1)))
+    return outputs, (time.perf_counter() - start) / len(X)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the two-stage ASL cascade")
+    parser.add_argument("--model", default="online", help="ASL model type (a key of ASL_MODELS)")
+    parser.add_argument("--trees", default="5,10,20", help="Comma-separated first-stage tree counts")
+    parser.add_argument("--thresholds", default="0.5,0.6,0.7,0.8,0.9", help="Comma-separated confidence thresholds")
+    parser.add_argument("--max-samples", type=int, default=1000, help="Maximum number of test samples")
+    parser.add_argument("--output", default=None, help="Optional path to write the JSON report")
+    args = parser.parse_args()
+
+    model_path = ASL_MODELS[args.model]
+    split = np.load(test_split_path_for(model_path))
+    X_test, y_test = split["X"][:args.max_samples], split["y"][:args.max_samples]
+
+    # The saved test split is already scaled, so only the forest is needed
+    model, _ = load_model(args.model, backend="sklearn")
+    forest = CompiledForest(model)
+    print(f"Loaded {args.model} ({forest.n_estimators} trees) and {len(X_test)} test samples")
+
+    outputs, full_seconds = time_per_sample(forest.predict_proba, X_test)
+    full_pred = forest.classes_[np.argmax(np.vstack(outputs), axis=1)]
+    full_accuracy = float(np.mean(full_pred == y_test))
+
+    report = []
+    for first_trees in (int(value) for value in args.trees.split(",")):
+        for threshold in (float(value) for value in args.thresholds.split(",")):
+            outputs, seconds = time_per_sample(
+                lambda x: forest.cascade_proba(x, first_trees, threshold), X_test
+            )
+            proba = np.vstack([output[0] for output in outputs])
+            escalated = np.concatenate([output[1] for output in outputs])
+            pred = forest.classes_[np.argmax(proba, axis=1)]
+            accuracy = float(np.mean(pred == y_test))
+            report.append({
+                "first_trees": first_trees,
+                "threshold": threshold,
+                "escalation_rate": float(escalated.mean()),
+                "accuracy": accuracy,
+                "accuracy_delta": accuracy - full_accuracy,
+                "agreement_with_full": float(np.mean(pred == full_pred)),
+                "latency_ms": seconds * 1000,
+                "speedup": full_seconds / seconds
+            })
+
+    print(f"\nFull forest: accuracy {full_accuracy:.4f}, {full_seconds * 1000:.3f} ms per sample")
+    print(f"\n{'trees':>6} {'thresh':>7} {'escalated':>10} {'accuracy':>9} {'delta':>8} {'agree':>7} {'ms':>7} {'speedup':>8}")
+    for entry in report:
+        print(
+            f"{entry['first_trees']:>6} {entry['threshold']:>7.2f} {entry['escalation_rate']:>10.1%} "
+            f"{entry['accuracy']:>9.4f} {entry['accuracy_delta']:>+8.4f} {entry['agreement_with_full']:>7.1%} "
+            f"{entry['latency_ms']:>7.3f} {entry['speedup']:>7.2f}x"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "model": args.model,
+                "trees": forest.n_estimators,
+                "full_accuracy": full_accuracy,
+                "full_latency_ms": full_seconds * 1000,
+                "cascade": report
+            }, f, indent=2)
+        print(f"\nReport saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import os
+from pathlib import Path
+import cv2
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png")
+
+
+def load_frames(source, max_frames=None):
+    """
+    Load recorded frames from a video file or a directory of images.
+    
+    Args:
+        source: Path to a video file or to a directory of images
+        max_frames: Optional maximum number of frames to load
+        
+    Returns:
+        list: BGR frames as numpy arrays, in playback order
+    """
+    frames = []
+    if os.path.isdir(source):
+        paths = sorted(p for p in Path(source).iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)
+        for path in paths[:max_frames]:
+            frame = cv2.imread(str(path))
+            if frame is None:
+                print(f"Warning: Could not read image {path}")
+                continue
+            frames.append(frame)
+    else:
+        capture = cv2.VideoCapture(source)
+        while max_frames is None or len(frames) < max_frames:
+            ok, frame = capture.read()
+            if not ok:
+                break
+            frames.append(frame)
+        capture.release()
+
+    if not frames:
+        raise ValueError(f"No frames could be loaded from {source}")
+    return frames
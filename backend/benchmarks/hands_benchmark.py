@@ -0,0 +1,195 @@
+"""
+Per-frame Python overhead of the hand analysis.
+
+Compares the baseline per-hand flow, copied verbatim from before the array
+representation, with the current one. The baseline walked the MediaPipe
+landmark objects attribute by attribute: `count_fingers` (which computes
+the hand view), the hand view twice more, and with ASL enabled the
+featurization twice (`predict` and `predict_proba`). The current flow
+converts each hand once into a preallocated (21, 3) array with
+`hand_results` and works on that. Hands are real MediaPipe
+`NormalizedLandmarkList` protobufs built from random points; detection
+itself is not run.
+
+With ASL off the conversion can cost more than the attribute walks it
+replaces; the arrays are what region of interest mapping, tracking and
+drawing work on, which this benchmark does not measure.
+
+Usage:
+    python backend/benchmarks/hands_benchmark.py --hands 2000 --repeat 5
+"""
+import argparse
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from mediapipe.framework.formats import landmark_pb2
+from inference.utils import preprocess_landmarks
+from pipeline.hands import count_fingers, get_hand_view, hand_results
+
+
+def synthetic_hands(count, seed=0):
+    """Return random hands as MediaPipe landmark lists."""
+    rng = np.random.default_rng(seed)
+    points = rng.random((count, 21, 3)).astype(np.float32)
+    return [
+        landmark_pb2.NormalizedLandmarkList(landmark=[
+            landmark_pb2.NormalizedLandmark(x=x, y=y, z=z) for x, y, z in hand.tolist()
+        ])
+        for hand in points
+    ]
+
+
+# Baseline code, unchanged apart from the names
+
+
+def legacy_count_fingers(hand_landmarks, handedness_label):
+    """
+    Count extended fingers based on hand landmarks, corrected handedness,
+    and hand view ('palm' or 'back').
+    """
+    count = 0
+    lifted_fingers = []
+    if hand_landmarks:
+        hand_view = legacy_get_hand_view(hand_landmarks, handedness_label)
+
+        thumb_tip = hand_landmarks.landmark[4]
+        thumb_ip = hand_landmarks.landmark[3]
+
+        if handedness_label == "left":
+            if hand_view == "back":
+                if thumb_tip.x > thumb_ip.x:
+                    count += 1
+            else:
+                if thumb_tip.x < thumb_ip.x:
+                    count += 1
+        elif handedness_label == "right":
+            if hand_view == "back":
+                if thumb_tip.x < thumb_ip.x:
+                    count += 1
+            else:
+                if thumb_tip.x > thumb_ip.x:
+                    count += 1
+
+        if count == 1:
+            lifted_fingers.append(0)
+
+        # Other fingers
+        tips = [8, 12, 16, 20]
+        pips = [6, 10, 14, 18]
+
+        for tip_idx, pip_idx in zip(tips, pips):
+            tip_y = hand_landmarks.landmark[tip_idx].y
+            pip_y = hand_landmarks.landmark[pip_idx].y
+
+            if tip_y < pip_y:
+                count += 1
+                lifted_fingers.append(tip_idx / 4 - 1)
+
+    return count, lifted_fingers
+
+
+def legacy_get_hand_view(hand_landmarks, corrected_label):
+    """
+    Determine if the palm or back of the hand is facing the camera
+    based on WRIST and THUMB_CMC x-positions.
+    """
+    wrist = hand_landmarks.landmark[0]
+    thumb_cmc = hand_landmarks.landmark[1]
+    x_diff = thumb_cmc.x - wrist.x
+
+    if corrected_label == "left":
+        return "back" if x_diff > 0 else "palm"
+    elif corrected_label == "right":
+        return "back" if x_diff < 0 else "palm"
+    return "palm"
+
+
+def legacy_preprocess_landmarks(landmarks, model_type='custom'):
+    """
+    Preprocess hand landmarks for model input.
+    """
+    features = []
+    for landmark in landmarks:
+        features.extend([landmark.x, landmark.y])
+    features = np.array(features)
+    features = features.reshape(1, -1)
+    return features
+
+
+def legacy_frame(hand_landmarks, handedness_label, enable_asl):
+    """Analyze one hand the way the baseline's websocket handler did."""
+    finger_count, lifted_fingers = legacy_count_fingers(hand_landmarks, handedness_label)
+    features = None
+    if enable_asl:
+        # ASLPredictor.predict and ASLPredictor.predict_proba each featurized the landmarks
+        features = legacy_preprocess_landmarks(hand_landmarks.landmark)
+        legacy_preprocess_landmarks(hand_landmarks.landmark)
+    hand_view = legacy_get_hand_view(hand_landmarks, handedness_label)
+    # The response computed the hand view once more
+    legacy_get_hand_view(hand_landmarks, handedness_label)
+    return finger_count, lifted_fingers, hand_view, features
+
+
+def array_frame(results, handedness_label, enable_asl, landmark_buffer):
+    """Analyze one hand the way `process_frame` does now."""
+    landmarks = hand_results(results, landmark_buffer).hands[0]
+    hand_view = get_hand_view(landmarks, handedness_label)
+    finger_count, lifted_fingers = count_fingers(landmarks, handedness_label, hand_view)
+    features = preprocess_landmarks(landmarks) if enable_asl else None
+    return finger_count, lifted_fingers, hand_view, features
+
+
+def best_of(run, hands, repeat):
+    """Return the best mean seconds per hand over `repeat` passes."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for hand in hands:
+            run(hand)
+        best = min(best, (time.perf_counter() - start) / len(hands))
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the per-frame hand analysis")
+    parser.add_argument("--hands", type=int, default=2000, help="Number of synthetic hands")
+    parser.add_argument("--repeat", type=int, default=5, help="Passes over the hands (best is reported)")
+    parser.add_argument("--handedness", default="right", choices=["left", "right"])
+    args = parser.parse_args()
+
+    hands = synthetic_hands(args.hands)
+    # MediaPipe results of a frame with one hand
+    frames = [SimpleNamespace(multi_hand_landmarks=[hand], multi_handedness=None) for hand in hands]
+    buffer = np.empty((21, 3), dtype=np.float32)
+
+    def landmark_buffer(index):
+        return buffer
+
+    # Both flows must agree before their speed is compared
+    for hand, results in zip(hands, frames):
+        old = legacy_frame(hand, args.handedness, True)
+        new = array_frame(results, args.handedness, True, landmark_buffer)
+        assert old[:3] == new[:3], "finger count, lifted fingers or hand view differ"
+        assert np.array_equal(old[3], new[3]), "ASL features differ"
+
+    print(f"{len(hands)} hands, best of {args.repeat} passes; results are identical")
+    print(f"{'':>10} {'baseline us':>12} {'array us':>10} {'saved us':>10} {'speedup':>8}")
+    for label, enable_asl in (("ASL on", True), ("ASL off", False)):
+        legacy_seconds = best_of(
+            lambda hand: legacy_frame(hand, args.handedness, enable_asl), hands, args.repeat
+        )
+        array_seconds = best_of(
+            lambda results: array_frame(results, args.handedness, enable_asl, landmark_buffer), frames, args.repeat
+        )
+        print(f"{label:>10} {legacy_seconds * 1e6:>12.1f} {array_seconds * 1e6:>10.1f} "
+              f"{(legacy_seconds - array_seconds) * 1e6:>10.1f} {legacy_seconds / array_seconds:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
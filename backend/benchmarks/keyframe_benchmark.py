@@ -0,0 +1,133 @@
+"""
+Accuracy vs throughput of keyframe tracking.
+
+Replays recorded frames through full MediaPipe detection on every frame
+(the reference) and through keyframe tracking at several intervals, then
+reports frames per second and how far the propagated landmarks drift from
+the reference.
+
+Usage:
+    python backend/benchmarks/keyframe_benchmark.py --source <video|dir> --intervals 1,2,4,8
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+import numpy as np
+from benchmarks.frames import load_frames
+from pipeline.hands import count_fingers, get_corrected_handedness, hand_results
+from pipeline.processor import create_hands_detector
+from pipeline.tracking import KeyframeTracker
+
+
+def run_pipeline(frames, keyframe_interval):
+    """
+    Run hand detection over the frames with the given keyframe interval.
+    
+    Returns:
+        tuple: (per-frame (landmarks array or None, finger count), elapsed seconds)
+    """
+    detector = create_hands_detector()
+    tracker = KeyframeTracker(keyframe_interval=keyframe_interval)
+    outputs = []
+
+    start = time.perf_counter()
+    for frame in frames:
+        results = None
+        gray = None
+        if keyframe_interval > 1:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+            if not tracker.keyframe_due():
+                results = tracker.track(gray)
+        if results is None:
+            results = hand_results(detector.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)))
+            if gray is not None:
+                tracker.update_keyframe(gray, results)
+
+        if results.hands:
+            landmarks = results.hands[0]
+            finger_count, _ = count_fingers(landmarks, get_corrected_handedness(results))
+            outputs.append((landmarks, finger_count))
+        else:
+            outputs.append((None, 0))
+    elapsed = time.perf_counter() - start
+
+    detector.close()
+    return outputs, elapsed, tracker
+
+
+def compare(reference, candidate, frame_width):
+    """Compare a run against the reference run."""
+    errors = []
+    presence_agreement = 0
+    count_agreement = 0
+    for (ref_landmarks, ref_count), (landmarks, count) in zip(reference, candidate):
+        presence_agreement += (ref_landmarks is None) == (landmarks is None)
+        count_agreement += ref_count == count
+        if ref_landmarks is not None and landmarks is not None:
+            distances = np.linalg.norm((landmarks[:, :2] - ref_landmarks[:, :2]) * frame_width, axis=1)
+            errors.append(distances.mean())
+
+    total = len(reference)
+    return {
+        "mean_landmark_error_px": float(np.mean(errors)) if errors else None,
+        "p95_landmark_error_px": float(np.percentile(errors, 95)) if errors else None,
+        "hand_presence_agreement": presence_agreement / total,
+        "finger_count_agreement": count_agreement / total
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark keyframe tracking accuracy and throughput")
+    parser.add_argument("--source", required=True, help="Video file or directory of recorded frames")
+    parser.add_argument("--intervals", default="1,2,3,5,8", help="Comma-separated keyframe intervals")
+    parser.add_argument("--max-frames", type=int, default=None, help="Maximum number of frames to replay")
+    parser.add_argument("--output", default=None, help="Optional path to write the JSON report")
+    args = parser.parse_args()
+
+    frames = load_frames(args.source, args.max_frames)
+    frame_width = frames[0].shape[1]
+    intervals = [int(value) for value in args.intervals.split(",")]
+    print(f"Loaded {len(frames)} frames ({frame_width}x{frames[0].shape[0]}) from {args.source}")
+
+    reference, reference_elapsed, _ = run_pipeline(frames, 1)
+    report = []
+    for interval in intervals:
+        if interval == 1:
+            outputs, elapsed, tracker = reference, reference_elapsed, None
+        else:
+            outputs, elapsed, tracker = run_pipeline(frames, interval)
+        entry = {
+            "keyframe_interval": interval,
+            "fps": len(frames) / elapsed,
+            "speedup": reference_elapsed / elapsed,
+            "tracking_failures": tracker.tracking_failures if tracker else 0,
+            **compare(reference, outputs, frame_width)
+        }
+        report.append(entry)
+
+    print(f"\n{'interval':>8} {'fps':>8} {'speedup':>8} {'err px':>8} {'p95 px':>8} {'presence':>9} {'fingers':>8} {'lost':>5}")
+    for entry in report:
+        error = entry["mean_landmark_error_px"]
+        p95 = entry["p95_landmark_error_px"]
+        print(
+            f"{entry['keyframe_interval']:>8} {entry['fps']:>8.1f} {entry['speedup']:>7.2f}x "
+            f"{error if error is not None else float('nan'):>8.2f} {p95 if p95 is not None else float('nan'):>8.2f} "
+            f"{entry['hand_presence_agreement']:>9.1%} {entry['finger_count_agreement']:>8.1%} "
+            f"{entry['tracking_failures']:>5}"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
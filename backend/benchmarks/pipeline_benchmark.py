@@ -0,0 +1,243 @@
+"""
+Offline replay benchmark of the frame pipeline.
+
+Replays recorded frames through `process_frame`, the same code path the
+`/ws` endpoint runs (decode, MediaPipe, finger counting, hand view, ASL
+prediction and encoding), without a browser or MQTT broker. Every
+configuration runs in a fresh process so that peak RSS is measured per
+configuration, and the report can be written as JSON to diff between
+commits.
+
+Usage:
+    python backend/benchmarks/pipeline_benchmark.py --source <video|dir> \\
+        --model-types online,custom --model-complexity 0,1 --widths 320,640 \\
+        --scene-gate on,off --motion-gate on,off
+"""
+import argparse
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+# Add the backend directory to the Python path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import cv2
+import numpy as np
+from benchmarks.frames import load_frames
+
+PERCENTILES = (50, 95, 99)
+GATE_SETTINGS = {"on": True, "off": False}
+
+
+def encode_frames(frames, jpeg_quality):
+    """Encode frames as JPEG, the way the browser sends them."""
+    params = [cv2.IMWRITE_JPEG_QUALITY, int(jpeg_quality * 100)]
+    return [cv2.imencode('.jpg', frame, params)[1].tobytes() for frame in frames]
+
+
+def summarize(samples):
+    """Return the p50/p95/p99 of a list of durations in seconds, in milliseconds."""
+    values = np.asarray(samples) * 1000
+    return {f"p{p}": round(float(np.percentile(values, p)), 3) for p in PERCENTILES}
+
+
+def peak_rss_mb():
+    """Return the peak resident set size of the current process in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_config(source, max_frames, warmup, config):
+    """
+    Replay the frames through the pipeline with one configuration.
+
+    Runs in its own process, so the imports below and the peak RSS only
+    account for this configuration.
+
+    Returns:
+        dict: Throughput, per-stage latency percentiles and peak RSS
+    """
+    from pipeline.processor import create_hands_detector, open_session, process_frame, release_session
+    from pipeline.session import FrameSession
+
+    session = FrameSession(0)
+    session.update(config["options"])
+    options = session.frame_options()
+    frames = encode_frames(load_frames(source, max_frames), session.jpeg_quality)
+    warmup = min(warmup, len(frames) - 1)
+
+    detector = create_hands_detector(config["model_complexity"])
+    open_session(session.session_id, detector)
+
+    stages = {}
+    totals = []
+    hands = 0
+    start = None
+    for index, image_bytes in enumerate(frames):
+        if index == warmup:
+            start = time.perf_counter()
+        frame_start = time.perf_counter()
+        result = process_frame(session.session_id, image_bytes, options)
+        if index < warmup:
+            continue
+        totals.append(time.perf_counter() - frame_start)
+        hands += result.data["hand_detected"]
+        for stage, seconds in result.durations.items():
+            stages.setdefault(stage, []).append(seconds)
+    elapsed = time.perf_counter() - start
+
+    release_session(session.session_id)
+    detector.close()
+
+    return {
+        "config": config,
+        "frames": len(totals),
+        "fps": round(len(totals) / elapsed, 2),
+        "hand_detection_rate": round(hands / len(totals), 4),
+        "total_ms": summarize(totals),
+        "stages_ms": {stage: summarize(samples) for stage, samples in stages.items()},
+        "peak_rss_mb": round(peak_rss_mb(), 1)
+    }
+
+
+def parse_gates(value):
+    """Parse a comma-separated list of gate settings ('on' or 'off')."""
+    try:
+        return [GATE_SETTINGS[setting] for setting in value.split(",")]
+    except KeyError as e:
+        raise argparse.ArgumentTypeError(f"invalid gate setting {e}, expected 'on' or 'off'")
+
+
+def build_configs(args):
+    """Return the cross product of the requested configurations."""
+    configs = []
+    for model_type, complexity, width, scene_gate, motion_gate in itertools.product(
+        args.model_types.split(","), args.model_complexity.split(","), args.widths.split(","),
+        args.scene_gate, args.motion_gate
+    ):
+        configs.append({
+            "model_type": model_type,
+            "model_complexity": int(complexity),
+            "processing_width": int(width) if width != "full" else None,
+            "scene_gate": scene_gate,
+            "motion_gate": motion_gate,
+            "options": {
+                "enable_asl": not args.no_asl,
+                "model_type": model_type,
+                "response_mode": args.response_mode,
+                "keyframe_interval": args.keyframe_interval,
+                "roi": not args.no_roi,
+                "processing_width": int(width) if width != "full" else None,
+                "scene_gate": scene_gate,
+                "motion_gate": motion_gate,
+                "timings": True
+            }
+        })
+    return configs
+
+
+def git_commit():
+    """Return the current git commit, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def gate_label(enabled):
+    """Return 'on' or 'off' for a gate setting."""
+    return "on" if enabled else "off"
+
+
+def print_report(results, baseline=None):
+    """Print a summary table, with the fps change against a baseline report if given."""
+    baseline_fps = {}
+    if baseline:
+        baseline_fps = {json.dumps(entry["config"], sort_keys=True): entry["fps"] for entry in baseline["results"]}
+
+    print(f"\n{'model':>8} {'cplx':>5} {'width':>6} {'scene':>6} {'motion':>6} {'fps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'RSS MiB':>8} {'vs base':>8}")
+    for entry in results:
+        config = entry["config"]
+        total = entry["total_ms"]
+        previous = baseline_fps.get(json.dumps(config, sort_keys=True))
+        change = f"{entry['fps'] / previous - 1:+.1%}" if previous else "-"
+        print(
+            f"{config['model_type']:>8} {config['model_complexity']:>5} {str(config['processing_width'] or 'full'):>6} "
+            f"{gate_label(config['scene_gate']):>6} {gate_label(config['motion_gate']):>6} {entry['fps']:>8.1f} {total['p50']:>8.2f} {total['p95']:>8.2f} {total['p99']:>8.2f} "
+            f"{entry['peak_rss_mb']:>8.1f} {change:>8}"
+        )
+
+    for entry in results:
+        config = entry["config"]
+        print(f"\nStages for {config['model_type']}, complexity {config['model_complexity']}, "
+              f"width {config['processing_width'] or 'full'}, scene gate {gate_label(config['scene_gate'])}, "
+              f"motion gate {gate_label(config['motion_gate'])} (ms):")
+        for stage, stats in entry["stages_ms"].items():
+            print(f"  {stage:<18} p50 {stats['p50']:>8.3f}  p95 {stats['p95']:>8.3f}  p99 {stats['p99']:>8.3f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded frames through the frame pipeline")
+    parser.add_argument("--source", required=True, help="Video file or directory of recorded frames")
+    parser.add_argument("--model-types", default="online", help="Comma-separated ASL model types")
+    parser.add_argument("--model-complexity", default="1", help="Comma-separated MediaPipe model complexities")
+    parser.add_argument("--widths", default="640", help="Comma-separated processing widths ('full' for no downscaling)")
+    parser.add_argument("--keyframe-interval", type=int, default=1, help="Run full detection every N frames")
+    parser.add_argument("--response-mode", default="image", choices=["image", "landmarks"], help="Response mode")
+    parser.add_argument("--no-asl", action="store_true", help="Disable ASL prediction")
+    parser.add_argument("--no-roi", action="store_true", help="Disable region-of-interest detection")
+    parser.add_argument("--scene-gate", type=parse_gates, default=[True],
+                        help="Comma-separated scene change gate settings ('on', 'off')")
+    parser.add_argument("--motion-gate", type=parse_gates, default=[True],
+                        help="Comma-separated landmark motion gate settings ('on', 'off')")
+    parser.add_argument("--max-frames", type=int, default=None, help="Maximum number of frames to replay")
+    parser.add_argument("--warmup", type=int, default=10, help="Frames excluded from the statistics")
+    parser.add_argument("--baseline", default=None, help="Previous JSON report to compare fps against")
+    parser.add_argument("--output", default=None, help="Optional path to write the JSON report")
+    args = parser.parse_args()
+
+    configs = build_configs(args)
+    print(f"Replaying {args.source} with {len(configs)} configuration(s)")
+
+    # A fresh spawned process per configuration keeps peak RSS comparable
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for config in configs:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results.append(executor.submit(run_config, args.source, args.max_frames, args.warmup, config).result())
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    print_report(results, baseline)
+
+    if args.output:
+        report = {
+            "commit": git_commit(),
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "source": args.source,
+            "warmup": args.warmup,
+            "results": results
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nReport saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+from collections import OrderedDict
+from itertools import islice
+from threading import Lock
+import numpy as np
+
+
+class PredictionCache:
+    """
+    LRU cache of class probabilities keyed on grid-snapped feature vectors.
+
+    While a user holds a letter, consecutive frames produce nearly identical
+    features. Snapping them to a grid of `step` makes those frames share a
+    key, so they skip the scaler and the model entirely.
+
+    With 42 coordinates, jitter often pushes one of them across a cell
+    boundary, so on an exact miss the most recently used entries are also
+    accepted if every coordinate is in the same or an adjacent cell.
+    """
+
+    def __init__(self, max_size=256, step=0.005, neighbors=4):
+        """
+        Args:
+            max_size: Maximum number of cached predictions
+            step: Grid size used to quantize the raw (unscaled) features
+            neighbors: Most recently used entries checked for adjacent cells on a miss
+        """
+        self.max_size = max_size
+        self.step = step
+        self.neighbors = neighbors
+        self.hits = 0
+        self.neighbor_hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (quantized features, probabilities), least recently used first
+        self._lock = Lock()
+
+    def key(self, model, features):
+        """
+        Build the cache key of a prediction.
+
+        Args:
+            model: LoadedModel the prediction is made with
+            features: Raw feature array of shape (1, n_features)
+
+        Returns:
+            tuple: (model type, model version, quantized features)
+        """
+        quantized = np.round(np.asarray(features).ravel() / self.step).astype(np.int32)
+        return model.model_type, model.version, quantized
+
+    def get(self, key):
+        """Return the cached probabilities for a key, or None."""
+        model_type, version, quantized = key
+        with self._lock:
+            entry = self._entries.get((model_type, version, quantized.tobytes()))
+            if entry is not None:
+                self._entries.move_to_end((model_type, version, quantized.tobytes()))
+                self.hits += 1
+                return entry[1]
+
+            for (entry_type, entry_version, entry_bytes), (entry_quantized, probabilities) in islice(
+                reversed(self._entries.items()), self.neighbors
+            ):
+                if (entry_type, entry_version) == (model_type, version) and \
+                        np.abs(entry_quantized - quantized).max() <= 1:
+                    self._entries.move_to_end((entry_type, entry_version, entry_bytes))
+                    self.hits += 1
+                    self.neighbor_hits += 1
+                    return probabilities
+
+            self.misses += 1
+            return None
+
+    def put(self, key, probabilities):
+        """Cache the probabilities of a key, evicting the least recently used entry if full."""
+        model_type, version, quantized = key
+        with self._lock:
+            self._entries[(model_type, version, quantized.tobytes())] = (quantized, probabilities)
+            self._entries.move_to_end((model_type, version, quantized.tobytes()))
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def stats(self):
+        """
+        Return cache metrics.
+
+        Returns:
+            dict: Size, hits (exact and adjacent-cell), misses and hit rate
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "step": self.step,
+                "hits": self.hits,
+                "neighbor_hits": self.neighbor_hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else None
+            }
@@ -0,0 +1,186 @@
+import numpy as np
+import sklearn
+from sklearn.ensemble import RandomForestClassifier, ExtraTreesClassifier
+from sklearn.utils.fixes import parse_version
+
+# sklearn marks leaves with -1 as the child index
+_TREE_LEAF = -1
+
+# Before 1.4, trees stored class counts and predict_proba normalized them
+_NORMALIZE_LEAVES = parse_version(sklearn.__version__) < parse_version("1.4")
+
+
+class CompiledForest:
+    """
+    Flat-array evaluator for a fitted sklearn forest classifier.
+
+    All trees are concatenated into contiguous node arrays, and every tree is
+    walked for every sample at once, one depth level per step. Leaves point
+    back to themselves, so the walk needs no per-node branching.
+
+    Probabilities are bit-identical to sklearn's sequential `predict_proba`:
+    features are compared in float32 like sklearn's tree traversal, leaf
+    distributions are taken as sklearn's trees report them, and the trees are
+    summed in estimator order before dividing by the number of trees.
+    """
+
+    def __init__(self, forest):
+        """
+        Compile a fitted forest.
+
+        Args:
+            forest: Fitted single-output RandomForestClassifier or ExtraTreesClassifier
+        """
+        self.classes_ = forest.classes_
+        self.n_classes_ = forest.n_classes_
+        self.n_features_in_ = forest.n_features_in_
+        self.n_estimators = len(forest.estimators_)
+
+        features, thresholds, left, right, leaf_rows, values, roots = [], [], [], [], [], [], []
+        offset = 0
+        leaf_offset = 0
+        max_depth = 0
+        for estimator in forest.estimators_:
+            tree = estimator.tree_
+            node_ids = np.arange(tree.node_count)
+            is_leaf = tree.children_left == _TREE_LEAF
+
+            # Leaves loop back to themselves and always take the left branch
+            features.append(np.where(is_leaf, 0, tree.feature).astype(np.intp))
+            thresholds.append(np.where(is_leaf, np.inf, tree.threshold))
+            left.append(np.where(is_leaf, node_ids, tree.children_left) + offset)
+            right.append(np.where(is_leaf, node_ids, tree.children_right) + offset)
+
+            # Same leaf distributions as DecisionTreeClassifier.predict_proba
+            proba = tree.value[is_leaf, 0, :self.n_classes_].copy()
+            if _NORMALIZE_LEAVES:
+                normalizer = proba.sum(axis=1)[:, np.newaxis]
+                normalizer[normalizer == 0.0] = 1.0
+                proba /= normalizer
+            values.append(proba)
+
+            rows = np.zeros(tree.node_count, dtype=np.intp)
+            rows[is_leaf] = np.arange(is_leaf.sum()) + leaf_offset
+            leaf_rows.append(rows)
+
+            roots.append(offset)
+            offset += tree.node_count
+            leaf_offset += proba.shape[0]
+            max_depth = max(max_depth, tree.max_depth)
+
+        self.feature = np.concatenate(features)
+        self.threshold = np.concatenate(thresholds)
+        self.left = np.concatenate(left).astype(np.intp)
+        self.right = np.concatenate(right).astype(np.intp)
+        self.leaf_row = np.concatenate(leaf_rows)
+        self.leaf_value = np.ascontiguousarray(np.concatenate(values))
+        self.roots = np.array(roots, dtype=np.intp)
+        self.max_depth = max_depth
+
+    @property
+    def nbytes(self):
+        """Memory used by the node arrays, in bytes."""
+        return sum(array.nbytes for array in (
+            self.feature, self.threshold, self.left, self.right,
+            self.leaf_row, self.leaf_value, self.roots
+        ))
+
+    def apply(self, X, roots=None):
+        """
+        Return the leaf reached by each sample in each tree.
+
+        Args:
+            X: Feature array of shape (n_samples, n_features)
+            roots: Optional root nodes of the trees to walk (all trees by default)
+
+        Returns:
+            np.ndarray: Global node indices of shape (n_trees, n_samples)
+        """
+        X = np.asarray(X, dtype=np.float32)
+        roots = self.roots if roots is None else roots
+        samples = np.arange(X.shape[0])
+        nodes = np.repeat(roots[:, np.newaxis], X.shape[0], axis=1)
+        for _ in range(self.max_depth):
+            go_left = X[samples, self.feature[nodes]] <= self.threshold[nodes]
+            nodes = np.where(go_left, self.left[nodes], self.right[nodes])
+        return nodes
+
+    def _leaf_values(self, X, roots=None):
+        """Return the leaf distributions of shape (n_trees, n_samples, n_classes)."""
+        return self.leaf_value[self.leaf_row[self.apply(X, roots)]]
+
+    def predict_proba(self, X):
+        """
+        Predict class probabilities.
+
+        Args:
+            X: Feature array of shape (n_samples, n_features)
+
+        Returns:
+            np.ndarray: Probabilities of shape (n_samples, n_classes)
+        """
+        # Reducing over the outer axis adds the trees one after another, in
+        # estimator order, exactly like sklearn's accumulation
+        proba = np.add.reduce(self._leaf_values(X), axis=0)
+        proba /= self.n_estimators
+        return proba
+
+    def cascade_proba(self, X, first_trees, threshold):
+        """
+        Predict class probabilities, evaluating all trees only for uncertain samples.
+
+        The first `first_trees` trees act as a cheap first stage. Samples whose
+        top first-stage probability reaches `threshold` keep that answer; the
+        others continue through the remaining trees, reusing the first-stage
+        sum, so their probabilities are identical to `predict_proba`.
+
+        Args:
+            X: Feature array of shape (n_samples, n_features)
+            first_trees: Number of trees in the first stage
+            threshold: Minimum top probability for a first-stage answer
+
+        Returns:
+            tuple: (probabilities of shape (n_samples, n_classes),
+                boolean array of the samples that escalated to the full forest)
+        """
+        X = np.asarray(X, dtype=np.float32)
+        first_trees = min(first_trees, self.n_estimators)
+        partial = np.add.reduce(self._leaf_values(X, self.roots[:first_trees]), axis=0)
+        proba = partial / first_trees
+        escalated = proba.max(axis=1) < threshold
+
+        if escalated.any() and first_trees < self.n_estimators:
+            rest = self._leaf_values(X[escalated], self.roots[first_trees:])
+            # Continue the sequential sum from the first-stage total
+            total = np.add.reduce(np.concatenate([partial[escalated][np.newaxis], rest]), axis=0)
+            proba[escalated] = total / self.n_estimators
+        return proba, escalated
+
+    def predict(self, X):
+        """
+        Predict class labels.
+
+        Args:
+            X: Feature array of shape (n_samples, n_features)
+
+        Returns:
+            np.ndarray: Predicted classes
+        """
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+
+def compile_forest(model):
+    """
+    Compile a forest classifier into a `CompiledForest`, if possible.
+
+    Args:
+        model: Loaded model
+
+    Returns:
+        CompiledForest, or the model unchanged if it is not a single-output forest
+    """
+    if not isinstance(model, (RandomForestClassifier, ExtraTreesClassifier)):
+        return model
+    if getattr(model, "n_outputs_", 1) != 1:
+        return model
+    return CompiledForest(model)
@@ -1,22 +1,67 @@
+import importlib.util
+import os
 import joblib
-from backend_config import ASL_MODEL_TYPE, ASL_MODELS
+from backend_config import (
+    ASL_MODEL_TYPE, ASL_MODELS, ASL_INFERENCE_BACKEND, ASL_ONNX_INTRA_OP_THREADS
+)
 
-def load_model(model_type=None):
+def onnx_path_for(model_path):
+    """Return the path of the ONNX artifact exported next to a joblib model."""
+    return os.path.splitext(model_path)[0] + ".onnx"
+
+def artifact_path(model_path, backend=None):
     """
-    Load the ASL model based on configuration or provided model type.
+    Return the artifact to load for a model with the given inference backend.
     
     Args:
-        model_type: Optional model type to load. If None, uses the configured type.
+        model_path: Path of the joblib model (as configured in ASL_MODELS)
+        backend: "sklearn" or "onnx". If None, uses the configured backend.
     
     Returns:
-        The loaded model and scaler (if available)
+        str: The ONNX file when the ONNX backend is selected, onnxruntime is
+            installed and the model was exported, otherwise the joblib file
     """
-    if model_type is None:
-        model_type = ASL_MODEL_TYPE
-    model_path = ASL_MODELS[model_type]
-    saved_data = joblib.load(model_path)
+    if (backend or ASL_INFERENCE_BACKEND) == "onnx":
+        onnx_path = onnx_path_for(model_path)
+        if os.path.exists(onnx_path) and importlib.util.find_spec("onnxruntime") is not None:
+            return onnx_path
+    return model_path
+
+def load_artifact(path, mmap_mode=None):
+    """
+    Load a model artifact.
+    
+    Args:
+        path: Path of a joblib or ONNX model
+        mmap_mode: Optional joblib memory-mapping mode (e.g. 'r'). Only arrays of
+            uncompressed joblib artifacts can be memory-mapped.
+    
+    Returns:
+        The loaded model and scaler (if available). ONNX models include their scaler.
+    """
+    if path.endswith(".onnx"):
+        from .onnx_model import OnnxModel
+        return OnnxModel(path, intra_op_threads=ASL_ONNX_INTRA_OP_THREADS), None
+    
+    saved_data = joblib.load(path, mmap_mode=mmap_mode)
     
     # For custom model, we saved a dictionary with model and scaler
     if isinstance(saved_data, dict):
         return saved_data['model'], saved_data.get('scaler')
     return saved_data, None
+
+def load_model(model_type=None, mmap_mode=None, backend=None):
+    """
+    Load the ASL model based on configuration or provided model type.
+    
+    Args:
+        model_type: Optional model type to load. If None, uses the configured type.
+        mmap_mode: Optional joblib memory-mapping mode (e.g. 'r')
+        backend: Optional inference backend ("sklearn" or "onnx")
+    
+    Returns:
+        The loaded model and scaler (if available)
+    """
+    if model_type is None:
+        model_type = ASL_MODEL_TYPE
+    return load_artifact(artifact_path(ASL_MODELS[model_type], backend), mmap_mode)
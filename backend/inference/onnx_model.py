@@ -0,0 +1,57 @@
+import json
+import os
+import numpy as np
+
+# Must match training/onnx_export.py (checked by tests/test_onnx_export.py)
+CLASSES_METADATA_KEY = "classes"
+
+
+class OnnxModel:
+    """
+    ASL classifier exported to ONNX, run with onnxruntime on the CPU.
+
+    The exported graph includes the scaler, so it takes the raw landmark
+    features and exposes the same `classes_` / `predict_proba` interface as
+    the sklearn models.
+    """
+
+    def __init__(self, path, intra_op_threads=1):
+        """
+        Load an ONNX model. Requires the optional onnxruntime dependency.
+
+        Args:
+            path: Path of the .onnx file
+            intra_op_threads: Threads onnxruntime may use within one prediction
+        """
+        import onnxruntime
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = 1
+        self.session = onnxruntime.InferenceSession(
+            path, options, providers=["CPUExecutionProvider"]
+        )
+        self.input_name = self.session.get_inputs()[0].name
+        self.n_features_in_ = self.session.get_inputs()[0].shape[1]
+        # Classifier graphs output the label first and the probabilities second
+        self.probability_name = self.session.get_outputs()[1].name
+        metadata = self.session.get_modelmeta().custom_metadata_map
+        self.classes_ = np.array(json.loads(metadata[CLASSES_METADATA_KEY]))
+        self.nbytes = os.path.getsize(path)
+
+    def predict_proba(self, X):
+        """
+        Predict class probabilities.
+
+        Args:
+            X: Raw (unscaled) feature array of shape (n_samples, n_features)
+
+        Returns:
+            np.ndarray: Probabilities of shape (n_samples, n_classes)
+        """
+        features = np.asarray(X, dtype=np.float32)
+        return self.session.run([self.probability_name], {self.input_name: features})[0]
+
+    def predict(self, X):
+        """Predict class labels."""
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
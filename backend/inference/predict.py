@@ -1,97 +1,171 @@
 import numpy as np
-from .model_loader import load_model
-from .utils import preprocess_landmarks
-from backend_config import ASL_MODEL_TYPE
+from .cache import PredictionCache
+from .registry import ModelRegistry
+from .utils import preprocess_landmarks, top_k_probabilities
+from backend_config import (
+    ASL_MODEL_TYPE, ASL_MODELS, ASL_COMPILED_FOREST, ASL_MODEL_CACHE_MAX_MODELS,
+    ASL_MODEL_CACHE_MAX_BYTES, ASL_MODEL_MMAP_MODE, ASL_INFERENCE_BACKEND,
+    ASL_CASCADE_TREES, ASL_CASCADE_THRESHOLD, ASL_PREDICTION_CACHE_SIZE,
+    ASL_PREDICTION_CACHE_STEP
+)
 
 class ASLPredictor:
     def __init__(self):
-        """Initialize the ASL predictor with both models."""
-        # print(f"Initializing ASLPredictor with model type: {ASL_MODEL_TYPE}")
-        # Load both models
-        self.models = {}
-        self.scalers = {}
-        
-        # Load custom model and scaler
-        custom_model, custom_scaler = load_model('custom')
-        self.models['custom'] = custom_model
-        self.scalers['custom'] = custom_scaler
-        
-        # Load online model and scaler
-        online_model, online_scaler = load_model('online')
-        self.models['online'] = online_model
-        self.scalers['online'] = online_scaler
-        
+        """Initialize the ASL predictor. Models are loaded on first use."""
+        self.registry = ModelRegistry(
+            ASL_MODELS,
+            max_models=ASL_MODEL_CACHE_MAX_MODELS,
+            max_bytes=ASL_MODEL_CACHE_MAX_BYTES,
+            mmap_mode=ASL_MODEL_MMAP_MODE,
+            compile=ASL_COMPILED_FOREST,
+            backend=ASL_INFERENCE_BACKEND
+        )
         self.model_type = ASL_MODEL_TYPE
-        self.model = self.models[self.model_type]
-        self.scaler = self.scalers.get(self.model_type)
         
-        print(f"Loaded models. Current model type: {self.model_type}")
-        # print(f"Model classes: {self.model.classes_}")
+        # Two-stage cascade: the first trees answer confident frames on their own
+        self.cascade_trees = ASL_CASCADE_TREES
+        self.cascade_threshold = ASL_CASCADE_THRESHOLD
+        self.classifications = 0
+        self.escalations = 0
+        
+        # Predictions of recently seen (quantized) poses
+        self.cache = None
+        if ASL_PREDICTION_CACHE_SIZE:
+            self.cache = PredictionCache(ASL_PREDICTION_CACHE_SIZE, ASL_PREDICTION_CACHE_STEP)
     
     def update_model_type(self, model_type):
         """
-        Update the model type and switch to the corresponding model.
+        Update the default model type.
         
         Args:
-            model_type: The new model type ('custom' or 'online')
+            model_type: The new model type (a key of ASL_MODELS)
         """
         print(f"Updating model type from {self.model_type} to {model_type}")
         self.model_type = model_type
-        self.model = self.models[model_type]
-        self.scaler = self.scalers.get(model_type)
-        # print(f"New model classes: {self.model.classes_}")
     
-    def predict(self, landmarks):
+    def get_model(self, model_type=None):
         """
-        Predict the ASL letter from hand landmarks.
+        Return the loaded model to predict with.
+        
+        Pass the result to `featurize` and `classify` to pin one model version
+        across both calls, even if a reload swaps the model in between.
         
         Args:
-            landmarks: List of hand landmarks (21 points with x, y, z coordinates)
+            model_type: Optional model type to use instead of the current one
             
         Returns:
-            str: Predicted ASL letter
+            LoadedModel: The model, its scaler, labels and version
         """
-        # Preprocess landmarks
-        features = preprocess_landmarks(landmarks, self.model_type)
-        
-        # Apply scaler if available
-        if self.scaler is not None:
-            features = self.scaler.transform(features)
-        
-        # Make prediction
-        prediction = self.model.predict(features)[0]
+        return self.registry.get(model_type or self.model_type)
+    
+    def featurize(self, landmarks, model_type=None, model=None):
+        """
+        Convert hand landmarks into the raw (unscaled) feature vector of a model.
         
-        # For online model, convert numeric prediction to letter using ASCII
-        # For custom model, use prediction directly
-        if self.model_type == 'online':
-            return chr(prediction + ord('A'))
-        return prediction
+        Args:
+            landmarks: Landmarks array of shape (21, 3)
+            model_type: Optional model type to use instead of the current one
+            model: Optional result of `get_model`, overriding `model_type`
+            
+        Returns:
+            np.ndarray: Feature array of shape (1, 42)
+        """
+        entry = model or self.get_model(model_type)
+        return preprocess_landmarks(landmarks, entry.model_type)
     
-    def predict_proba(self, landmarks):
+    def classify(self, landmarks, model_type=None, top_k=None, features=None, model=None):
         """
-        Get probability distribution over all possible ASL letters.
+        Predict the ASL letter and its probability distribution in a single pass.
+        
+        The features are scaled and the model is run once; the letter is
+        the most likely entry of the resulting distribution. Poses found in
+        the prediction cache skip the scaler and the model entirely.
         
         Args:
-            landmarks: List of hand landmarks (21 points with x, y, z coordinates)
+            landmarks: Landmarks array of shape (21, 3)
+            model_type: Optional model type to use instead of the current one
+            top_k: Optional number of most likely letters to keep in the distribution
+            features: Optional output of `featurize`, to skip featurization
+            model: Optional result of `get_model`, overriding `model_type`
             
         Returns:
-            dict: Dictionary mapping ASL letters to their probabilities
+            tuple: (predicted letter, dictionary mapping letters to probabilities)
         """
-        # Preprocess landmarks
-        features = preprocess_landmarks(landmarks, self.model_type)
+        entry = model or self.get_model(model_type)
+        if features is None:
+            features = self.featurize(landmarks, model=entry)
+        labels = entry.labels
+        
+        probabilities = None
+        if self.cache is not None:
+            cache_key = self.cache.key(entry, features)
+            probabilities = self.cache.get(cache_key)
         
+        if probabilities is None:
+            probabilities = self._predict_proba(entry, features)
+            if self.cache is not None:
+                self.cache.put(cache_key, probabilities)
+        
+        letter = labels[int(np.argmax(probabilities))]
+        distribution = {label: float(p) for label, p in zip(labels, probabilities)}
+        if top_k:
+            distribution = top_k_probabilities(distribution, top_k)
+        return letter, distribution
+    
+    def _predict_proba(self, entry, features):
+        """Scale the features and run the model (through the cascade if enabled)."""
         # Apply scaler if available
-        if self.scaler is not None:
-            features = self.scaler.transform(features)
+        if entry.scaler is not None:
+            features = entry.scaler.transform(features)
         
-        # Get probability distribution
-        probabilities = self.model.predict_proba(features)[0]
+        if self.cascade_trees and hasattr(entry.model, "cascade_proba"):
+            probabilities, escalated = entry.model.cascade_proba(
+                features, self.cascade_trees, self.cascade_threshold
+            )
+            self.classifications += 1
+            self.escalations += int(escalated[0])
+            return probabilities[0]
+        return entry.model.predict_proba(features)[0]
+    
+    def cascade_stats(self):
+        """
+        Return how often the cascade had to escalate to the full model.
         
-        # For online model, map indices to letters using ASCII
-        # For custom model, use classes directly
-        if self.model_type == 'online':
-            result = {chr(ord('A') + i): float(p) for i, p in enumerate(probabilities)}
-        else:
-            result = {str(k): float(v) for k, v in zip(self.model.classes_, probabilities)}
+        Returns:
+            dict: Cascade settings, classification count and escalation rate
+        """
+        return {
+            "first_trees": self.cascade_trees,
+            "threshold": self.cascade_threshold,
+            "classifications": self.classifications,
+            "escalations": self.escalations,
+            "escalation_rate": self.escalations / self.classifications if self.classifications else None
+        }
+    
+    def predict(self, landmarks, model_type=None, features=None):
+        """
+        Predict the ASL letter from hand landmarks.
+        
+        Args:
+            landmarks: Landmarks array of shape (21, 3)
+            model_type: Optional model type to use instead of the current one
+            features: Optional output of `featurize`, to skip featurization
             
-        return result
+        Returns:
+            str: Predicted ASL letter
+        """
+        return self.classify(landmarks, model_type, features=features)[0]
+    
+    def predict_proba(self, landmarks, model_type=None, features=None):
+        """
+        Get probability distribution over all possible ASL letters.
+        
+        Args:
+            landmarks: Landmarks array of shape (21, 3)
+            model_type: Optional model type to use instead of the current one
+            features: Optional output of `featurize`, to skip featurization
+            
+        Returns:
+            dict: Dictionary mapping ASL letters to their probabilities
+        """
+        return self.classify(landmarks, model_type, features=features)[1]
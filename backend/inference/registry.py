@@ -0,0 +1,346 @@
+import hashlib
+import os
+import time
+from collections import OrderedDict
+from threading import Event, Lock, Thread
+import numpy as np
+from sklearn.tree._tree import NODE_DTYPE
+from .forest import compile_forest
+from .model_loader import artifact_path, load_artifact
+
+
+# Number of dummy predictions run on a reloaded model before it is swapped in
+WARMUP_PREDICTIONS = 3
+
+
+class ModelUnavailable(RuntimeError):
+    """Raised when a model is not configured or its artifact cannot be loaded."""
+
+
+class LoadedModel:
+    """A resident model with its scaler, class labels and load statistics."""
+
+    def __init__(self, model_type, model, scaler, labels, load_seconds, nbytes, version, signature):
+        self.model_type = model_type
+        self.model = model
+        self.scaler = scaler
+        self.labels = labels
+        self.load_seconds = load_seconds
+        self.nbytes = nbytes
+        self.version = version  # Content hash of the artifact
+        self.signature = signature  # (mtime, size) of the artifact when it was loaded
+        self.engine = type(model).__name__
+        self.loaded_at = time.time()
+        self.last_used = time.monotonic()
+
+
+def artifact_signature(path):
+    """Return the (mtime, size) of a model artifact, used to detect changes cheaply."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def artifact_version(path):
+    """Return a short content hash identifying a model artifact."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:12]
+
+
+def class_labels(model_type, model):
+    """
+    Return the letter of each class, in the order of the model's probability columns.
+
+    Models trained on the online dataset (including students distilled from
+    it) predict letter indices (0 for 'A'), while the custom model predicts
+    the letters themselves.
+    """
+    if np.issubdtype(np.asarray(model.classes_).dtype, np.integer):
+        return [chr(int(c) + ord('A')) for c in model.classes_]
+    return [str(c) for c in model.classes_]
+
+
+def model_nbytes(model):
+    """
+    Estimate the memory held by a model's arrays, in bytes.
+
+    Args:
+        model: Loaded model (compiled forest, sklearn forest or other estimator)
+
+    Returns:
+        int: Approximate resident size
+    """
+    if hasattr(model, "nbytes"):
+        return int(model.nbytes)
+    if hasattr(model, "estimators_"):
+        return sum(model_nbytes(estimator) for estimator in model.estimators_)
+    if hasattr(model, "tree_"):
+        tree = model.tree_
+        return int(tree.value.nbytes + tree.node_count * NODE_DTYPE.itemsize)
+    return sum(value.nbytes for value in vars(model).values() if isinstance(value, np.ndarray))
+
+
+def warm_up(entry):
+    """Run a few dummy predictions so the first real frame does not pay first-call costs."""
+    features = np.zeros((1, entry.model.n_features_in_))
+    for _ in range(WARMUP_PREDICTIONS):
+        sample = entry.scaler.transform(features) if entry.scaler is not None else features
+        entry.model.predict_proba(sample)
+
+
+class ModelRegistry:
+    """
+    Loads ASL models on first use and keeps the most recently used ones resident.
+
+    Models are evicted in least-recently-used order once more than
+    `max_models` are loaded or their combined size exceeds `max_bytes`.
+    The model that was just requested is never evicted.
+
+    Resident models can be reloaded while serving: the new artifact is
+    loaded and warmed up in a background thread, then swapped in under the
+    lock. Callers keep the `LoadedModel` they resolved, so in-flight
+    predictions finish on the version they started with.
+    """
+
+    def __init__(self, paths, max_models=None, max_bytes=None, mmap_mode=None, compile=True,
+                 backend="sklearn"):
+        """
+        Initialize an empty registry.
+
+        Args:
+            paths: Dictionary mapping model types to joblib artifact paths
+            max_models: Maximum number of resident models, None for no limit
+            max_bytes: Maximum combined size of resident models, None for no limit
+            mmap_mode: Optional joblib memory-mapping mode (e.g. 'r') for model arrays
+            compile: Whether to compile forests into the flat-array engine
+            backend: "sklearn" (joblib artifacts) or "onnx" (ONNX exports, when present)
+        """
+        self.paths = paths
+        self.max_models = max_models
+        self.max_bytes = max_bytes
+        self.mmap_mode = mmap_mode
+        self.compile = compile
+        self.backend = backend
+        self.loads = 0
+        self.evictions = 0
+        self.reloads = 0
+        self._models = OrderedDict()  # model_type -> LoadedModel, least recently used first
+        self._failures = {}  # model_type -> (artifact signature, error message) of the last failed load
+        self._loading = {}  # model_type -> Event set once its first load finishes
+        self._reloading = set()  # Model types being reloaded in the background
+        self._lock = Lock()
+
+    def get(self, model_type):
+        """
+        Return a resident model, loading it if needed.
+
+        The artifact is loaded outside the lock, so callers of other models
+        are never blocked by it; concurrent callers of the same model wait
+        for that single load. An artifact that failed to load is not read
+        again until it changes on disk.
+
+        Args:
+            model_type: Key of the model in `paths`
+
+        Returns:
+            LoadedModel: The model and its metadata
+
+        Raises:
+            ModelUnavailable: If the model type is unknown or fails to load
+        """
+        while True:
+            with self._lock:
+                entry = self._models.get(model_type)
+                if entry is not None:
+                    self._models.move_to_end(model_type)
+                    entry.last_used = time.monotonic()
+                    return entry
+
+                if model_type not in self.paths:
+                    raise ModelUnavailable(f"Unknown ASL model type: {model_type}")
+
+                loading = self._loading.get(model_type)
+                if loading is None:
+                    loading = self._loading[model_type] = Event()
+                    break
+
+            # Another caller is loading this model; use its outcome
+            loading.wait()
+            with self._lock:
+                failure = None if model_type in self._models else self._failures.get(model_type)
+            if failure is not None:
+                raise ModelUnavailable(failure[1])
+
+        try:
+            self._raise_known_failure(model_type)
+            entry = self._load(model_type)
+            with self._lock:
+                self._models[model_type] = entry
+                self._evict()
+            return entry
+        finally:
+            with self._lock:
+                self._loading.pop(model_type, None)
+            loading.set()
+
+    def _current_signature(self, model_type):
+        """Return the signature of a model's artifact, or None if it cannot be read."""
+        try:
+            return artifact_signature(artifact_path(self.paths[model_type], self.backend))
+        except OSError:
+            return None
+
+    def _raise_known_failure(self, model_type):
+        """Raise the previous error if the artifact is unchanged since it failed to load."""
+        with self._lock:
+            failure = self._failures.get(model_type)
+        if failure is not None and failure[0] == self._current_signature(model_type):
+            raise ModelUnavailable(failure[1])
+
+    def _load(self, model_type):
+        """Load a model artifact and build its entry. Must be called without the lock."""
+        start = time.perf_counter()
+        path = artifact_path(self.paths[model_type], self.backend)
+        if self.backend == "onnx" and not path.endswith(".onnx"):
+            print(f"ONNX export or onnxruntime not available for ASL model '{model_type}'; using sklearn")
+        signature = None
+        try:
+            signature = artifact_signature(path)
+            version = artifact_version(path)
+            model, scaler = load_artifact(path, mmap_mode=self.mmap_mode)
+        except Exception as e:  # Missing, truncated or half-written artifacts
+            message = f"Could not load ASL model '{model_type}': {e}"
+            with self._lock:
+                known = self._failures.get(model_type) == (signature, message)
+                self._failures[model_type] = (signature, message)
+            if not known:
+                # Only report a failing artifact once, not on every frame
+                print(message)
+            raise ModelUnavailable(message) from e
+
+        if self.compile:
+            model = compile_forest(model)
+        load_seconds = time.perf_counter() - start
+
+        entry = LoadedModel(
+            model_type, model, scaler, class_labels(model_type, model),
+            load_seconds, model_nbytes(model), version, signature
+        )
+        with self._lock:
+            self._failures.pop(model_type, None)
+            self.loads += 1
+        print(f"Loaded ASL model '{model_type}' version {version} in {load_seconds * 1000:.0f} ms "
+              f"({entry.nbytes / 1e6:.1f} MB)")
+        return entry
+
+    def reload(self, model_type, background=True):
+        """
+        Load a fresh copy of a model's artifact and swap it in once warmed up.
+
+        Args:
+            model_type: Key of the model in `paths`
+            background: Load in a daemon thread instead of blocking the caller
+
+        Returns:
+            bool: True if a reload was started, False if one is already running
+        """
+        with self._lock:
+            if model_type not in self.paths:
+                raise ModelUnavailable(f"Unknown ASL model type: {model_type}")
+            if model_type in self._reloading:
+                return False
+            self._reloading.add(model_type)
+
+        if background:
+            Thread(target=self._reload, args=(model_type,), name=f"reload-{model_type}", daemon=True).start()
+        else:
+            self._reload(model_type)
+        return True
+
+    def _reload(self, model_type):
+        """Load, warm up and swap in a model. Runs outside the lock."""
+        try:
+            entry = self._load(model_type)
+            warm_up(entry)
+        except ModelUnavailable:
+            # Keep serving the previous version
+            with self._lock:
+                self._reloading.discard(model_type)
+            return
+
+        with self._lock:
+            previous = self._models.get(model_type)
+            self._models[model_type] = entry
+            self._models.move_to_end(model_type)
+            self.reloads += 1
+            self._evict()
+            # Only now may another refresh start a reload of this model
+            self._reloading.discard(model_type)
+        if previous is not None:
+            print(f"Swapped ASL model '{model_type}' from version {previous.version} to {entry.version}")
+
+    def refresh(self):
+        """
+        Reload the resident models whose artifacts changed on disk.
+
+        Returns:
+            list: Model types for which a background reload was started
+        """
+        with self._lock:
+            entries = list(self._models.values())
+            failures = dict(self._failures)
+
+        started = []
+        for entry in entries:
+            signature = self._current_signature(entry.model_type)
+            if signature is None:
+                continue  # Artifact is being replaced; try again on the next refresh
+            if signature == entry.signature:
+                continue
+            failure = failures.get(entry.model_type)
+            if failure is not None and failure[0] == signature:
+                continue  # This version already failed to load; wait until it changes again
+            if self.reload(entry.model_type):
+                started.append(entry.model_type)
+        return started
+
+    def _evict(self):
+        """Evict least recently used models until the limits are respected."""
+        while len(self._models) > 1 and (
+            (self.max_models is not None and len(self._models) > self.max_models)
+            or (self.max_bytes is not None and self.resident_bytes() > self.max_bytes)
+        ):
+            model_type, _ = self._models.popitem(last=False)
+            self.evictions += 1
+            print(f"Evicted ASL model '{model_type}'")
+
+    def resident_bytes(self):
+        """Return the combined size of the resident models, in bytes."""
+        return sum(entry.nbytes for entry in self._models.values())
+
+    def stats(self):
+        """
+        Return registry metrics.
+
+        Returns:
+            dict: Load and eviction counts, and load time and size per resident model
+        """
+        with self._lock:
+            return {
+                "loads": self.loads,
+                "evictions": self.evictions,
+                "reloads": self.reloads,
+                "resident_bytes": self.resident_bytes(),
+                "models": {
+                    model_type: {
+                        "version": entry.version,
+                        "engine": entry.engine,
+                        "loaded_at": entry.loaded_at,
+                        "load_ms": round(entry.load_seconds * 1000, 1),
+                        "bytes": entry.nbytes
+                    }
+                    for model_type, entry in self._models.items()
+                }
+            }
@@ -5,34 +5,25 @@ def preprocess_landmarks(landmarks, model_type='custom'):
     Preprocess hand landmarks for model input.
     
     Args:
-        landmarks: List of hand landmarks (21 points with x, y coordinates)
+        landmarks: Landmarks array of shape (21, 3)
         model_type: Type of model ('custom' or 'online')
         
     Returns:
-        np.ndarray: Flattened and normalized feature vector
+        np.ndarray: Feature array of shape (1, 42) holding the x, y coordinates
     """
-    # Extract features directly from landmarks
-    features = []
-    for landmark in landmarks:
-        # Use only x, y coordinates (42 features)
-        features.extend([landmark.x, landmark.y])
-    
-    # Convert to numpy array
-    features = np.array(features)
-    
-    # Reshape to match the format used during training
-    features = features.reshape(1, -1)
-    
-    return features
+    # Use only x, y coordinates (42 features), interleaved as during training
+    return landmarks[:, :2].astype(np.float64).reshape(1, -1)
 
-def extract_landmarks_from_mediapipe(hand_landmarks):
+def top_k_probabilities(probabilities, k):
     """
-    Extract landmarks from MediaPipe hand landmarks object.
+    Keep only the k most likely letters of a probability distribution.
     
     Args:
-        hand_landmarks: MediaPipe hand landmarks object
+        probabilities: Dictionary mapping ASL letters to their probabilities
+        k: Number of letters to keep
         
     Returns:
-        list: List of landmarks with x, y coordinates
+        dict: The k most likely letters, highest probability first
     """
-    return hand_landmarks.landmark
+    top = sorted(probabilities.items(), key=lambda item: item[1], reverse=True)[:k]
+    return dict(top)
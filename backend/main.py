@@ -1,22 +1,31 @@
 from fastapi import FastAPI, WebSocket
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-import base64
+import asyncio
+import itertools
+import json
 import os
-from datetime import datetime
-from io import BytesIO
-import cv2
-import numpy as np
-import mediapipe as mp
+import time
 from config import MQTT_CONFIG
 from backend_config import (
-    SAVE_IMAGES, SAVE_DIR, CORS_CONFIG, ENABLE_ASL_PREDICTION,
-    ASL_MODEL_TYPE
+    SAVE_IMAGES, SAVE_DIR, CORS_CONFIG, FRAME_EXECUTOR,
+    FRAME_EXECUTOR_WORKERS, FRAME_EXECUTOR_MAX_PENDING,
+    ASL_MODELS, ASL_MODEL_WATCH_INTERVAL, MQTT_PUBLISH_QUEUE_SIZE, MQTT_HAND_STATUS_HEARTBEAT
 )
-from inference.predict import ASLPredictor
-from inference.utils import extract_landmarks_from_mediapipe
-from inference.model_loader import load_model
 from mqtt.mqtt_client import MQTTClient
+from pipeline.executor import FrameExecutor
+from pipeline.detector_pool import DetectorPoolExhausted
+from pipeline.metrics import MetricsRegistry
+from pipeline.processor import (
+    process_frame, release_session, detector_pool_stats, asl_model_stats, capture_stats,
+    refresh_asl_models, reload_asl_model
+)
+from pipeline.protocol import (
+    PROTOCOL_BINARY, SUPPORTED_PROTOCOLS, BINARY_PROTOCOL_VERSION,
+    decode_data_url, encode_data_url, pack_frame, landmarks_to_list
+)
+from pipeline.session import FrameSession
 from collections import deque
 from threading import Lock
 
@@ -31,18 +40,14 @@ app.add_middleware(
     allow_headers=CORS_CONFIG["allow_headers"],
 )
 
-# Initialize MediaPipe
-mp_hands = mp.solutions.hands
-mp_drawing = mp.solutions.drawing_utils
-hands_detector = mp_hands.Hands(
-    static_image_mode=False,
-    max_num_hands=1,
-    min_detection_confidence=0.3,
-    model_complexity=1
+# Initialize the frame executor (MediaPipe and ASL models live in its workers)
+frame_executor = FrameExecutor(
+    kind=FRAME_EXECUTOR,
+    workers=FRAME_EXECUTOR_WORKERS,
+    max_pending=FRAME_EXECUTOR_MAX_PENDING
 )
-
-# Initialize ASL predictor
-asl_predictor = ASLPredictor()
+session_ids = itertools.count()
+metrics = MetricsRegistry()
 
 # Create directory for saved images if saving is enabled
 if SAVE_IMAGES:
@@ -53,7 +58,9 @@ mqtt_client = MQTTClient(
     host=MQTT_CONFIG["broker"],
     port=MQTT_CONFIG["port"],
     username=MQTT_CONFIG["username"],
-    password=MQTT_CONFIG["password"]
+    password=MQTT_CONFIG["password"],
+    queue_size=MQTT_PUBLISH_QUEUE_SIZE,
+    heartbeat_interval=MQTT_HAND_STATUS_HEARTBEAT
 )
 
 # Connect to MQTT broker
@@ -70,204 +77,287 @@ gesture_lock = Lock()  # Lock for thread safety
 HAND_TIMEOUT = 1.0  # seconds to wait before resetting when no hands are detected (reduced from 5.0)
 last_reset_time = 0  # Track when we last sent a reset
 RESET_COOLDOWN = 5.0  # Minimum seconds between resets
-sensors_reset = False  # Track if sensors are currently in reset state
+sensors_reset = True  # Track if sensors are currently in reset state; no hand has been seen at startup
+last_hand_time = 0  # When a hand was last detected, in any session
 
-@app.websocket("/ws")
-async def websocket_endpoint(websocket: WebSocket):
-    await websocket.accept()
+def should_publish(gesture_data):
+    """Decide whether a gesture event is worth publishing over MQTT.
+
+    The same letter with the same hand status is published again at most
+    once per DEBOUNCE_TIME, so a still hand (whose analysis the workers
+    reuse while motion gating) does not flood the broker with duplicates.
+
+    Args:
+        gesture_data: Tuple of the published fields (hand, orientation, fingers, letter)
+
+    Returns:
+        bool: True if the data changed or the debounce time elapsed
+    """
+    global last_gesture_data, last_update_time
+    now = time.time()
+    with gesture_lock:
+        if gesture_data == last_gesture_data and now - last_update_time < DEBOUNCE_TIME:
+            return False
+        last_gesture_data = gesture_data
+        last_update_time = now
+        gesture_history.append((now, gesture_data))
+        return True
+
+def hand_seen():
+    """Record that a hand is visible, re-arming the hand lost reset."""
+    global last_hand_time, sensors_reset
+    with gesture_lock:
+        last_hand_time = time.time()
+        sensors_reset = False
+
+def hand_lost():
+    """Decide whether to publish a sensor reset for a frame without hands.
+
+    A reset is due once no session has seen a hand for HAND_TIMEOUT, at most
+    once per disappearance and once per RESET_COOLDOWN.
+
+    Returns:
+        bool: True if the caller should publish the reset
+    """
+    global last_reset_time, sensors_reset
+    now = time.time()
+    with gesture_lock:
+        if sensors_reset or now - last_hand_time < HAND_TIMEOUT or now - last_reset_time < RESET_COOLDOWN:
+            return False
+        sensors_reset = True
+        last_reset_time = now
+        return True
+
+async def watch_models():
+    """Periodically reload ASL models whose artifacts changed in every worker."""
+    while True:
+        await asyncio.sleep(ASL_MODEL_WATCH_INTERVAL)
+        try:
+            await frame_executor.broadcast(refresh_asl_models)
+        except Exception as e:
+            print(f"Error checking ASL models for updates: {e}")
+
+@app.on_event("startup")
+async def start_model_watcher():
+    if ASL_MODEL_WATCH_INTERVAL:
+        app.state.model_watcher = asyncio.create_task(watch_models())
+
+@app.on_event("shutdown")
+def shutdown_frame_executor():
+    frame_executor.shutdown()
+
+async def collect_detector_pool_stats():
+    """Sum the hand detector pool statistics of all executor workers."""
+    pools = await frame_executor.broadcast(detector_pool_stats)
+    return {
+        key: sum(pool[key] for pool in pools)
+        for key in ("max_size", "leased", "idle", "created", "evicted")
+    }
+
+@app.get("/stats")
+async def stats():
+    """Report executor load, hand detector pool usage, ASL models, debug captures and MQTT publishing."""
+    return {
+        "executor": {
+            "kind": frame_executor.kind,
+            "workers": frame_executor.workers,
+            "pending": frame_executor.pending,
+            "max_pending": frame_executor.max_pending
+        },
+        "detector_pool": await collect_detector_pool_stats(),
+        "asl_models": await frame_executor.broadcast(asl_model_stats),
+        "captures": await frame_executor.broadcast(capture_stats) if SAVE_IMAGES else None,
+        "mqtt": mqtt_client.stats()
+    }
+
+@app.get("/metrics")
+async def prometheus_metrics():
+    """Expose stage latency histograms and frame counters for Prometheus."""
+    pool = await collect_detector_pool_stats()
+    mqtt = mqtt_client.stats()
+    gauges = {
+        "executor_pending": frame_executor.pending,
+        "detector_pool_leased": pool["leased"],
+        "detector_pool_idle": pool["idle"],
+        "mqtt_queue_depth": mqtt["queue_depth"],
+        "mqtt_publish_rate": mqtt["publish_rate"]
+    }
+    counters = {
+        "mqtt_published_total": mqtt["published"],
+        "mqtt_coalesced_total": mqtt["coalesced"],
+        "mqtt_unchanged_total": mqtt["unchanged"],
+        "mqtt_dropped_total": mqtt["dropped"],
+        "mqtt_dropped_disconnected_total": mqtt["dropped_disconnected"],
+        "mqtt_errors_total": mqtt["errors"]
+    }
+    return PlainTextResponse(metrics.render(gauges, counters), media_type="text/plain; version=0.0.4")
+
+@app.post("/models/{model_type}/reload")
+async def reload_model(model_type: str):
+    """Reload an ASL model artifact in every worker, swapping it in once warmed up."""
+    if model_type not in ASL_MODELS:
+        return JSONResponse({"error": f"Unknown ASL model type: {model_type}"}, status_code=404)
+    started = await frame_executor.broadcast(reload_asl_model, model_type)
+    return {"model_type": model_type, "reloading": any(started)}
+
+async def receive_messages(websocket: WebSocket, session: FrameSession):
+    """
+    Read messages from the client until it disconnects.
     
+    Control messages are applied immediately and frames go into the
+    session's latest-frame-wins queue, so a busy pipeline never makes
+    the client's messages pile up.
+    """
     try:
         while True:
-            # Receive the data as JSON
-            data = await websocket.receive_json()
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
             
-            # Handle ASL toggle command and model type changes
-            if "enable_asl" in data:
-                global ENABLE_ASL_PREDICTION
-                ENABLE_ASL_PREDICTION = data["enable_asl"]
-                continue
-            if "model_type" in data:
-                global ASL_MODEL_TYPE
-                ASL_MODEL_TYPE = data["model_type"]
-                asl_predictor.update_model_type(ASL_MODEL_TYPE)
-                continue
-                
-            if "image" not in data:
+            # Binary messages carry a raw JPEG frame
+            if message.get("bytes") is not None:
+                session.frames.put(message["bytes"])
                 continue
-                
-            # Process image data
-            image_data = data["image"].split(",")[1]
-            image_bytes = base64.b64decode(image_data)
             
-            # Convert to OpenCV format
-            nparr = np.frombuffer(image_bytes, np.uint8)
-            frame = cv2.imdecode(nparr, cv2.IMREAD_COLOR)
+            # A malformed control message is reported to the client instead of ending the session
+            try:
+                data = json.loads(message["text"])
+                if not isinstance(data, dict):
+                    raise TypeError("expected a JSON object")
+            
+                # Handle protocol negotiation
+                if "protocol" in data:
+                    if data["protocol"] in SUPPORTED_PROTOCOLS:
+                        session.protocol = data["protocol"]
+                    async with session.send_lock:
+                        await websocket.send_json({
+                            "protocol": session.protocol,
+                            "version": BINARY_PROTOCOL_VERSION,
+                            "capture": session.capture_settings()
+                        })
+                    continue
+            
+                # Handle ASL toggle, model type, response mode and resolution changes
+                session.update(data)
+                if "processing_width" in data or "jpeg_quality" in data:
+                    async with session.send_lock:
+                        await websocket.send_json({"capture": session.capture_settings()})
             
-            # Process the frame with MediaPipe
-            results = hands_detector.process(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+                # Legacy clients send frames as data URLs, decoded only if processed
+                if "image" in data:
+                    session.frames.put(data["image"])
+            except (ValueError, TypeError) as e:
+                async with session.send_lock:
+                    await websocket.send_json({"error": f"Invalid control message: {e}"})
+    finally:
+        session.frames.close()
+
+@app.websocket("/ws")
+async def websocket_endpoint(websocket: WebSocket):
+    await websocket.accept()
+    session = FrameSession(
+        next(session_ids),
+        on_drop=lambda: metrics.increment("frames_dropped_total")
+    )
+    session_id = session.session_id
+    receiver = asyncio.create_task(receive_messages(websocket, session))
+    
+    try:
+        while True:
+            item = await session.frames.get()
+            if item is None:
+                break
+            frame, queue_age = item
+            image_bytes = decode_data_url(frame) if isinstance(frame, str) else frame
             
-            hand_detected = False
-            finger_count = 0
-            lifted_fingers = []
-            handedness_label = None
-            asl_letter = None
-            asl_probabilities = None
+            # Analyze the frame in the executor so the event loop stays responsive
+            result = await frame_executor.run(
+                session_id, process_frame, session_id, image_bytes,
+                session.frame_options()
+            )
+            response_data, buffer, landmarks = result.data, result.image, result.landmarks
+            durations = result.durations
+            metrics.increment("frames_processed_total")
+            if response_data["scene_static"]:
+                metrics.increment("frames_scene_static_total")
             
-            if results.multi_hand_landmarks:
-                hand_detected = True
+            if response_data["hand_detected"]:
+                metrics.increment("hands_detected_total")
+                if response_data["motion_gated"]:
+                    metrics.increment("frames_motion_gated_total")
+                publish_start = time.perf_counter()
+                hand_seen()
                 
-                for hand_landmarks in results.multi_hand_landmarks:
-                    # Draw landmarks on the frame
-                    mp_drawing.draw_landmarks(
-                        frame,
-                        hand_landmarks,
-                        mp_hands.HAND_CONNECTIONS,
-                        mp_drawing.DrawingSpec(color=(0, 255, 0), thickness=2, circle_radius=4),
-                        mp_drawing.DrawingSpec(color=(0, 0, 255), thickness=2)
-                    )
-                    
-                    # Count fingers and get handedness
-                    handedness_label = get_corrected_handedness(results)
-                    finger_count, lifted_fingers = count_fingers(hand_landmarks, handedness_label)
-                    
-                    # Extract landmarks and predict ASL letter if enabled
-                    if ENABLE_ASL_PREDICTION:
-                        landmarks = extract_landmarks_from_mediapipe(hand_landmarks)
-                        asl_letter = asl_predictor.predict(landmarks)
-                        asl_probabilities = asl_predictor.predict_proba(landmarks)
-                    
-                    # Get hand view for MQTT
-                    hand_view = get_hand_view(hand_landmarks, handedness_label)
-                    
-                    # Publish hand status via MQTT
-                    mqtt_client.publish_hand_status(
-                        hand=handedness_label,
-                        orientation=hand_view,
-                        extended_fingers=lifted_fingers
+                # Publish hand status via MQTT (unchanged statuses are skipped until the heartbeat)
+                mqtt_client.publish_hand_status(
+                    hand=response_data["handedness"],
+                    orientation=response_data["hand_view"],
+                    extended_fingers=response_data["lifted_fingers"]
+                )
+                
+                # If ASL prediction is enabled and we have a prediction, publish via MQTT
+                asl_letter = response_data.get("asl_letter") if session.enable_asl else None
+                if asl_letter:
+                    gesture_data = (
+                        response_data["handedness"],
+                        response_data["hand_view"],
+                        tuple(response_data["lifted_fingers"]),
+                        asl_letter
                     )
-                    
-                    # If ASL prediction is enabled and we have a prediction, publish via MQTT
-                    if ENABLE_ASL_PREDICTION and asl_letter:
+                    if should_publish(gesture_data):
+                        asl_probabilities = response_data["asl_probabilities"]
                         mqtt_client.publish_gesture_event(
                             gesture=asl_letter,
                             confidence=asl_probabilities[asl_letter] if asl_probabilities else 0.0,
-                            hand=handedness_label,
-                            orientation=hand_view,
-                            extended_fingers=lifted_fingers
+                            hand=response_data["handedness"],
+                            orientation=response_data["hand_view"],
+                            extended_fingers=response_data["lifted_fingers"]
                         )
-                    
-                    # Save frame with landmarks if enabled
-                    if SAVE_IMAGES:
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-                        save_path = os.path.join(SAVE_DIR, f"hand_{timestamp}.jpg")
-                        cv2.imwrite(save_path, frame)
-            
-            # Convert frame back to base64 for sending
-            _, buffer = cv2.imencode('.jpg', frame)
-            img_base64 = base64.b64encode(buffer).decode('utf-8')
-            
-            # Prepare response data
-            response_data = {
-                "image_with_landmarks": f"data:image/jpeg;base64,{img_base64}",
-                "hand_detected": hand_detected,
-                "finger_count": finger_count,
-                "hand_view": get_hand_view(hand_landmarks, handedness_label) if hand_detected else None,
-                "handedness": handedness_label if hand_detected else None,
-                "lifted_fingers": lifted_fingers
-            }
+                    else:
+                        metrics.increment("mqtt_publishes_suppressed_total")
+                durations["mqtt_publish"] = time.perf_counter() - publish_start
+            elif hand_lost():
+                # Let subscribers reset their sensors once no hand is visible anymore
+                mqtt_client.publish_hand_reset()
+                metrics.increment("mqtt_hand_resets_total")
             
-            # Add ASL prediction data if enabled
-            if ENABLE_ASL_PREDICTION:
-                response_data.update({
-                    "asl_letter": asl_letter,
-                    "asl_probabilities": asl_probabilities
-                })
+            # Report backpressure so the client can adapt its frame rate
+            response_data.update({
+                "dropped_frames": session.frames.dropped,
+                "queue_age_ms": round(queue_age * 1000, 1)
+            })
             
             # Send response
-            await websocket.send_json(response_data)
+            send_start = time.perf_counter()
+            async with session.send_lock:
+                if session.protocol == PROTOCOL_BINARY:
+                    await websocket.send_bytes(pack_frame(response_data, buffer, landmarks))
+                else:
+                    if buffer is not None:
+                        response_data["image_with_landmarks"] = encode_data_url(buffer)
+                    else:
+                        response_data["landmarks"] = landmarks_to_list(landmarks)
+                    await websocket.send_json(response_data)
+            durations["socket_send"] = time.perf_counter() - send_start
+            metrics.observe_stages(durations)
             
+    except DetectorPoolExhausted as e:
+        print(f"Rejecting websocket session {session_id}: {e}")
+        await websocket.send_json({"error": str(e)})
     except Exception as e:
         print(f"Error in websocket connection: {e}")
     finally:
+        receiver.cancel()
+        try:
+            await receiver
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            print(f"Error receiving websocket messages: {e}")
+        await frame_executor.run(session_id, release_session, session_id)
         await websocket.close()
 
-
 # Mount static files AFTER registering the WebSocket route
 FRONTEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "../frontend/dist"))
 app.mount("/", StaticFiles(directory=FRONTEND_DIR, html=True), name="static") 
 
-
-def count_fingers(hand_landmarks, handedness_label):
-    """
-    Count extended fingers based on hand landmarks, corrected handedness,
-    and hand view ('palm' or 'back').
-    """
-    count = 0
-    lifted_fingers = []
-    if hand_landmarks:
-        hand_view = get_hand_view(hand_landmarks, handedness_label)
-        # print(f"Hand: {handedness_label}, View: {hand_view}")
-
-        thumb_tip = hand_landmarks.landmark[4]
-        thumb_ip = hand_landmarks.landmark[3]
-
-        if handedness_label == "left":  # Changed to lowercase
-            if hand_view == "back":  # Changed to lowercase
-                if thumb_tip.x > thumb_ip.x:
-                    count += 1
-            else:
-                if thumb_tip.x < thumb_ip.x:
-                    count += 1
-        elif handedness_label == "right":  # Changed to lowercase
-            if hand_view == "back":  # Changed to lowercase
-                if thumb_tip.x < thumb_ip.x:
-                    count += 1
-            else:
-                if thumb_tip.x > thumb_ip.x:
-                    count += 1
-
-        if count == 1:
-            lifted_fingers.append(0)  # Keep original 0-based indexing
-
-        # Other fingers
-        tips = [8, 12, 16, 20]
-        pips = [6, 10, 14, 18]
-
-        for tip_idx, pip_idx in zip(tips, pips):
-            tip_y = hand_landmarks.landmark[tip_idx].y
-            pip_y = hand_landmarks.landmark[pip_idx].y
-
-            if tip_y < pip_y:
-                count += 1
-                # Keep original 0-based indexing
-                lifted_fingers.append(tip_idx / 4 - 1)
-        # print(f"Fingers counted: {count}")
-
-    return count, lifted_fingers
-
-def get_corrected_handedness(results):
-    """
-    Flip handedness label if camera feed is mirrored.
-    """
-    label = results.multi_handedness[0].classification[0].label
-    if label == "Left":
-        return "right"
-    elif label == "Right":
-        return "left"
-    return label.lower()
-
-
-def get_hand_view(hand_landmarks, corrected_label):
-    """
-    Determine if the palm or back of the hand is facing the camera
-    based on WRIST and THUMB_CMC x-positions.
-    """
-    wrist = hand_landmarks.landmark[0]
-    thumb_cmc = hand_landmarks.landmark[1]
-    x_diff = thumb_cmc.x - wrist.x
-
-    if corrected_label == "left":
-        return "back" if x_diff > 0 else "palm"
-    elif corrected_label == "right":
-        return "back" if x_diff < 0 else "palm"
-    return "palm"
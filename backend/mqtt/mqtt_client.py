@@ -1,16 +1,43 @@
 import json
 import logging
+import time
 import paho.mqtt.client as mqtt
+from collections import OrderedDict, deque
+from threading import Condition, Thread
 from typing import Dict, Any, Callable
-from datetime import datetime
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+# Window, in seconds, over which the publish rate is measured
+PUBLISH_RATE_WINDOW = 10.0
+
+# Hand status published when no hand has been seen for a while
+HAND_LOST = "none"
+
+
+def _utc_isoformat(timestamp: float) -> str:
+    """Format a POSIX timestamp like `datetime.utcnow().isoformat()`."""
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None).isoformat()
+
+
 class MQTTClient:
-    """MQTT client for publishing gesture events and hand status updates."""
+    """MQTT client for publishing gesture events and hand status updates.
+    
+    Publishing never blocks the caller: messages are queued and sent by a
+    background thread. Hand status updates are coalesced per hand, so only
+    the latest status of each hand waits in the queue, and are dropped
+    when the queue is full. Gesture events are never dropped once queued:
+    when the queue is full, a pending hand status update makes room for
+    them, and if none is left the gesture queue grows past `queue_size`.
+    
+    A hand status identical to the last one published for that hand is
+    skipped, unless the heartbeat interval has elapsed since.
+    """
     
     def __init__(self, host: str = "localhost", port: int = 1883, 
-                 username: str = None, password: str = None):
+                 username: str = None, password: str = None, queue_size: int = 256,
+                 heartbeat_interval: float = None):
         """Initialize the MQTT client.
         
         Args:
@@ -18,12 +45,34 @@ class MQTTClient:
             port: MQTT broker port
             username: MQTT username
             password: MQTT password
+            queue_size: Messages waiting to be published above which hand
+                status updates are dropped to make room for gesture events
+            heartbeat_interval: Seconds after which an unchanged hand status is
+                published again, None to publish only on change
         """
         self.host = host
         self.port = port
         self.username = username
         self.password = password
         self.connected = False
+        self.queue_size = queue_size
+        self.heartbeat_interval = heartbeat_interval
+        
+        # Pending messages, serviced by the publisher thread
+        self._pending = Condition()
+        # (timestamp, gesture, confidence, hand, orientation, extended_fingers), never dropped
+        self._gesture_events = deque()
+        self._hand_status = OrderedDict()  # hand -> (timestamp, orientation, extended_fingers)
+        self._last_status = {}  # hand -> ((orientation, extended_fingers), monotonic time queued)
+        self._published_times = deque()
+        self._warned_disconnected = False
+        self._warned_backlog = False
+        self.published = 0
+        self.coalesced = 0
+        self.unchanged = 0
+        self.dropped = 0
+        self.dropped_disconnected = 0
+        self.errors = 0
         
         # Create MQTT client with a specific client ID
         self.client = mqtt.Client(client_id="gestalyze_backend")
@@ -39,6 +88,10 @@ class MQTTClient:
         # Set up TLS if needed
         if self.port == 8883:
             self.client.tls_set()
+        
+        # Publish from a background thread so the broker never slows down the caller
+        self._publisher = Thread(target=self._publish_loop, name="mqtt-publisher", daemon=True)
+        self._publisher.start()
 
     def connect(self):
         """Connect to the MQTT broker."""
@@ -60,6 +113,7 @@ class MQTTClient:
         """Callback for when the client connects to the broker."""
         if rc == 0:
             self.connected = True
+            self._warned_disconnected = False
             logger.info("Connected to MQTT broker")
         elif rc == 5:
             logger.error("Authentication failed - invalid username or password")
@@ -77,9 +131,25 @@ class MQTTClient:
         # This method is not used in the current implementation
         pass
 
+    def _accept(self, kind: str) -> bool:
+        """Check the connection before queueing a message, warning once per disconnection.
+        
+        Must be called with `_pending` held.
+        """
+        if self.connected:
+            return True
+        self.dropped_disconnected += 1
+        if not self._warned_disconnected:
+            self._warned_disconnected = True
+            logger.warning(f"Not connected to MQTT broker, dropping {kind} messages until reconnected")
+        return False
+
     def publish_gesture_event(self, gesture: str, confidence: float, hand: str, 
                             orientation: str, extended_fingers: list):
-        """Publish a gesture recognition event.
+        """Queue a gesture recognition event for publishing.
+        
+        Gesture events are never coalesced or dropped. When the queue is
+        full, the oldest pending hand status update is dropped instead.
         
         Args:
             gesture: The recognized gesture
@@ -88,46 +158,146 @@ class MQTTClient:
             orientation: Hand orientation
             extended_fingers: List of extended fingers
         """
-        if not self.connected:
-            logger.warning("Not connected to MQTT broker, cannot publish gesture event")
-            return
-
-        payload = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "gesture": gesture,
-            "confidence": confidence,
-            "hand": hand,
-            "orientation": orientation,
-            "extended_fingers": extended_fingers
-        }
-
-        try:
-            self.client.publish(f"{self.username}/gesture/recognized", json.dumps(payload))
-            logger.debug(f"Published gesture event: {payload}")
-        except Exception as e:
-            logger.error(f"Failed to publish gesture event: {e}")
+        with self._pending:
+            if not self._accept("gesture event"):
+                return
+            if len(self._gesture_events) + len(self._hand_status) >= self.queue_size:
+                if not self._drop_hand_status() and not self._warned_backlog:
+                    self._warned_backlog = True
+                    logger.warning(
+                        f"More than {self.queue_size} MQTT gesture events are waiting to be published"
+                    )
+            self._gesture_events.append(
+                (time.time(), gesture, confidence, hand, orientation, list(extended_fingers))
+            )
+            self._pending.notify()
 
     def publish_hand_status(self, hand: str, orientation: str, extended_fingers: list):
-        """Publish hand status updates.
+        """Queue a hand status update for publishing, if it changed.
+        
+        Updates identical to the last one of the same hand are skipped until
+        the heartbeat interval elapses. A pending update of the same hand is
+        replaced by this one. When the queue is full, the update is dropped.
         
         Args:
             hand: Which hand is being tracked
             orientation: Current hand orientation
             extended_fingers: List of currently extended fingers
         """
-        if not self.connected:
-            logger.warning("Not connected to MQTT broker, cannot publish hand status")
-            return
+        state = (orientation, tuple(extended_fingers))
+        now = time.monotonic()
+        with self._pending:
+            if not self._accept("hand status"):
+                return
+            last = self._last_status.get(hand)
+            if last is not None and last[0] == state and (
+                self.heartbeat_interval is None or now - last[1] < self.heartbeat_interval
+            ):
+                self.unchanged += 1
+                return
+            if hand in self._hand_status:
+                self.coalesced += 1
+            elif len(self._gesture_events) + len(self._hand_status) >= self.queue_size:
+                self.dropped += 1
+                return
+            # A reset still waiting to be published is obsolete once a hand shows up
+            self._hand_status.pop(HAND_LOST, None)
+            self._last_status[hand] = (state, now)
+            self._hand_status[hand] = (time.time(), orientation, list(extended_fingers))
+            self._pending.notify()
 
-        payload = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "hand": hand,
-            "orientation": orientation,
-            "extended_fingers": extended_fingers
-        }
+    def _drop_hand_status(self) -> bool:
+        """Drop the oldest pending hand status update to make room for a gesture event.
+        
+        A pending reset is kept, since it is the only message telling
+        subscribers that the hands are gone. Must be called with `_pending` held.
+        
+        Returns:
+            bool: False if there was no update to drop
+        """
+        for hand in self._hand_status:
+            if hand != HAND_LOST:
+                del self._hand_status[hand]
+                # Never published, so the next status of this hand must not be skipped as unchanged
+                self._last_status.pop(hand, None)
+                self.dropped += 1
+                return True
+        return False
 
-        try:
-            self.client.publish(f"{self.username}/hand/status", json.dumps(payload))
-            logger.debug(f"Published hand status: {payload}")
-        except Exception as e:
-            logger.error(f"Failed to publish hand status: {e}")
+    def publish_hand_reset(self):
+        """Queue a hand status telling subscribers that no hand is visible anymore.
+        
+        Published as a hand status with hand and orientation "none" and no
+        extended fingers, so subscribers can reset their sensors. Pending
+        updates of the lost hands are discarded, and the next status of any
+        hand is published even if it did not change.
+        """
+        with self._pending:
+            if not self._accept("hand reset"):
+                return
+            self._hand_status.clear()
+            self._last_status.clear()
+            self._hand_status[HAND_LOST] = (time.time(), HAND_LOST, [])
+            self._pending.notify()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the publisher's queue depth, publish rate and counters."""
+        with self._pending:
+            now = time.monotonic()
+            while self._published_times and self._published_times[0] < now - PUBLISH_RATE_WINDOW:
+                self._published_times.popleft()
+            return {
+                "connected": self.connected,
+                "queue_depth": len(self._gesture_events) + len(self._hand_status),
+                "publish_rate": round(len(self._published_times) / PUBLISH_RATE_WINDOW, 2),
+                "published": self.published,
+                "coalesced": self.coalesced,
+                "unchanged": self.unchanged,
+                "dropped": self.dropped,
+                "dropped_disconnected": self.dropped_disconnected,
+                "errors": self.errors
+            }
+
+    def _next_message(self):
+        """Wait for the next pending message and return its (topic, payload).
+        
+        Gesture events go first, in order; hand status updates follow, oldest hand first.
+        """
+        with self._pending:
+            while not self._gesture_events and not self._hand_status:
+                self._pending.wait()
+            if self._gesture_events:
+                timestamp, gesture, confidence, hand, orientation, extended_fingers = self._gesture_events.popleft()
+                if not self._gesture_events:
+                    # Warn again if the backlog builds up after catching up
+                    self._warned_backlog = False
+                return f"{self.username}/gesture/recognized", {
+                    "timestamp": _utc_isoformat(timestamp),
+                    "gesture": gesture,
+                    "confidence": confidence,
+                    "hand": hand,
+                    "orientation": orientation,
+                    "extended_fingers": extended_fingers
+                }
+            hand, (timestamp, orientation, extended_fingers) = self._hand_status.popitem(last=False)
+            return f"{self.username}/hand/status", {
+                "timestamp": _utc_isoformat(timestamp),
+                "hand": hand,
+                "orientation": orientation,
+                "extended_fingers": extended_fingers
+            }
+
+    def _publish_loop(self):
+        """Publish queued messages until the process exits."""
+        while True:
+            topic, payload = self._next_message()
+            try:
+                self.client.publish(topic, json.dumps(payload))
+                logger.debug(f"Published to {topic}: {payload}")
+                with self._pending:
+                    self.published += 1
+                    self._published_times.append(time.monotonic())
+            except Exception as e:
+                with self._pending:
+                    self.errors += 1
+                logger.error(f"Failed to publish to {topic}: {e}")
@@ -0,0 +1,3 @@
+"""
+Frame pipeline package for Gestalyze backend.
+"""
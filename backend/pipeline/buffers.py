@@ -0,0 +1,61 @@
+"""
+Reusable per-session image buffers.
+
+At the negotiated resolution every frame of a session has the same size,
+so the resized frame, its RGB and grayscale conversions and the region of
+interest crop are written with OpenCV's `dst=` into arrays allocated once
+per session instead of into fresh arrays on every frame.
+"""
+import numpy as np
+
+
+class FrameBuffers:
+    """Named arrays of one session, reallocated only when their shape changes."""
+
+    def __init__(self):
+        self._arrays = {}
+        self._flips = {}
+        self.allocations = 0
+
+    def get(self, name, shape, dtype=np.uint8):
+        """Return the session's array called `name`, reallocating it if its shape changed.
+
+        The content is overwritten by the next call with the same name, so the
+        caller must not keep the array across frames.
+
+        Args:
+            name: Buffer name, one per use in the pipeline
+            shape: Required shape
+            dtype: Required dtype
+
+        Returns:
+            np.ndarray: An uninitialized array of the requested shape
+        """
+        array = self._arrays.get(name)
+        if array is None or array.shape != shape or array.dtype != dtype:
+            array = self._arrays[name] = np.empty(shape, dtype=dtype)
+            self.allocations += 1
+        return array
+
+    def swap(self, name, shape, dtype=np.uint8):
+        """Return one of two alternating arrays called `name`.
+
+        For consumers that keep the previous frame's array, such as optical
+        flow tracking: the array returned by the previous call stays intact
+        until the one after this.
+
+        Args:
+            name: Buffer name
+            shape: Required shape
+            dtype: Required dtype
+
+        Returns:
+            np.ndarray: An uninitialized array of the requested shape
+        """
+        flip = self._flips[name] = not self._flips.get(name, False)
+        return self.get(f"{name}.{int(flip)}", shape, dtype)
+
+    @property
+    def nbytes(self):
+        """Total size of the allocated buffers, in bytes."""
+        return sum(array.nbytes for array in self._arrays.values())
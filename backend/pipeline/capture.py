@@ -0,0 +1,186 @@
+"""
+Background writer for debug captures (`SAVE_IMAGES`).
+
+Encoding a JPEG and writing it to disk inside `process_frame` would stall
+the worker, and with it every session it serves. Sampled frames are handed
+to a bounded queue instead, and a writer thread saves them; when the
+writer falls behind, new captures are dropped rather than queued. The
+writer also keeps its captures within a size and age budget by deleting
+the oldest ones; other files in the directory are never touched.
+"""
+import json
+import os
+import queue
+import time
+from collections import deque
+from datetime import datetime
+from threading import Lock, Thread
+import cv2
+
+SAVE_MODE_IMAGE = "image"
+SAVE_MODE_LANDMARKS = "landmarks"
+SAVE_MODE_BOTH = "both"
+CAPTURE_PREFIX = "hand_"
+CAPTURE_EXTENSIONS = (".jpg", ".json")
+
+
+class CaptureWriter:
+    """Saves sampled frames and/or their landmarks from a background thread."""
+
+    def __init__(self, directory, mode=SAVE_MODE_IMAGE, every_n_frames=1, max_per_second=None,
+                 queue_size=32, max_bytes=None, max_age=None):
+        """
+        Args:
+            directory: Directory to save captures to
+            mode: "image" (annotated JPEG), "landmarks" (JSON) or "both"
+            every_n_frames: Save only every Nth frame offered
+            max_per_second: Maximum captures per second, None for no limit
+            queue_size: Captures waiting for the writer; further ones are dropped
+            max_bytes: Delete the oldest captures beyond this total size, None for no limit
+            max_age: Delete captures older than this many seconds, None to keep them
+        """
+        self.directory = directory
+        self.mode = mode
+        self.every_n_frames = max(1, every_n_frames)
+        self.min_interval = 1.0 / max_per_second if max_per_second else 0.0
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = Lock()
+        self._offered = 0
+        self._last_capture = 0.0
+        self._files = deque()  # (path, size, mtime), oldest first
+        self._total_bytes = 0
+        self.written = 0
+        self.dropped = 0
+        self.deleted = 0
+        self.errors = 0
+
+        os.makedirs(directory, exist_ok=True)
+        self._scan()
+        self._thread = Thread(target=self._run, name="capture-writer", daemon=True)
+        self._thread.start()
+
+    def wants_image(self):
+        """Return True if captures include the annotated image."""
+        return self.mode in (SAVE_MODE_IMAGE, SAVE_MODE_BOTH)
+
+    def wants_landmarks(self):
+        """Return True if captures include the landmarks."""
+        return self.mode in (SAVE_MODE_LANDMARKS, SAVE_MODE_BOTH)
+
+    def sample(self):
+        """Decide whether the frame being offered should be captured.
+
+        Returns:
+            bool: True if the frame passes the every-Nth and rate limits
+        """
+        now = time.monotonic()
+        with self._lock:
+            self._offered += 1
+            if self._offered % self.every_n_frames:
+                return False
+            if now - self._last_capture < self.min_interval:
+                return False
+            self._last_capture = now
+            return True
+
+    def submit(self, image=None, landmarks=None, metadata=None):
+        """Queue a capture without blocking.
+
+        Args:
+            image: BGR frame to save as JPEG; must not be modified afterwards
+            landmarks: Landmarks array of shape (hands, 21, 3)
+            metadata: JSON-serializable fields saved with the landmarks
+
+        Returns:
+            bool: False if the queue was full and the capture was dropped
+        """
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        try:
+            self._queue.put_nowait((timestamp, image, landmarks, metadata))
+            return True
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return False
+
+    def stats(self):
+        """Return the writer's counters and the size of the capture directory."""
+        with self._lock:
+            return {
+                "queued": self._queue.qsize(),
+                "written": self.written,
+                "dropped": self.dropped,
+                "deleted": self.deleted,
+                "errors": self.errors,
+                "files": len(self._files),
+                "bytes": self._total_bytes
+            }
+
+    def _scan(self):
+        """Register the captures already in the directory, so rotation covers them."""
+        files = []
+        for entry in os.scandir(self.directory):
+            # Only files this writer names; anything else in the directory is left alone
+            if entry.is_file() and entry.name.startswith(CAPTURE_PREFIX) and entry.name.endswith(CAPTURE_EXTENSIONS):
+                stat = entry.stat()
+                files.append((entry.path, stat.st_size, stat.st_mtime))
+        for path, size, mtime in sorted(files, key=lambda file: file[2]):
+            self._files.append((path, size, mtime))
+            self._total_bytes += size
+
+    def _run(self):
+        """Write queued captures until the process exits."""
+        while True:
+            timestamp, image, landmarks, metadata = self._queue.get()
+            try:
+                base = os.path.join(self.directory, f"{CAPTURE_PREFIX}{timestamp}")
+                if image is not None:
+                    self._write_image(f"{base}.jpg", image)
+                if landmarks is not None:
+                    self._write_landmarks(f"{base}.json", landmarks, metadata)
+                with self._lock:
+                    self.written += 1
+                self._rotate()
+            except Exception as e:
+                with self._lock:
+                    self.errors += 1
+                print(f"Error saving capture: {e}")
+
+    def _write_image(self, path, image):
+        """Encode and save a frame."""
+        if not cv2.imwrite(path, image):
+            raise OSError(f"Could not write {path}")
+        self._track(path)
+
+    def _write_landmarks(self, path, landmarks, metadata):
+        """Save landmarks and metadata as JSON."""
+        with open(path, "w") as f:
+            json.dump({**(metadata or {}), "landmarks": landmarks.tolist()}, f)
+        self._track(path)
+
+    def _track(self, path):
+        """Account for a newly written file."""
+        size = os.path.getsize(path)
+        with self._lock:
+            self._files.append((path, size, time.time()))
+            self._total_bytes += size
+
+    def _rotate(self):
+        """Delete the oldest captures beyond the size and age limits."""
+        oldest = time.time() - self.max_age if self.max_age else None
+        while self._files:
+            path, size, mtime = self._files[0]
+            over_size = self.max_bytes is not None and self._total_bytes > self.max_bytes
+            too_old = oldest is not None and mtime < oldest
+            if not (over_size or too_old):
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            with self._lock:
+                self._files.popleft()
+                self._total_bytes -= size
+                self.deleted += 1
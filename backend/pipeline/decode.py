@@ -0,0 +1,84 @@
+"""
+Frame decoding at the processing resolution.
+
+Hand detection does not need full webcam resolution, so JPEG frames are
+decoded directly at a reduced scale (libjpeg can skip most of the IDCT work
+with IMREAD_REDUCED_*) and only the remainder is resized, before any color
+conversion touches the pixels.
+"""
+import cv2
+import numpy as np
+
+_REDUCED_FLAGS = (
+    (8, cv2.IMREAD_REDUCED_COLOR_8),
+    (4, cv2.IMREAD_REDUCED_COLOR_4),
+    (2, cv2.IMREAD_REDUCED_COLOR_2),
+)
+
+# JPEG start-of-frame markers carrying the image dimensions
+_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def jpeg_dimensions(data):
+    """
+    Read the width and height from a JPEG header without decoding it.
+
+    Args:
+        data: Encoded JPEG bytes
+
+    Returns:
+        tuple: (width, height), or None if the data is not a parsable JPEG
+    """
+    if data[:2] != b"\xff\xd8":
+        return None
+    offset = 2
+    length = len(data)
+    while offset + 9 < length:
+        if data[offset] != 0xFF:
+            return None
+        marker = data[offset + 1]
+        if marker == 0xFF:  # Fill byte
+            offset += 1
+            continue
+        if marker in _SOF_MARKERS:
+            height = int.from_bytes(data[offset + 5:offset + 7], "big")
+            width = int.from_bytes(data[offset + 7:offset + 9], "big")
+            return width, height
+        segment_length = int.from_bytes(data[offset + 2:offset + 4], "big")
+        offset += 2 + segment_length
+    return None
+
+
+def decode_frame(image_bytes, max_width=None, buffers=None):
+    """
+    Decode a frame, downscaled so that it is at most `max_width` wide.
+
+    Args:
+        image_bytes: Encoded JPEG (or any OpenCV-readable) frame
+        max_width: Maximum width of the decoded frame, None for full size
+        buffers: Optional session `FrameBuffers` to resize into
+
+    Returns:
+        np.ndarray: BGR frame (a session buffer when it was resized into `buffers`)
+    """
+    nparr = np.frombuffer(image_bytes, np.uint8)
+    flag = cv2.IMREAD_COLOR
+
+    if max_width:
+        dimensions = jpeg_dimensions(image_bytes)
+        if dimensions is not None:
+            width = dimensions[0]
+            for factor, reduced_flag in _REDUCED_FLAGS:
+                if width // factor >= max_width:
+                    flag = reduced_flag
+                    break
+
+    frame = cv2.imdecode(nparr, flag)
+    if frame is None:
+        raise ValueError("Could not decode frame")
+
+    if max_width and frame.shape[1] > max_width:
+        height = round(frame.shape[0] * max_width / frame.shape[1])
+        dst = buffers.get("frame", (height, max_width, 3)) if buffers is not None else None
+        frame = cv2.resize(frame, (max_width, height), dst=dst, interpolation=cv2.INTER_AREA)
+    return frame
@@ -0,0 +1,106 @@
+"""
+Pool of MediaPipe hand detectors leased to WebSocket sessions.
+
+Each session keeps the same detector for its whole lifetime so MediaPipe's
+tracking state follows a single camera stream. Released detectors are kept
+idle for reuse, reset before they are leased again so no tracking state
+carries over to another session, and closed once they have been idle for
+too long.
+"""
+import time
+from threading import Lock
+
+
+class DetectorPoolExhausted(RuntimeError):
+    """Raised when every detector in the pool is leased."""
+
+
+class HandsDetectorPool:
+    """Session-affine pool of hand detectors."""
+
+    def __init__(self, factory, max_size: int = 8, idle_timeout: float = 60.0):
+        """Initialize the pool.
+
+        Args:
+            factory: Callable returning a new detector (with `reset` and `close`)
+            max_size: Maximum number of detectors alive (leased + idle)
+            idle_timeout: Seconds after which an idle detector is closed
+        """
+        self.factory = factory
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._leased = {}  # session_id -> detector
+        self._idle = []  # (released_at, detector), oldest first
+        self._created = 0
+        self._evicted = 0
+        self._lock = Lock()
+
+    def lease(self, session_id):
+        """Return the detector leased to a session, leasing one if needed.
+
+        Args:
+            session_id: Identifier of the session
+
+        Returns:
+            The session's detector
+
+        Raises:
+            DetectorPoolExhausted: If no detector can be leased
+        """
+        with self._lock:
+            detector = self._leased.get(session_id)
+            if detector is not None:
+                return detector
+
+            self._evict_idle()
+            if self._idle:
+                # Reuse the most recently released detector, without the
+                # previous session's tracked hands
+                _, detector = self._idle.pop()
+                detector.reset()
+            elif len(self._leased) < self.max_size:
+                detector = self.factory()
+                self._created += 1
+            else:
+                raise DetectorPoolExhausted(
+                    f"All {self.max_size} hand detectors are leased"
+                )
+
+            self._leased[session_id] = detector
+            return detector
+
+    def release(self, session_id):
+        """Return a session's detector to the pool.
+
+        Args:
+            session_id: Identifier of the session
+        """
+        with self._lock:
+            detector = self._leased.pop(session_id, None)
+            if detector is not None:
+                self._idle.append((time.monotonic(), detector))
+            self._evict_idle()
+
+    def _evict_idle(self):
+        """Close idle detectors that exceeded the idle timeout. Caller holds the lock."""
+        cutoff = time.monotonic() - self.idle_timeout
+        while self._idle and self._idle[0][0] < cutoff:
+            _, detector = self._idle.pop(0)
+            detector.close()
+            self._evicted += 1
+
+    def stats(self):
+        """Return pool metrics.
+
+        Returns:
+            dict: Leased, idle, created and evicted detector counts
+        """
+        with self._lock:
+            self._evict_idle()
+            return {
+                "max_size": self.max_size,
+                "leased": len(self._leased),
+                "idle": len(self._idle),
+                "created": self._created,
+                "evicted": self._evicted
+            }
@@ -0,0 +1,45 @@
+"""
+Landmark drawing on (21, 3) float32 landmark arrays.
+
+Draws the same picture as MediaPipe's `drawing_utils.draw_landmarks` with
+the specs the pipeline always used, without turning the arrays back into
+protobuf landmark lists: connections first, then each landmark as a
+colored circle with a light border. Landmarks outside the frame are
+skipped, together with their connections.
+"""
+import cv2
+import numpy as np
+
+LANDMARK_COLOR = (0, 255, 0)
+LANDMARK_RADIUS = 4
+CONNECTION_COLOR = (0, 0, 255)
+THICKNESS = 2
+BORDER_COLOR = (224, 224, 224)
+BORDER_RADIUS = max(LANDMARK_RADIUS + 1, int(LANDMARK_RADIUS * 1.2))
+
+
+def draw_hand(image, landmarks, connections):
+    """
+    Draw a hand's landmarks and connections onto a BGR image, in place.
+
+    Args:
+        image: BGR frame the landmarks are normalized to
+        landmarks: Landmarks array of shape (21, 3)
+        connections: (start, end) landmark index pairs, e.g. `HAND_CONNECTIONS`
+    """
+    height, width = image.shape[:2]
+    # In float64, like MediaPipe's pixel conversion of the landmark attributes
+    points = landmarks[:, :2].astype(np.float64)
+    visible = ((points >= 0) & (points <= 1)).all(axis=1)
+    pixels = np.minimum(np.floor(points * (width, height)), (width - 1, height - 1))
+    coordinates = {
+        index: (int(x), int(y))
+        for index, (x, y) in enumerate(pixels.tolist()) if visible[index]
+    }
+
+    for start, end in connections:
+        if start in coordinates and end in coordinates:
+            cv2.line(image, coordinates[start], coordinates[end], CONNECTION_COLOR, THICKNESS)
+    for point in coordinates.values():
+        cv2.circle(image, point, BORDER_RADIUS, BORDER_COLOR, THICKNESS)
+        cv2.circle(image, point, LANDMARK_RADIUS, LANDMARK_COLOR, THICKNESS)
@@ -0,0 +1,102 @@
+"""
+Frame executor that runs CPU-bound frame processing off the event loop.
+"""
+import asyncio
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+EXECUTOR_THREAD = "thread"
+EXECUTOR_PROCESS = "process"
+
+# Set in each worker process of a process executor: its index and the number of workers
+worker_index = None
+worker_count = None
+
+
+def _init_worker(index, count):
+    """Record which worker process this is."""
+    global worker_index, worker_count
+    worker_index = index
+    worker_count = count
+
+
+class FrameExecutor:
+    """Thread or process pool with a bounded number of pending frames.
+
+    In process mode every worker is its own single-process pool and each
+    session is pinned to one of them, so per-session state (such as the
+    leased hand detector) always lives in the same process.
+    """
+
+    def __init__(self, kind: str = EXECUTOR_THREAD, workers: int = 1, max_pending: int = 32):
+        """Initialize the executor.
+
+        Args:
+            kind: "thread" or "process"
+            workers: Number of worker threads or processes
+            max_pending: Maximum number of frames queued or running at once.
+                Further submissions wait until a slot frees up.
+        """
+        self.kind = kind
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0
+        self._slots = asyncio.Semaphore(max_pending)
+
+        if kind == EXECUTOR_THREAD:
+            self._pools = [ThreadPoolExecutor(max_workers=workers, thread_name_prefix="frame-worker")]
+        elif kind == EXECUTOR_PROCESS:
+            # MediaPipe graphs do not survive fork, so always spawn fresh workers
+            context = multiprocessing.get_context("spawn")
+            self._pools = [
+                ProcessPoolExecutor(
+                    max_workers=1, mp_context=context,
+                    initializer=_init_worker, initargs=(index, workers)
+                )
+                for index in range(workers)
+            ]
+        else:
+            raise ValueError(f"Invalid executor kind: {kind}. Must be '{EXECUTOR_THREAD}' or '{EXECUTOR_PROCESS}'.")
+
+    def _pool_for(self, session_id):
+        """Return the pool a session is pinned to."""
+        return self._pools[session_id % len(self._pools)]
+
+    async def run(self, session_id, func, *args):
+        """Run `func(*args)` on the session's worker and wait for its result.
+
+        Args:
+            session_id: Integer session identifier used for worker affinity
+            func: Picklable callable (module-level function in process mode)
+            *args: Positional arguments for `func`
+
+        Returns:
+            The return value of `func`
+        """
+        async with self._slots:
+            self.pending += 1
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._pool_for(session_id), func, *args)
+            finally:
+                self.pending -= 1
+
+    async def broadcast(self, func, *args):
+        """Run `func(*args)` once on every worker.
+
+        Args:
+            func: Picklable callable (module-level function in process mode)
+            *args: Positional arguments for `func`
+
+        Returns:
+            list: One result per worker
+        """
+        loop = asyncio.get_running_loop()
+        return await asyncio.gather(*(
+            loop.run_in_executor(pool, func, *args) for pool in self._pools
+        ))
+
+    def shutdown(self):
+        """Stop the worker pools, cancelling frames that have not started."""
+        for pool in self._pools:
+            pool.shutdown(wait=False, cancel_futures=True)
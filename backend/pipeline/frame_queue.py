@@ -0,0 +1,64 @@
+"""
+Latest-frame-wins queue for a single WebSocket connection.
+"""
+import asyncio
+import time
+
+
+class LatestFrameQueue:
+    """Holds at most one unprocessed frame, replacing it when a newer one arrives.
+
+    When the server cannot keep up with the client's frame rate, stale frames
+    are dropped instead of queueing up, so end-to-end latency stays bounded.
+    """
+
+    def __init__(self, on_drop=None):
+        """Initialize an empty queue.
+
+        Args:
+            on_drop: Optional callback invoked whenever a pending frame is dropped
+        """
+        self.on_drop = on_drop
+        self.dropped = 0
+        self.received = 0
+        self._frame = None
+        self._received_at = 0.0
+        self._closed = False
+        self._ready = asyncio.Event()
+
+    def put(self, frame):
+        """Store a new frame, dropping the pending one if it was not processed yet.
+
+        Args:
+            frame: Frame payload (raw bytes or data URL)
+        """
+        if self._frame is not None:
+            self.dropped += 1
+            if self.on_drop is not None:
+                self.on_drop()
+        self._frame = frame
+        self._received_at = time.monotonic()
+        self.received += 1
+        self._ready.set()
+
+    async def get(self):
+        """Wait for the newest frame.
+
+        Returns:
+            tuple: (frame payload, seconds the frame waited in the queue),
+                or None once the queue is closed
+        """
+        while self._frame is None:
+            if self._closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+
+        frame, age = self._frame, time.monotonic() - self._received_at
+        self._frame = None
+        return frame, age
+
+    def close(self):
+        """Close the queue, waking up any pending `get`."""
+        self._closed = True
+        self._ready.set()
@@ -0,0 +1,136 @@
+"""
+Hand analysis on (21, 3) float32 landmark arrays.
+
+MediaPipe landmarks are converted once per hand, right after detection,
+into a `HandResults`; region of interest mapping, tracking, drawing,
+finger counting, the hand view and ASL featurization all work on those
+arrays instead of walking the protobuf landmark objects again.
+"""
+from itertools import chain
+import numpy as np
+
+# MediaPipe hand landmark indices
+WRIST = 0
+THUMB_CMC = 1
+THUMB_IP = 3
+THUMB_TIP = 4
+# Tips (8, 12, 16, 20) and PIP joints (6, 10, 14, 18) of the other four fingers
+FINGER_TIPS = slice(8, 21, 4)
+FINGER_PIPS = slice(6, 19, 4)
+# Lifted finger ids of the index, middle, ring and pinky fingers (the thumb is 0)
+FINGER_IDS = (1.0, 2.0, 3.0, 4.0)
+
+X, Y = 0, 1
+
+
+def landmarks_to_array(hand_landmarks, out=None):
+    """
+    Convert MediaPipe hand landmarks into a (21, 3) float32 array.
+
+    Args:
+        hand_landmarks: MediaPipe hand landmarks object
+        out: Optional preallocated (21, 3) float32 array to fill
+
+    Returns:
+        np.ndarray: `out`, or a new array if none was given
+    """
+    if out is None:
+        out = np.empty((21, 3), dtype=np.float32)
+    out.reshape(-1)[:] = np.fromiter(
+        chain.from_iterable((landmark.x, landmark.y, landmark.z) for landmark in hand_landmarks.landmark),
+        dtype=np.float32, count=out.size
+    )
+    return out
+
+
+class HandResults:
+    """The hands found in a frame, as (21, 3) float32 arrays in normalized frame coordinates."""
+
+    def __init__(self, hands, multi_handedness):
+        """
+        Args:
+            hands: List of landmarks arrays of shape (21, 3), one per hand
+            multi_handedness: MediaPipe handedness classifications, in the same order
+        """
+        self.hands = hands
+        self.multi_handedness = multi_handedness
+
+
+def hand_results(results, landmark_buffer=None):
+    """
+    Convert MediaPipe hands results into a `HandResults`, once per hand.
+
+    Args:
+        results: MediaPipe hands results
+        landmark_buffer: Optional function returning the preallocated (21, 3)
+            float32 array of the index-th hand
+
+    Returns:
+        HandResults: The hands, empty if none was detected
+    """
+    hands = [
+        landmarks_to_array(hand, out=landmark_buffer(index) if landmark_buffer is not None else None)
+        for index, hand in enumerate(results.multi_hand_landmarks or ())
+    ]
+    return HandResults(hands, results.multi_handedness)
+
+
+def count_fingers(landmarks, handedness_label, hand_view=None):
+    """
+    Count extended fingers based on hand landmarks, corrected handedness,
+    and hand view ('palm' or 'back').
+
+    Args:
+        landmarks: Landmarks array of shape (21, 3)
+        handedness_label: Corrected handedness, "left" or "right"
+        hand_view: Optional output of `get_hand_view`, computed if not given
+
+    Returns:
+        tuple: (number of extended fingers, list of lifted finger ids)
+    """
+    if hand_view is None:
+        hand_view = get_hand_view(landmarks, handedness_label)
+
+    # The thumb extends sideways: away from the palm along x
+    thumb_x_diff = landmarks[THUMB_TIP, X] - landmarks[THUMB_IP, X]
+    thumb_extended = False
+    if handedness_label == "left":
+        thumb_extended = thumb_x_diff > 0 if hand_view == "back" else thumb_x_diff < 0
+    elif handedness_label == "right":
+        thumb_extended = thumb_x_diff < 0 if hand_view == "back" else thumb_x_diff > 0
+
+    # Other fingers are extended when their tip is above their PIP joint
+    extended = landmarks[FINGER_TIPS, Y] < landmarks[FINGER_PIPS, Y]
+
+    lifted_fingers = [0] if thumb_extended else []
+    lifted_fingers.extend(finger for finger, up in zip(FINGER_IDS, extended.tolist()) if up)
+    return len(lifted_fingers), lifted_fingers
+
+def get_corrected_handedness(results):
+    """
+    Flip handedness label if camera feed is mirrored.
+    """
+    label = results.multi_handedness[0].classification[0].label
+    if label == "Left":
+        return "right"
+    elif label == "Right":
+        return "left"
+    return label.lower()
+
+
+def get_hand_view(landmarks, corrected_label):
+    """
+    Determine if the palm or back of the hand is facing the camera
+    based on WRIST and THUMB_CMC x-positions.
+
+    Args:
+        landmarks: Landmarks array of shape (21, 3)
+        corrected_label: Corrected handedness, "left" or "right"
+    """
+    x_diff = landmarks[THUMB_CMC, X] - landmarks[WRIST, X]
+
+    if corrected_label == "left":
+        return "back" if x_diff > 0 else "palm"
+    elif corrected_label == "right":
+        return "back" if x_diff < 0 else "palm"
+    return "palm"
@@ -0,0 +1,123 @@
+"""
+Frame pipeline metrics in the Prometheus text exposition format.
+
+Stage durations are measured inside the frame executor with `StageTimer`
+and returned with each frame result, so they can be aggregated in the main
+process regardless of whether the workers are threads or processes.
+"""
+import time
+from contextlib import contextmanager
+from threading import Lock
+
+# Stages of the frame pipeline, in execution order
+STAGES = (
+    "decode", "scene_gating", "color_conversion", "tracking", "mediapipe", "motion_gating", "finger_counting",
+    "asl_featurization", "asl_inference", "drawing", "encoding",
+    "mqtt_publish", "socket_send"
+)
+
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+class StageTimer:
+    """Accumulates the time spent in each pipeline stage of one frame."""
+
+    def __init__(self):
+        self.durations = {}
+
+    @contextmanager
+    def stage(self, name):
+        """Time the enclosed block and add it to the stage's duration."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.durations[name] = self.durations.get(name, 0.0) + time.perf_counter() - start
+
+    def as_milliseconds(self):
+        """Return the stage durations in milliseconds, rounded for responses."""
+        return {name: round(seconds * 1000, 3) for name, seconds in self.durations.items()}
+
+
+class Histogram:
+    """Cumulative histogram with fixed buckets."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        """Record a single observation."""
+        self.sum += value
+        self.count += 1
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+
+
+class MetricsRegistry:
+    """Stage latency histograms and frame counters of the backend process."""
+
+    def __init__(self):
+        self.stage_durations = {stage: Histogram() for stage in STAGES}
+        self.counters = {
+            "frames_processed_total": 0,
+            "hands_detected_total": 0,
+            "frames_dropped_total": 0,
+            "frames_scene_static_total": 0,
+            "frames_motion_gated_total": 0,
+            "mqtt_publishes_suppressed_total": 0,
+            "mqtt_hand_resets_total": 0,
+        }
+        self._lock = Lock()
+
+    def observe_stages(self, durations):
+        """Record the stage durations (in seconds) of one frame."""
+        with self._lock:
+            for stage, seconds in durations.items():
+                histogram = self.stage_durations.get(stage)
+                if histogram is None:
+                    histogram = self.stage_durations[stage] = Histogram()
+                histogram.observe(seconds)
+
+    def increment(self, counter, amount=1):
+        """Increase a counter."""
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def render(self, gauges=None, counters=None):
+        """
+        Render all metrics in the Prometheus text format.
+
+        Args:
+            gauges: Optional dictionary of gauge name to current value
+            counters: Optional dictionary of counter name to value, for counters kept elsewhere
+
+        Returns:
+            str: The exposition text
+        """
+        lines = [
+            "# HELP gestalyze_stage_duration_seconds Time spent in each frame pipeline stage.",
+            "# TYPE gestalyze_stage_duration_seconds histogram",
+        ]
+        with self._lock:
+            for stage, histogram in self.stage_durations.items():
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    lines.append(f'gestalyze_stage_duration_seconds_bucket{{stage="{stage}",le="{bound}"}} {count}')
+                lines.append(f'gestalyze_stage_duration_seconds_bucket{{stage="{stage}",le="+Inf"}} {histogram.count}')
+                lines.append(f'gestalyze_stage_duration_seconds_sum{{stage="{stage}"}} {histogram.sum:.6f}')
+                lines.append(f'gestalyze_stage_duration_seconds_count{{stage="{stage}"}} {histogram.count}')
+
+            counters = {**self.counters, **(counters or {})}
+
+        for name, value in counters.items():
+            lines.append(f"# TYPE gestalyze_{name} counter")
+            lines.append(f"gestalyze_{name} {value}")
+
+        for name, value in (gauges or {}).items():
+            lines.append(f"# TYPE gestalyze_{name} gauge")
+            lines.append(f"gestalyze_{name} {value}")
+
+        return "\n".join(lines) + "\n"
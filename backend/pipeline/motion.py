@@ -0,0 +1,90 @@
+"""
+Motion gating of the per-hand analysis.
+
+A hand held still produces nearly the same landmarks frame after frame, so
+counting fingers, finding the hand view and classifying the ASL letter
+would only repeat the previous answer. The gate compares the landmarks of
+the current frame with those of the last frame that was actually analyzed
+and lets the caller reuse that frame's results while the hand has not moved.
+"""
+import numpy as np
+
+
+def landmark_displacement(previous, current):
+    """Return the mean landmark displacement between two hands, relative to hand size.
+
+    Only x and y are compared, since MediaPipe's z estimate is much noisier.
+
+    Args:
+        previous: Landmarks array of shape (21, 3) of the reference frame
+        current: Landmarks array of shape (21, 3) of the current frame
+
+    Returns:
+        float: Mean Euclidean displacement divided by the hand's bounding box diagonal
+    """
+    distances = np.linalg.norm(current[:, :2] - previous[:, :2], axis=1)
+    extent = np.ptp(previous[:, :2], axis=0)
+    size = float(np.hypot(extent[0], extent[1]))
+    return float(distances.mean()) / size if size > 0 else float("inf")
+
+
+class MotionGate:
+    """Per-session memory of the last analyzed hand and its results."""
+
+    def __init__(self, threshold=0.03, max_frames=30):
+        """Initialize the gate.
+
+        Args:
+            threshold: Displacement, as a fraction of the hand size, below which
+                the previous results are reused (None disables the gate)
+            max_frames: Re-analyze a still hand at least every N frames
+        """
+        self.threshold = threshold
+        self.max_frames = max_frames
+        self.landmarks = None
+        self.key = None
+        self.results = None
+        self.reused = 0
+
+    def reset(self):
+        """Forget the reference hand, forcing analysis on the next frame."""
+        self.landmarks = None
+        self.key = None
+        self.results = None
+        self.reused = 0
+
+    def check(self, landmarks, key):
+        """Return the previous results if the hand has not moved since they were computed.
+
+        Args:
+            landmarks: Landmarks array of shape (21, 3) of the current frame
+            key: Settings the results depend on (handedness, ASL model, ...);
+                results computed with different settings are never reused
+
+        Returns:
+            dict: The previous results, or None if the hand must be analyzed
+        """
+        if (
+            self.threshold is None
+            or self.results is None
+            or key != self.key
+            or self.reused >= self.max_frames
+            or landmark_displacement(self.landmarks, landmarks) >= self.threshold
+        ):
+            return None
+        self.reused += 1
+        return self.results
+
+    def update(self, landmarks, key, results):
+        """Remember the landmarks and results of an analyzed frame.
+
+        Args:
+            landmarks: Landmarks array of shape (21, 3) that were analyzed
+            key: Settings the results were computed with
+            results: Results to reuse while the hand stays still
+        """
+        # The caller reuses its landmarks buffer on the next frame
+        self.landmarks = landmarks.copy()
+        self.key = key
+        self.results = results
+        self.reused = 0
@@ -0,0 +1,381 @@
+"""
+Frame processing pipeline.
+
+Everything in this module runs inside the frame executor, on a worker
+thread or in a worker process, so it must not touch the event loop, the
+WebSocket or the MQTT client. Heavy resources are created lazily so that
+each worker process builds its own copy.
+"""
+import os
+import time
+from threading import Lock
+import cv2
+import numpy as np
+import mediapipe as mp
+from backend_config import (
+    SAVE_IMAGES, SAVE_DIR, SAVE_MODE, SAVE_EVERY_N_FRAMES, SAVE_MAX_PER_SECOND, SAVE_QUEUE_SIZE,
+    SAVE_MAX_BYTES, SAVE_MAX_AGE, HANDS_POOL_MAX_SIZE, HANDS_POOL_IDLE_TIMEOUT, HANDS_MODEL_COMPLEXITY
+)
+from inference.predict import ASLPredictor
+from inference.registry import ModelUnavailable
+from .capture import CaptureWriter
+from .decode import decode_frame
+from . import executor
+from .detector_pool import HandsDetectorPool
+from .drawing import draw_hand
+from .hands import count_fingers, get_corrected_handedness, get_hand_view, hand_results
+from .metrics import StageTimer
+from .protocol import RESPONSE_MODE_LANDMARKS
+from .worker_session import WorkerSession
+
+mp_hands = mp.solutions.hands
+
+_detector_pool = None
+_asl_predictor = None
+_capture_writer = None
+_sessions = {}  # session_id -> WorkerSession
+_init_lock = Lock()
+
+
+def create_hands_detector(model_complexity=HANDS_MODEL_COMPLEXITY):
+    """Create a MediaPipe hands detector configured for video streams."""
+    return mp_hands.Hands(
+        static_image_mode=False,
+        max_num_hands=1,
+        min_detection_confidence=0.3,
+        model_complexity=model_complexity
+    )
+
+
+def get_detector_pool():
+    """Return the worker's hand detector pool, creating it on first use."""
+    global _detector_pool
+    with _init_lock:
+        if _detector_pool is None:
+            _detector_pool = HandsDetectorPool(
+                create_hands_detector,
+                max_size=HANDS_POOL_MAX_SIZE,
+                idle_timeout=HANDS_POOL_IDLE_TIMEOUT
+            )
+    return _detector_pool
+
+
+def detector_pool_stats():
+    """Return the worker's hand detector pool metrics."""
+    return get_detector_pool().stats()
+
+
+def get_worker_session(session_id):
+    """Return the worker-side state of a session, creating it on its first frame."""
+    session = _sessions.get(session_id)
+    if session is None:
+        detector = get_detector_pool().lease(session_id)
+        session = _sessions[session_id] = WorkerSession(session_id, detector)
+    return session
+
+
+def open_session(session_id, detector):
+    """Start a session with a detector created by the caller instead of a pooled one.
+
+    Used by the offline benchmarks to compare detector configurations.
+    """
+    session = _sessions[session_id] = WorkerSession(session_id, detector)
+    return session
+
+
+def release_session(session_id):
+    """Release the per-session resources held by this worker."""
+    _sessions.pop(session_id, None)
+    get_detector_pool().release(session_id)
+
+
+def get_asl_predictor():
+    """Return the process-wide ASL predictor, creating it on first use."""
+    global _asl_predictor
+    with _init_lock:
+        if _asl_predictor is None:
+            _asl_predictor = ASLPredictor()
+    return _asl_predictor
+
+
+def get_capture_writer():
+    """
+    Return the worker's debug capture writer, creating it on first use.
+
+    Worker processes each write to their own `worker_<index>` subdirectory
+    of `SAVE_DIR` with an equal share of `SAVE_MAX_BYTES`, so no writer
+    rotates another's captures and the total stays within the budget.
+    """
+    global _capture_writer
+    with _init_lock:
+        if _capture_writer is None:
+            directory, max_bytes = SAVE_DIR, SAVE_MAX_BYTES
+            if executor.worker_index is not None:
+                directory = os.path.join(SAVE_DIR, f"worker_{executor.worker_index}")
+                if max_bytes is not None:
+                    max_bytes //= executor.worker_count
+            _capture_writer = CaptureWriter(
+                directory,
+                mode=SAVE_MODE,
+                every_n_frames=SAVE_EVERY_N_FRAMES,
+                max_per_second=SAVE_MAX_PER_SECOND,
+                queue_size=SAVE_QUEUE_SIZE,
+                max_bytes=max_bytes,
+                max_age=SAVE_MAX_AGE
+            )
+    return _capture_writer
+
+
+def capture_stats():
+    """Return the worker's debug capture writer metrics."""
+    return get_capture_writer().stats()
+
+
+def asl_model_stats():
+    """Return the worker's ASL model registry and cascade metrics."""
+    asl_predictor = get_asl_predictor()
+    return {
+        **asl_predictor.registry.stats(),
+        "cascade": asl_predictor.cascade_stats(),
+        "cache": asl_predictor.cache.stats() if asl_predictor.cache is not None else None
+    }
+
+
+def refresh_asl_models():
+    """Start reloading the worker's resident ASL models whose artifacts changed."""
+    return get_asl_predictor().registry.refresh()
+
+
+def reload_asl_model(model_type):
+    """Start reloading an ASL model in the background, even if its artifact did not change."""
+    return get_asl_predictor().registry.reload(model_type)
+
+
+class FrameResult:
+    """Output of `process_frame`, sent back from the worker to the event loop."""
+
+    def __init__(self, data, image=None, landmarks=None, durations=None):
+        """
+        Args:
+            data: Response data dict
+            image: Encoded annotated JPEG, or None in landmarks response mode
+            landmarks: Landmarks array of shape (hands, 21, 3) in landmarks
+                response mode, otherwise None
+            durations: Seconds spent in each pipeline stage
+        """
+        self.data = data
+        self.image = image
+        self.landmarks = landmarks
+        self.durations = durations or {}
+
+
+def process_frame(session_id, image_bytes, options):
+    """
+    Decode, analyze and annotate a single frame.
+
+    Frames of one session are processed one at a time, so the session's
+    leased detector is never used concurrently.
+
+    Args:
+        session_id: Identifier of the session the frame belongs to
+        image_bytes: Encoded JPEG frame
+        options: Session options (see `FrameSession.frame_options`)
+
+    Returns:
+        FrameResult: The response data plus either the annotated JPEG or,
+            in landmarks response mode, the landmarks for the client to draw
+    """
+    start_time = time.perf_counter()
+    timer = StageTimer()
+    session = get_worker_session(session_id)
+    enable_asl = options["enable_asl"]
+    landmarks_only = options["response_mode"] == RESPONSE_MODE_LANDMARKS
+
+    # Decode straight to the processing resolution; later stages reuse the session's buffers
+    buffers = session.buffers
+    with timer.stage("decode"):
+        frame = decode_frame(image_bytes, options["processing_width"], buffers)
+
+    # Reuse the previous detection while the scene is static
+    scene = session.scene
+    results = None
+    thumbnail = None
+    if options["scene_gate"]:
+        with timer.stage("scene_gating"):
+            thumbnail = scene.thumbnail(frame, buffers)
+            results = scene.check(thumbnail)
+    else:
+        scene.reset()
+    scene_static = results is not None
+
+    # Between keyframes, propagate the previous landmarks with optical flow
+    tracker = session.tracker
+    tracker.keyframe_interval = options["keyframe_interval"]
+    gray = None
+    if tracker.keyframe_interval > 1 and not scene_static:
+        with timer.stage("color_conversion"):
+            # The tracker keeps the previous frame's gray image, so alternate two buffers
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=buffers.swap("gray", frame.shape[:2]))
+        if not tracker.keyframe_due():
+            with timer.stage("tracking"):
+                results = tracker.track(gray)
+
+    # Run full detection with MediaPipe on keyframes; each hand is converted
+    # once into the session's landmark arrays, which all later stages use
+    keyframe = results is None
+    region = session.region
+    roi_detection = False
+    if keyframe:
+        if options["roi"] and region.box is not None:
+            # Look for the hand around its previous position first
+            with timer.stage("color_conversion"):
+                crop = region.crop(frame, buffers)
+                rgb_crop = cv2.cvtColor(crop, cv2.COLOR_BGR2RGB, dst=buffers.get("rgb_crop", crop.shape))
+            with timer.stage("mediapipe"):
+                results = hand_results(session.detector.process(rgb_crop), session.landmark_buffer)
+                roi_detection = bool(results.hands)
+                if roi_detection:
+                    region.map_to_frame(results, frame.shape)
+        if not roi_detection:
+            with timer.stage("color_conversion"):
+                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=buffers.get("rgb", frame.shape))
+            with timer.stage("mediapipe"):
+                results = hand_results(session.detector.process(rgb_frame), session.landmark_buffer)
+        if gray is not None:
+            with timer.stage("tracking"):
+                tracker.update_keyframe(gray, results)
+
+    if thumbnail is not None and not scene_static:
+        scene.update(thumbnail, results)
+
+    # Remember where the hand is for the next frame
+    if options["roi"]:
+        region.update(results, frame.shape)
+    else:
+        region.reset()
+
+    hand_detected = False
+    finger_count = 0
+    lifted_fingers = []
+    handedness_label = None
+    hand_view = None
+    asl_letter = None
+    asl_probabilities = None
+    asl_model_version = None
+    hand_arrays = []
+    motion_gated = False
+
+    # Only a single hand can be compared with the previously analyzed one
+    gate = session.motion_gate
+    gating = options["motion_gate"] and len(results.hands) == 1
+    if not gating:
+        gate.reset()
+
+    if results.hands:
+        hand_detected = True
+
+        for hand_array in results.hands:
+            hand_arrays.append(hand_array)
+            if not landmarks_only:
+                # Draw landmarks on the frame
+                with timer.stage("drawing"):
+                    draw_hand(frame, hand_array, mp_hands.HAND_CONNECTIONS)
+
+            handedness_label = get_corrected_handedness(results)
+
+            # Reuse the last analysis while the hand has not moved
+            gate_key = (handedness_label, enable_asl, options["model_type"], options["top_k"])
+            previous = None
+            if gating:
+                with timer.stage("motion_gating"):
+                    previous = gate.check(hand_array, gate_key)
+
+            if previous is not None:
+                motion_gated = True
+                (finger_count, lifted_fingers, hand_view,
+                 asl_letter, asl_probabilities, asl_model_version) = previous
+            else:
+                # Count fingers and get the hand view
+                with timer.stage("finger_counting"):
+                    hand_view = get_hand_view(hand_array, handedness_label)
+                    finger_count, lifted_fingers = count_fingers(hand_array, handedness_label, hand_view)
+
+                # Extract landmarks and predict ASL letter if enabled
+                if enable_asl:
+                    asl_predictor = get_asl_predictor()
+                    model_type = options["model_type"]
+                    try:
+                        # Pin the model so a reload cannot swap it between the two stages
+                        asl_model = asl_predictor.get_model(model_type)
+                        asl_model_version = asl_model.version
+                        with timer.stage("asl_featurization"):
+                            features = asl_predictor.featurize(hand_array, model=asl_model)
+                        with timer.stage("asl_inference"):
+                            asl_letter, asl_probabilities = asl_predictor.classify(
+                                hand_array, top_k=options["top_k"], features=features, model=asl_model
+                            )
+                    except ModelUnavailable:
+                        # Keep tracking hands without ASL when a model cannot be loaded
+                        asl_letter, asl_probabilities = None, None
+
+                if gating:
+                    gate.update(hand_array, gate_key, (
+                        finger_count, lifted_fingers, hand_view,
+                        asl_letter, asl_probabilities, asl_model_version
+                    ))
+
+    # Prepare response data
+    response_data = {
+        "hand_detected": hand_detected,
+        "finger_count": finger_count,
+        "hand_view": hand_view,
+        "handedness": handedness_label,
+        "lifted_fingers": lifted_fingers,
+        "keyframe": keyframe,
+        "roi_detection": roi_detection,
+        "scene_static": scene_static,
+        "motion_gated": motion_gated,
+        "frame_size": [frame.shape[1], frame.shape[0]]
+    }
+
+    # Add ASL prediction data if enabled
+    if enable_asl:
+        response_data.update({
+            "asl_letter": asl_letter,
+            "asl_probabilities": asl_probabilities,
+            "asl_model_version": asl_model_version
+        })
+
+    # Hand sampled frames to the background writer if enabled
+    if SAVE_IMAGES and hand_detected:
+        capture_writer = get_capture_writer()
+        if capture_writer.sample():
+            capture_writer.submit(
+                # The frame lives in a session buffer that the next frame overwrites
+                image=frame.copy() if capture_writer.wants_image() else None,
+                landmarks=np.stack(hand_arrays) if capture_writer.wants_landmarks() else None,
+                metadata={
+                    "session_id": session_id,
+                    "handedness": handedness_label,
+                    "hand_view": hand_view,
+                    "lifted_fingers": lifted_fingers,
+                    "asl_letter": asl_letter
+                }
+            )
+
+    if landmarks_only:
+        result = FrameResult(
+            response_data,
+            landmarks=np.stack(hand_arrays) if hand_arrays else np.empty((0, 21, 3), np.float32)
+        )
+    else:
+        # Encode the annotated frame for sending
+        with timer.stage("encoding"):
+            _, buffer = cv2.imencode('.jpg', frame)
+        result = FrameResult(response_data, image=buffer)
+
+    response_data["processing_ms"] = round((time.perf_counter() - start_time) * 1000, 1)
+    if options["include_timings"]:
+        response_data["timings"] = timer.as_milliseconds()
+    result.durations = timer.durations
+    return result
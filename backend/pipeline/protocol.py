@@ -0,0 +1,141 @@
+"""WebSocket frame protocol helpers.
+
+Two protocols are supported on the `/ws` endpoint:
+
+- ``json`` (legacy): frames travel as `data:image/jpeg;base64,...` strings
+  inside JSON messages, in both directions.
+- ``binary``: the client sends raw JPEG bytes as binary WebSocket messages
+  and receives a binary envelope in return.
+
+Independently of the protocol, a session can ask for the ``landmarks``
+response mode, in which the server skips drawing and JPEG encoding and
+returns the hand landmarks for the client to draw instead.
+
+The binary envelope layout (all integers little endian) is::
+
+    offset  size  field
+    0       2     magic (b"GZ")
+    2       1     protocol version
+    3       1     flags (bit 0: JPEG payload, bit 1: landmarks payload)
+    4       4     metadata length
+    8       4     payload length
+    12      ...   metadata (UTF-8 JSON with the result fields)
+    ...     ...   payload
+
+The landmarks payload is a float32 array of shape (hands, 21, 3) holding
+normalized x, y, z coordinates.
+"""
+import base64
+import json
+import struct
+import numpy as np
+
+PROTOCOL_JSON = "json"
+PROTOCOL_BINARY = "binary"
+SUPPORTED_PROTOCOLS = (PROTOCOL_JSON, PROTOCOL_BINARY)
+
+RESPONSE_MODE_IMAGE = "image"
+RESPONSE_MODE_LANDMARKS = "landmarks"
+SUPPORTED_RESPONSE_MODES = (RESPONSE_MODE_IMAGE, RESPONSE_MODE_LANDMARKS)
+
+BINARY_PROTOCOL_VERSION = 1
+MAGIC = b"GZ"
+FLAG_IMAGE = 0x01
+FLAG_LANDMARKS = 0x02
+
+_HEADER = struct.Struct("<2sBBII")
+HEADER_SIZE = _HEADER.size
+
+
+def decode_data_url(data_url):
+    """
+    Decode a base64 data URL into raw bytes.
+
+    Args:
+        data_url: String such as `data:image/jpeg;base64,...`
+
+    Returns:
+        bytes: The decoded payload
+    """
+    return base64.b64decode(data_url.split(",", 1)[1])
+
+
+def encode_data_url(jpeg_bytes):
+    """
+    Encode JPEG bytes as a base64 data URL.
+
+    Args:
+        jpeg_bytes: Encoded JPEG image (bytes or any buffer)
+
+    Returns:
+        str: The `data:image/jpeg;base64,...` string
+    """
+    return f"data:image/jpeg;base64,{base64.b64encode(jpeg_bytes).decode('utf-8')}"
+
+
+def pack_frame(metadata, image=None, landmarks=None):
+    """
+    Pack a frame result into a binary envelope.
+
+    Args:
+        metadata: Dictionary with the result fields
+        image: Optional encoded JPEG (bytes or any buffer)
+        landmarks: Optional landmarks array of shape (hands, 21, 3),
+            used when no image is sent
+
+    Returns:
+        bytes: The binary envelope
+    """
+    meta_bytes = json.dumps(metadata, separators=(",", ":")).encode("utf-8")
+    if image is not None:
+        flags, payload = FLAG_IMAGE, memoryview(image).cast("B")
+    elif landmarks is not None:
+        flags, payload = FLAG_LANDMARKS, np.ascontiguousarray(landmarks, dtype="<f4").tobytes()
+    else:
+        flags, payload = 0, b""
+    header = _HEADER.pack(MAGIC, BINARY_PROTOCOL_VERSION, flags, len(meta_bytes), len(payload))
+    return b"".join((header, meta_bytes, payload))
+
+
+def unpack_frame(payload):
+    """
+    Unpack a binary envelope produced by `pack_frame`.
+
+    Args:
+        payload: The binary envelope
+
+    Returns:
+        tuple: (metadata dict, JPEG bytes or None, landmarks array or None)
+
+    Raises:
+        ValueError: If the payload is not a valid envelope
+    """
+    if len(payload) < HEADER_SIZE:
+        raise ValueError("Payload too short for binary frame header")
+    magic, version, flags, meta_len, body_len = _HEADER.unpack_from(payload)
+    if magic != MAGIC:
+        raise ValueError(f"Invalid binary frame magic: {magic!r}")
+    if version != BINARY_PROTOCOL_VERSION:
+        raise ValueError(f"Unsupported binary frame version: {version}")
+
+    meta_end = HEADER_SIZE + meta_len
+    metadata = json.loads(bytes(payload[HEADER_SIZE:meta_end]).decode("utf-8"))
+    body = bytes(payload[meta_end:meta_end + body_len])
+    image = body if flags & FLAG_IMAGE else None
+    landmarks = np.frombuffer(body, dtype="<f4").reshape(-1, 21, 3) if flags & FLAG_LANDMARKS else None
+    return metadata, image, landmarks
+
+
+def landmarks_to_list(landmarks, decimals=4):
+    """
+    Convert a landmarks array into compact JSON-friendly lists.
+
+    Args:
+        landmarks: Array of shape (hands, 21, 3)
+        decimals: Number of decimals to keep
+
+    Returns:
+        list: One flat list of 63 floats per hand
+    """
+    # reshape(-1, 63) also works for frames without hands, unlike reshape(0, -1)
+    return np.round(landmarks.reshape(-1, 21 * 3), decimals).tolist()
@@ -0,0 +1,90 @@
+"""
+Region-of-interest cropping around the previously detected hand.
+
+Between consecutive frames a hand moves little and usually covers a small
+part of the picture, so detection runs on a padded square crop around the
+previous hand, downscaled to a small size, instead of on the full frame.
+Landmarks found in the crop are mapped back to full-frame coordinates.
+"""
+import cv2
+import numpy as np
+
+
+class HandRegion:
+    """Per-session region of interest derived from the previous hand landmarks."""
+
+    def __init__(self, padding: float = 0.5, max_size: int = 320, min_size: int = 96):
+        """Initialize the region.
+
+        Args:
+            padding: Fraction of the hand box size added on each side
+            max_size: Longest side, in pixels, of the crop passed to the detector
+            min_size: Smallest side, in frame pixels, of the region
+        """
+        self.padding = padding
+        self.max_size = max_size
+        self.min_size = min_size
+        self.box = None  # (x0, y0, x1, y1) in frame pixels
+
+    def reset(self):
+        """Forget the region, forcing full-frame detection on the next frame."""
+        self.box = None
+
+    def update(self, results, frame_shape):
+        """Derive the next region from the landmarks of the current frame.
+
+        Args:
+            results: `HandResults` with landmarks in full-frame coordinates
+            frame_shape: Shape of the full frame
+        """
+        if not results.hands:
+            self.box = None
+            return
+
+        height, width = frame_shape[:2]
+        # In float64, like the landmark attributes this used to read
+        points = np.concatenate([hand[:, :2] for hand in results.hands]).astype(np.float64)
+        points *= (width, height)
+        (x_min, y_min), (x_max, y_max) = points.min(axis=0), points.max(axis=0)
+
+        # Square box centered on the hand, padded on each side
+        side = max(x_max - x_min, y_max - y_min) * (1 + 2 * self.padding)
+        side = min(max(side, self.min_size), width, height)
+        center_x, center_y = (x_min + x_max) / 2, (y_min + y_max) / 2
+        x0 = int(np.clip(center_x - side / 2, 0, width - side))
+        y0 = int(np.clip(center_y - side / 2, 0, height - side))
+        self.box = (x0, y0, x0 + int(side), y0 + int(side))
+
+    def crop(self, frame, buffers=None):
+        """Cut the region out of a frame, downscaled to at most `max_size`.
+
+        Args:
+            frame: Full BGR frame
+            buffers: Optional session `FrameBuffers` to downscale into
+
+        Returns:
+            np.ndarray: The cropped (and possibly resized) image
+        """
+        x0, y0, x1, y1 = self.box
+        crop = frame[y0:y1, x0:x1]
+        if crop.shape[0] > self.max_size:
+            dst = buffers.get("crop", (self.max_size, self.max_size, 3)) if buffers is not None else None
+            crop = cv2.resize(crop, (self.max_size, self.max_size), dst=dst, interpolation=cv2.INTER_AREA)
+        return crop
+
+    def map_to_frame(self, results, frame_shape):
+        """Convert landmarks detected in the crop to full-frame coordinates, in place.
+
+        Args:
+            results: `HandResults` detected on `crop(frame)`
+            frame_shape: Shape of the full frame
+        """
+        height, width = frame_shape[:2]
+        x0, y0, x1, y1 = self.box
+        scale = np.array([(x1 - x0) / width, (y1 - y0) / height])
+        offset = np.array([x0 / width, y0 / height])
+        for hand in results.hands:
+            # Computed in float64 and rounded once to float32, as before
+            hand[:, :2] = offset + hand[:, :2].astype(np.float64) * scale
+            # MediaPipe expresses z on roughly the same scale as x
+            hand[:, 2] = hand[:, 2].astype(np.float64) * scale[0]
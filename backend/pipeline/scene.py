@@ -0,0 +1,92 @@
+"""
+Frame-difference gating of hand detection.
+
+Always-on cameras mostly look at a static scene: an empty room, or a hand
+held still. A small grayscale thumbnail of each frame is compared with the
+thumbnail of the last frame that went through detection; while too few
+pixels changed, the previous detection results are reused instead of
+running MediaPipe again.
+"""
+import cv2
+import numpy as np
+
+
+class SceneChangeGate:
+    """Per-session memory of the last detected frame, as a downsampled thumbnail."""
+
+    def __init__(self, width=64, pixel_threshold=15, changed_ratio=0.002, max_frames=15):
+        """Initialize the gate.
+
+        Args:
+            width: Width, in pixels, of the thumbnails that are compared
+            pixel_threshold: Gray level difference above which a thumbnail pixel counts as changed
+            changed_ratio: Fraction of changed pixels above which the scene counts as changed
+            max_frames: Run detection at least every N frames, even on a static scene
+        """
+        self.width = width
+        self.pixel_threshold = pixel_threshold
+        self.changed_ratio = changed_ratio
+        self.max_frames = max_frames
+        self.reference = None
+        self.results = None
+        self.reused = 0
+
+    def reset(self):
+        """Forget the reference frame, forcing detection on the next frame."""
+        self.reference = None
+        self.results = None
+        self.reused = 0
+
+    def thumbnail(self, frame, buffers=None):
+        """Return the grayscale thumbnail the gate compares.
+
+        Args:
+            frame: Full BGR frame
+            buffers: Optional session `FrameBuffers` to write the thumbnail into
+
+        Returns:
+            np.ndarray: uint8 grayscale thumbnail `width` pixels wide
+        """
+        height = max(1, round(frame.shape[0] * self.width / frame.shape[1]))
+        small, gray = None, None
+        if buffers is not None:
+            small = buffers.get("thumbnail_bgr", (height, self.width, 3))
+            gray = buffers.get("thumbnail", (height, self.width))
+        small = cv2.resize(frame, (self.width, height), dst=small, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGR2GRAY, dst=gray)
+
+    def check(self, thumbnail):
+        """Return the previous detection results if the scene has not changed.
+
+        Args:
+            thumbnail: Thumbnail of the current frame (see `thumbnail`)
+
+        Returns:
+            The previous hands results, or None if detection must run
+        """
+        if (
+            self.results is None
+            or self.reference.shape != thumbnail.shape
+            or self.reused >= self.max_frames
+        ):
+            return None
+        changed = np.count_nonzero(cv2.absdiff(thumbnail, self.reference) > self.pixel_threshold)
+        if changed > self.changed_ratio * thumbnail.size:
+            return None
+        self.reused += 1
+        return self.results
+
+    def update(self, thumbnail, results):
+        """Remember the thumbnail and results of a frame that went through detection.
+
+        Args:
+            thumbnail: Thumbnail of the detected frame
+            results: Hands results of the frame
+        """
+        # The thumbnail may be a buffer that the next frame overwrites
+        if self.reference is None or self.reference.shape != thumbnail.shape:
+            self.reference = thumbnail.copy()
+        else:
+            np.copyto(self.reference, thumbnail)
+        self.results = results
+        self.reused = 0
@@ -0,0 +1,98 @@
+"""
+Per-connection state for the `/ws` endpoint.
+"""
+import asyncio
+from backend_config import (
+    WEBSOCKET_DEFAULT_PROTOCOL, WEBSOCKET_DEFAULT_RESPONSE_MODE,
+    ENABLE_ASL_PREDICTION, ASL_MODEL_TYPE, ASL_TOP_K, KEYFRAME_INTERVAL,
+    ROI_ENABLED, PROCESSING_MAX_WIDTH, PROCESSING_MIN_WIDTH, CAPTURE_JPEG_QUALITY,
+    METRICS_INCLUDE_TIMINGS, SCENE_GATE_ENABLED, MOTION_GATE_ENABLED
+)
+from .frame_queue import LatestFrameQueue
+from .protocol import SUPPORTED_RESPONSE_MODES
+
+
+class FrameSession:
+    """Settings and queues of a single WebSocket client."""
+
+    def __init__(self, session_id: int, on_drop=None):
+        """Initialize a session with the configured defaults.
+
+        Args:
+            session_id: Unique session identifier
+            on_drop: Optional callback invoked whenever a stale frame is dropped
+        """
+        self.session_id = session_id
+        self.protocol = WEBSOCKET_DEFAULT_PROTOCOL
+        self.enable_asl = ENABLE_ASL_PREDICTION
+        self.model_type = ASL_MODEL_TYPE
+        self.response_mode = WEBSOCKET_DEFAULT_RESPONSE_MODE
+        self.top_k = ASL_TOP_K
+        self.keyframe_interval = KEYFRAME_INTERVAL
+        self.roi = ROI_ENABLED
+        self.scene_gate = SCENE_GATE_ENABLED
+        self.motion_gate = MOTION_GATE_ENABLED
+        self.processing_width = PROCESSING_MAX_WIDTH
+        self.jpeg_quality = CAPTURE_JPEG_QUALITY
+        self.include_timings = METRICS_INCLUDE_TIMINGS
+        self.frames = LatestFrameQueue(on_drop)
+        self.send_lock = asyncio.Lock()  # Receive and process tasks both send
+
+    def update(self, data):
+        """Apply the settings found in a client control message.
+
+        Args:
+            data: Decoded JSON message from the client
+        """
+        if "enable_asl" in data:
+            self.enable_asl = data["enable_asl"]
+        if "model_type" in data:
+            self.model_type = data["model_type"]
+        if data.get("response_mode") in SUPPORTED_RESPONSE_MODES:
+            self.response_mode = data["response_mode"]
+        if "top_k" in data:
+            self.top_k = int(data["top_k"]) if data["top_k"] else None
+        if "keyframe_interval" in data:
+            self.keyframe_interval = max(1, int(data["keyframe_interval"]))
+        if "roi" in data:
+            self.roi = bool(data["roi"])
+        if "scene_gate" in data:
+            self.scene_gate = bool(data["scene_gate"])
+        if "motion_gate" in data:
+            self.motion_gate = bool(data["motion_gate"])
+        if "processing_width" in data:
+            # 0 or null falls back to the default; clients may not exceed the configured maximum
+            width = int(data["processing_width"]) if data["processing_width"] else PROCESSING_MAX_WIDTH
+            if width is not None and PROCESSING_MAX_WIDTH is not None:
+                width = min(width, PROCESSING_MAX_WIDTH)
+            self.processing_width = max(PROCESSING_MIN_WIDTH, width) if width is not None else None
+        if "jpeg_quality" in data:
+            self.jpeg_quality = min(max(float(data["jpeg_quality"]), 0.1), 1.0)
+        if "timings" in data:
+            self.include_timings = bool(data["timings"])
+
+    def capture_settings(self):
+        """Return the capture size and JPEG quality the client should send frames with.
+
+        Frames wider than the processing width would only be downscaled on
+        arrival, so the client is asked not to send them in the first place.
+        """
+        return {
+            "width": self.processing_width,
+            "jpeg_quality": self.jpeg_quality
+        }
+
+    def frame_options(self):
+        """Return the picklable options passed to `process_frame`."""
+        return {
+            "enable_asl": self.enable_asl,
+            "model_type": self.model_type,
+            "response_mode": self.response_mode,
+            "top_k": self.top_k,
+            "keyframe_interval": self.keyframe_interval,
+            "roi": self.roi,
+            "scene_gate": self.scene_gate,
+            "motion_gate": self.motion_gate,
+            "processing_width": self.processing_width,
+            "include_timings": self.include_timings
+        }
@@ -0,0 +1,106 @@
+"""
+Keyframe-based hand tracking.
+
+Full MediaPipe detection only runs on keyframes. In between, the 21
+landmarks of each hand are propagated with pyramidal Lucas-Kanade optical
+flow, which costs a fraction of a detection. Tracking is abandoned (and a
+keyframe forced) as soon as too many points are lost or the flow error
+grows, so drift never outlives a single frame of low confidence.
+"""
+import cv2
+import numpy as np
+from .hands import HandResults
+
+_LK_PARAMS = dict(
+    winSize=(21, 21),
+    maxLevel=3,
+    criteria=(cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 20, 0.03)
+)
+
+
+class KeyframeTracker:
+    """Propagates hand landmarks between full detections."""
+
+    def __init__(self, keyframe_interval: int = 1, min_tracked_ratio: float = 0.9,
+                 max_flow_error: float = 20.0):
+        """Initialize the tracker.
+
+        Args:
+            keyframe_interval: Run full detection every N frames (1 disables tracking)
+            min_tracked_ratio: Minimum share of landmarks optical flow must keep
+            max_flow_error: Maximum mean optical flow error of tracked landmarks
+        """
+        self.keyframe_interval = keyframe_interval
+        self.min_tracked_ratio = min_tracked_ratio
+        self.max_flow_error = max_flow_error
+        self.keyframes = 0
+        self.tracked_frames = 0
+        self.tracking_failures = 0
+        self.reset()
+
+    def reset(self):
+        """Forget the tracked hands, forcing a keyframe on the next frame."""
+        self._prev_gray = None
+        self._hands = []
+        self._handedness = None
+        self._since_keyframe = 0
+
+    def keyframe_due(self):
+        """Return True if the next frame must run full detection."""
+        return (
+            self.keyframe_interval <= 1
+            or not self._hands
+            or self._since_keyframe + 1 >= self.keyframe_interval
+        )
+
+    def update_keyframe(self, gray, results):
+        """Use a full detection as the new tracking reference.
+
+        Args:
+            gray: Grayscale version of the detected frame
+            results: `HandResults` of the frame
+        """
+        self._prev_gray = gray
+        self._since_keyframe = 0
+        self.keyframes += 1
+        # The caller's arrays are overwritten by the next detection
+        self._hands = [hand.copy() for hand in results.hands]
+        self._handedness = results.multi_handedness if results.hands else None
+
+    def track(self, gray):
+        """Propagate the tracked hands to a new frame.
+
+        Args:
+            gray: Grayscale version of the new frame
+
+        Returns:
+            HandResults, or None if tracking was lost and a keyframe is needed
+        """
+        height, width = gray.shape[:2]
+        scale = np.array([width, height], dtype=np.float32)
+
+        tracked = []
+        for hand in self._hands:
+            prev_points = np.ascontiguousarray(hand[:, :2] * scale).reshape(-1, 1, 2)
+            next_points, status, error = cv2.calcOpticalFlowPyrLK(
+                self._prev_gray, gray, prev_points, None, **_LK_PARAMS
+            )
+            ok = status.ravel() == 1
+            if ok.mean() < self.min_tracked_ratio or error.ravel()[ok].mean() > self.max_flow_error:
+                self.tracking_failures += 1
+                self.reset()
+                return None
+
+            # Lost points follow the mean motion of the tracked ones
+            motion = (next_points - prev_points).reshape(-1, 2)
+            motion[~ok] = motion[ok].mean(axis=0)
+
+            propagated = hand.copy()
+            propagated[:, :2] += motion / scale
+            tracked.append(propagated)
+
+        self._hands = tracked
+        self._prev_gray = gray
+        self._since_keyframe += 1
+        self.tracked_frames += 1
+        return HandResults(tracked, self._handedness)
@@ -0,0 +1,55 @@
+"""
+Per-session state kept inside the worker that processes the session's frames.
+"""
+import numpy as np
+from backend_config import (
+    KEYFRAME_MIN_TRACKED_RATIO, KEYFRAME_MAX_FLOW_ERROR,
+    ROI_PADDING, ROI_MAX_SIZE, ROI_MIN_SIZE, SCENE_GATE_WIDTH, SCENE_GATE_PIXEL_THRESHOLD,
+    SCENE_GATE_CHANGED_RATIO, SCENE_GATE_MAX_FRAMES, MOTION_GATE_THRESHOLD, MOTION_GATE_MAX_FRAMES
+)
+from .buffers import FrameBuffers
+from .motion import MotionGate
+from .scene import SceneChangeGate
+from .roi import HandRegion
+from .tracking import KeyframeTracker
+
+
+class WorkerSession:
+    """Worker-side resources and tracking state of one WebSocket session."""
+
+    def __init__(self, session_id: int, detector):
+        """Initialize the session state.
+
+        Args:
+            session_id: Identifier of the session
+            detector: Hand detector leased to the session
+        """
+        self.session_id = session_id
+        self.detector = detector
+        self.tracker = KeyframeTracker(
+            min_tracked_ratio=KEYFRAME_MIN_TRACKED_RATIO,
+            max_flow_error=KEYFRAME_MAX_FLOW_ERROR
+        )
+        self.region = HandRegion(
+            padding=ROI_PADDING,
+            max_size=ROI_MAX_SIZE,
+            min_size=ROI_MIN_SIZE
+        )
+        self.scene = SceneChangeGate(
+            width=SCENE_GATE_WIDTH,
+            pixel_threshold=SCENE_GATE_PIXEL_THRESHOLD,
+            changed_ratio=SCENE_GATE_CHANGED_RATIO,
+            max_frames=SCENE_GATE_MAX_FRAMES
+        )
+        self.motion_gate = MotionGate(
+            threshold=MOTION_GATE_THRESHOLD,
+            max_frames=MOTION_GATE_MAX_FRAMES
+        )
+        self.buffers = FrameBuffers()
+        self.landmark_buffers = []
+
+    def landmark_buffer(self, index):
+        """Return the preallocated (21, 3) float32 landmarks array of the index-th hand."""
+        while len(self.landmark_buffers) <= index:
+            self.landmark_buffers.append(np.empty((21, 3), dtype=np.float32))
+        return self.landmark_buffers[index]
@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+import numpy as np
+from inference.cache import PredictionCache
+
+MODEL = SimpleNamespace(model_type="online", version="abc123")
+
+
+def features(*offsets):
+    values = np.full((1, 42), 0.5)
+    values[0, :len(offsets)] += offsets
+    return values
+
+
+def test_exact_hit():
+    cache = PredictionCache(step=0.01)
+    cache.put(cache.key(MODEL, features()), "A")
+    assert cache.get(cache.key(MODEL, features(0.001))) == "A"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["neighbor_hits"] == 0
+
+
+def test_adjacent_cell_is_a_neighbor_hit():
+    cache = PredictionCache(step=0.01)
+    cache.put(cache.key(MODEL, features()), "A")
+    assert cache.get(cache.key(MODEL, features(0.01, -0.01))) == "A"
+    stats = cache.stats()
+    assert (stats["hits"], stats["neighbor_hits"], stats["misses"]) == (1, 1, 0)
+
+
+def test_cells_further_away_miss():
+    cache = PredictionCache(step=0.01)
+    cache.put(cache.key(MODEL, features()), "A")
+    assert cache.get(cache.key(MODEL, features(0.02))) is None
+    assert cache.stats()["misses"] == 1
+
+
+def test_neighbors_of_another_model_version_miss():
+    cache = PredictionCache(step=0.01)
+    cache.put(cache.key(MODEL, features()), "A")
+    other = SimpleNamespace(model_type="online", version="def456")
+    assert cache.get(cache.key(other, features())) is None
+    assert cache.get(cache.key(other, features(0.01))) is None
+
+
+def test_only_recent_entries_are_checked_for_neighbors():
+    cache = PredictionCache(step=0.01, neighbors=1)
+    cache.put(cache.key(MODEL, features()), "A")
+    cache.put(cache.key(MODEL, features(0.2)), "B")
+    assert cache.get(cache.key(MODEL, features(0.01))) is None
+    assert cache.get(cache.key(MODEL, features(0.21))) == "B"
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PredictionCache(max_size=2, step=0.01, neighbors=0)
+    for index, letter in enumerate("ABC"):
+        cache.put(cache.key(MODEL, features(index * 0.1)), letter)
+    assert cache.get(cache.key(MODEL, features())) is None
+    assert cache.get(cache.key(MODEL, features(0.2))) == "C"
+    assert cache.stats()["size"] == 2
@@ -0,0 +1,65 @@
+import os
+import time
+
+import numpy as np
+from pipeline.capture import SAVE_MODE_LANDMARKS, CaptureWriter
+
+
+def write(path, size, mtime):
+    with open(path, "wb") as f:
+        f.write(b"\0" * size)
+    os.utime(path, (mtime, mtime))
+
+
+def wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_rotation_deletes_the_oldest_captures(tmp_path):
+    now = time.time()
+    write(tmp_path / "hand_1.json", 1000, now - 30)
+    write(tmp_path / "hand_2.json", 1000, now - 20)
+    write(tmp_path / "hand_3.json", 1000, now - 10)
+    writer = CaptureWriter(str(tmp_path), mode=SAVE_MODE_LANDMARKS, max_bytes=2500)
+    assert writer.stats()["files"] == 3
+
+    # The new capture takes the directory over budget by less than one old file
+    writer.submit(landmarks=np.zeros((1, 21, 3), np.float32))
+    wait_for(lambda: writer.stats()["deleted"] == 1)
+
+    names = os.listdir(tmp_path)
+    assert "hand_1.json" not in names
+    assert "hand_2.json" in names and "hand_3.json" in names
+    assert writer.stats()["files"] == 3
+    assert writer.stats()["bytes"] <= 2500
+
+
+def test_rotation_deletes_captures_older_than_max_age(tmp_path):
+    now = time.time()
+    write(tmp_path / "hand_old.jpg", 10, now - 120)
+    write(tmp_path / "hand_new.jpg", 10, now)
+    writer = CaptureWriter(str(tmp_path), mode=SAVE_MODE_LANDMARKS, max_age=60)
+
+    writer.submit(landmarks=np.zeros((1, 21, 3), np.float32))
+    wait_for(lambda: writer.stats()["deleted"] == 1)
+
+    assert not (tmp_path / "hand_old.jpg").exists()
+    assert (tmp_path / "hand_new.jpg").exists()
+
+
+def test_rotation_leaves_other_files_alone(tmp_path):
+    old = time.time() - 3600
+    write(tmp_path / "notes.json", 1000, old)
+    write(tmp_path / "photo.jpg", 1000, old)
+    writer = CaptureWriter(str(tmp_path), mode=SAVE_MODE_LANDMARKS, max_bytes=1, max_age=60)
+    assert writer.stats()["files"] == 0
+
+    writer.submit(landmarks=np.zeros((1, 21, 3), np.float32))
+    # The new capture alone is over budget and is deleted right away
+    wait_for(lambda: writer.stats()["deleted"] == 1)
+
+    assert writer.stats()["written"] == 1
+    assert (tmp_path / "notes.json").exists()
+    assert (tmp_path / "photo.jpg").exists()
@@ -0,0 +1,37 @@
+import cv2
+import numpy as np
+import pytest
+from pipeline.buffers import FrameBuffers
+from pipeline.decode import decode_frame, jpeg_dimensions
+
+
+def jpeg(width, height):
+    image = np.random.default_rng(0).integers(0, 255, (height, width, 3), dtype=np.uint8)
+    return cv2.imencode(".jpg", image)[1].tobytes()
+
+
+def test_jpeg_dimensions():
+    assert jpeg_dimensions(jpeg(640, 480)) == (640, 480)
+    assert jpeg_dimensions(cv2.imencode(".png", np.zeros((4, 4, 3), np.uint8))[1].tobytes()) is None
+
+
+@pytest.mark.parametrize("max_width, shape", [
+    (None, (480, 640, 3)),
+    (640, (480, 640, 3)),
+    (320, (240, 320, 3)),
+    (200, (150, 200, 3)),
+    (1280, (480, 640, 3)),
+])
+def test_decode_frame_is_at_most_max_width(max_width, shape):
+    assert decode_frame(jpeg(640, 480), max_width).shape == shape
+
+
+def test_decode_frame_resizes_into_the_session_buffer():
+    buffers = FrameBuffers()
+    frame = decode_frame(jpeg(640, 480), 200, buffers)
+    assert frame is buffers.get("frame", (150, 200, 3))
+
+
+def test_decode_frame_rejects_invalid_data():
+    with pytest.raises(ValueError):
+        decode_frame(b"not an image", 320)
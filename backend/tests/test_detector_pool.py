@@ -0,0 +1,54 @@
+import time
+
+import pytest
+from pipeline.detector_pool import DetectorPoolExhausted, HandsDetectorPool
+
+
+class FakeDetector:
+    def __init__(self):
+        self.resets = 0
+        self.closed = False
+
+    def reset(self):
+        self.resets += 1
+
+    def close(self):
+        self.closed = True
+
+
+def test_session_keeps_its_detector():
+    pool = HandsDetectorPool(FakeDetector, max_size=2)
+    detector = pool.lease(1)
+    assert pool.lease(1) is detector
+    assert pool.lease(2) is not detector
+    assert detector.resets == 0
+
+
+def test_released_detector_is_reset_before_reuse():
+    pool = HandsDetectorPool(FakeDetector, max_size=1)
+    detector = pool.lease(1)
+    pool.release(1)
+
+    assert pool.lease(2) is detector
+    assert detector.resets == 1
+    assert pool.stats()["created"] == 1
+
+
+def test_pool_exhausted():
+    pool = HandsDetectorPool(FakeDetector, max_size=1)
+    pool.lease(1)
+    with pytest.raises(DetectorPoolExhausted):
+        pool.lease(2)
+
+
+def test_idle_detectors_are_closed_after_the_timeout():
+    pool = HandsDetectorPool(FakeDetector, max_size=1, idle_timeout=0.05)
+    detector = pool.lease(1)
+    pool.release(1)
+    assert not detector.closed
+
+    time.sleep(0.1)
+    assert pool.stats()["idle"] == 0
+    assert detector.closed
+    assert pool.stats()["evicted"] == 1
+    assert pool.lease(2) is not detector
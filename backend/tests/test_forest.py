@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from sklearn.ensemble import ExtraTreesClassifier, RandomForestClassifier
+from inference.forest import CompiledForest, compile_forest
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    X = rng.random((300, 42))
+    y = (X[:, 0] * 4).astype(int) + (X[:, 1] > 0.5)
+    return X, y
+
+
+@pytest.mark.parametrize("forest_class", [RandomForestClassifier, ExtraTreesClassifier])
+def test_compiled_forest_matches_sklearn(data, forest_class):
+    X, y = data
+    forest = forest_class(n_estimators=15, max_depth=8, random_state=0).fit(X, y)
+    compiled = CompiledForest(forest)
+
+    np.testing.assert_array_equal(compiled.predict_proba(X), forest.predict_proba(X))
+    np.testing.assert_array_equal(compiled.predict(X), forest.predict(X))
+    np.testing.assert_array_equal(compiled.classes_, forest.classes_)
+
+
+def test_compile_forest_leaves_other_models_unchanged(data):
+    X, y = data
+    model = object()
+    assert compile_forest(model) is model
+    assert isinstance(compile_forest(RandomForestClassifier(n_estimators=2).fit(X, y)), CompiledForest)
+
+
+def test_cascade_escalating_everything_matches_full_forest(data):
+    X, y = data
+    compiled = CompiledForest(RandomForestClassifier(n_estimators=12, random_state=0).fit(X, y))
+
+    proba, escalated = compiled.cascade_proba(X, first_trees=4, threshold=1.1)
+    assert escalated.all()
+    np.testing.assert_array_equal(proba, compiled.predict_proba(X))
+
+
+def test_cascade_keeps_confident_first_stage_answers(data):
+    X, y = data
+    forest = RandomForestClassifier(n_estimators=12, random_state=0).fit(X, y)
+    compiled = CompiledForest(forest)
+
+    proba, escalated = compiled.cascade_proba(X, first_trees=4, threshold=0.75)
+    first_stage = np.mean([tree.predict_proba(X) for tree in forest.estimators_[:4]], axis=0)
+    assert escalated.any() and not escalated.all()
+    np.testing.assert_allclose(proba[~escalated], first_stage[~escalated])
+    np.testing.assert_array_equal(proba[escalated], compiled.predict_proba(X)[escalated])
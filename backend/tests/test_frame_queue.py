@@ -0,0 +1,54 @@
+import asyncio
+from pipeline.frame_queue import LatestFrameQueue
+
+
+def test_newer_frame_replaces_pending_one():
+    drops = []
+    queue = LatestFrameQueue(on_drop=lambda: drops.append(1))
+    queue.put(b"first")
+    queue.put(b"second")
+    queue.put(b"third")
+
+    frame, age = asyncio.run(queue.get())
+    assert frame == b"third"
+    assert age >= 0
+    assert queue.dropped == 2
+    assert queue.received == 3
+    assert len(drops) == 2
+
+
+def test_processed_frame_is_not_counted_as_dropped():
+    async def scenario():
+        queue = LatestFrameQueue()
+        queue.put(b"first")
+        first = await queue.get()
+        queue.put(b"second")
+        second = await queue.get()
+        return queue, first[0], second[0]
+
+    queue, first, second = asyncio.run(scenario())
+    assert (first, second) == (b"first", b"second")
+    assert queue.dropped == 0
+
+
+def test_get_waits_for_a_frame():
+    async def scenario():
+        queue = LatestFrameQueue()
+        waiter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        queue.put(b"frame")
+        return await waiter
+
+    assert asyncio.run(scenario())[0] == b"frame"
+
+
+def test_close_wakes_up_pending_get():
+    async def scenario():
+        queue = LatestFrameQueue()
+        waiter = asyncio.create_task(queue.get())
+        await asyncio.sleep(0)
+        queue.close()
+        return await waiter
+
+    assert asyncio.run(scenario()) is None
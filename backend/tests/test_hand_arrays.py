@@ -0,0 +1,47 @@
+from types import SimpleNamespace
+
+import numpy as np
+from pipeline.drawing import draw_hand
+from pipeline.hands import hand_results
+
+
+def hand(seed=0, low=0.4, high=0.6):
+    return np.random.default_rng(seed).uniform(low, high, (21, 3)).astype(np.float32)
+
+
+def mediapipe_results(*hands):
+    return SimpleNamespace(
+        multi_hand_landmarks=[
+            SimpleNamespace(landmark=[SimpleNamespace(x=x, y=y, z=z) for x, y, z in landmarks.tolist()])
+            for landmarks in hands
+        ],
+        multi_handedness=["handedness"] * len(hands)
+    )
+
+
+def test_hand_results_fills_the_landmark_buffers():
+    buffers = [np.zeros((21, 3), np.float32) for _ in range(2)]
+    first, second = hand(0), hand(1)
+    results = hand_results(mediapipe_results(first, second), buffers.__getitem__)
+
+    assert results.hands[0] is buffers[0] and results.hands[1] is buffers[1]
+    np.testing.assert_array_equal(buffers[0], first)
+    np.testing.assert_array_equal(buffers[1], second)
+    assert results.multi_handedness == ["handedness", "handedness"]
+
+
+def test_hand_results_without_hands():
+    results = hand_results(SimpleNamespace(multi_hand_landmarks=None, multi_handedness=None))
+    assert results.hands == []
+
+
+def test_draw_hand_skips_landmarks_outside_the_frame():
+    image = np.zeros((100, 100, 3), np.uint8)
+    landmarks = np.full((21, 3), 2.0, np.float32)
+    landmarks[0, :2] = 0.5, 0.5
+    draw_hand(image, landmarks, [(0, 1)])
+
+    # Only the landmark in the frame is drawn, without its connection
+    assert image[50, 50 - 4].tolist() == [0, 255, 0]
+    assert image[50, 50 + 6].tolist() == [224, 224, 224]
+    assert not image[:, 70:].any()
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from pipeline.motion import MotionGate, landmark_displacement
+
+
+def hand():
+    return np.random.default_rng(0).random((21, 3), dtype=np.float32)
+
+
+def test_landmark_displacement_is_relative_to_hand_size():
+    landmarks = hand()
+    shift = np.array([0.05, 0, 0], np.float32)
+    assert landmark_displacement(landmarks, landmarks) == 0.0
+    assert landmark_displacement(landmarks * 2, landmarks * 2 + shift * 2) == \
+        pytest.approx(landmark_displacement(landmarks, landmarks + shift))
+
+
+def test_motion_gate_threshold():
+    gate = MotionGate(threshold=0.03)
+    landmarks = hand()
+    gate.update(landmarks, "key", "results")
+    size = np.hypot(*np.ptp(landmarks[:, :2], axis=0))
+
+    assert gate.check(landmarks + [0.02 * size, 0, 0], "key") == "results"
+    assert gate.check(landmarks + [0.04 * size, 0, 0], "key") is None
+
+
+def test_motion_gate_ignores_depth():
+    gate = MotionGate(threshold=0.03)
+    landmarks = hand()
+    gate.update(landmarks, "key", "results")
+    assert gate.check(landmarks + [0, 0, 1.0], "key") == "results"
+
+
+def test_motion_gate_does_not_reuse_results_of_other_settings():
+    gate = MotionGate()
+    landmarks = hand()
+    gate.update(landmarks, ("Right", "online"), "results")
+    assert gate.check(landmarks, ("Right", "custom")) is None
+
+
+def test_motion_gate_forces_analysis_every_max_frames():
+    gate = MotionGate(max_frames=1)
+    landmarks = hand()
+    gate.update(landmarks, "key", "results")
+    assert gate.check(landmarks, "key") == "results"
+    assert gate.check(landmarks, "key") is None
+
+
+def test_motion_gate_disabled():
+    gate = MotionGate(threshold=None)
+    landmarks = hand()
+    gate.update(landmarks, "key", "results")
+    assert gate.check(landmarks, "key") is None
@@ -0,0 +1,125 @@
+import time
+import pytest
+
+pytest.importorskip("paho.mqtt.client")
+
+from mqtt.mqtt_client import HAND_LOST, MQTTClient
+
+
+@pytest.fixture
+def make_client(monkeypatch):
+    """Build connected clients whose queue is drained by the test, not the publisher thread."""
+    monkeypatch.setattr(MQTTClient, "_publish_loop", lambda self: None)
+
+    def make(**kwargs):
+        client = MQTTClient(username="user", **kwargs)
+        client.connected = True
+        return client
+    return make
+
+
+def drain(client):
+    """Return the (topic, payload) of every pending message."""
+    messages = []
+    while client.stats()["queue_depth"]:
+        messages.append(client._next_message())
+    return messages
+
+
+def test_pending_status_of_a_hand_is_coalesced(make_client):
+    client = make_client()
+    client.publish_hand_status("Right", "palm", ["thumb"])
+    client.publish_hand_status("Right", "back", ["thumb", "index"])
+    client.publish_hand_status("Left", "palm", [])
+
+    messages = drain(client)
+    assert client.coalesced == 1
+    assert [(payload["hand"], payload["orientation"]) for _, payload in messages] == [("Right", "back"), ("Left", "palm")]
+    assert messages[0][0] == "user/hand/status"
+
+
+def test_status_is_dropped_when_the_queue_is_full(make_client):
+    client = make_client(queue_size=1)
+    client.publish_hand_status("Right", "palm", [])
+    client.publish_hand_status("Left", "palm", [])
+    assert client.dropped == 1
+    assert len(drain(client)) == 1
+
+
+def test_gesture_events_go_first_and_are_never_dropped(make_client):
+    client = make_client(queue_size=2)
+    client.publish_hand_status("Right", "palm", [])
+    for gesture in "ABC":
+        client.publish_gesture_event(gesture, 0.9, "Right", "palm", [])
+
+    # The pending status made room for the events, which then exceed the queue size
+    assert client.dropped == 1
+    messages = drain(client)
+    assert [payload["gesture"] for _, payload in messages] == ["A", "B", "C"]
+    assert messages[0][0] == "user/gesture/recognized"
+
+
+def test_status_dropped_for_a_gesture_event_is_not_skipped_as_unchanged(make_client):
+    client = make_client(queue_size=1)
+    client.publish_hand_status("Right", "palm", [])
+    client.publish_gesture_event("A", 0.9, "Right", "palm", [])
+    drain(client)
+
+    client.publish_hand_status("Right", "palm", [])
+    assert client.unchanged == 0
+    assert [payload["hand"] for _, payload in drain(client)] == ["Right"]
+
+
+def test_gesture_events_keep_a_pending_reset(make_client):
+    client = make_client(queue_size=1)
+    client.publish_hand_reset()
+    client.publish_gesture_event("A", 0.9, "Right", "palm", [])
+
+    assert client.dropped == 0
+    assert [payload["hand"] for _, payload in drain(client)] == ["Right", HAND_LOST]
+
+
+def test_messages_are_dropped_while_disconnected(make_client):
+    client = make_client()
+    client.connected = False
+    client.publish_hand_status("Right", "palm", [])
+    client.publish_gesture_event("A", 0.9, "Right", "palm", [])
+    client.publish_hand_reset()
+    assert client.dropped_disconnected == 3
+    assert client.stats()["queue_depth"] == 0
+
+
+def test_unchanged_status_is_skipped_until_the_heartbeat(make_client):
+    client = make_client(heartbeat_interval=0.05)
+    client.publish_hand_status("Right", "palm", ["thumb"])
+    drain(client)
+
+    client.publish_hand_status("Right", "palm", ["thumb"])
+    assert client.unchanged == 1
+    assert drain(client) == []
+
+    time.sleep(0.06)
+    client.publish_hand_status("Right", "palm", ["thumb"])
+    assert len(drain(client)) == 1
+
+
+def test_reset_replaces_pending_statuses(make_client):
+    client = make_client()
+    client.publish_hand_status("Right", "palm", ["thumb"])
+    client.publish_hand_reset()
+
+    messages = drain(client)
+    assert len(messages) == 1
+    assert messages[0][1]["hand"] == HAND_LOST
+    assert messages[0][1]["extended_fingers"] == []
+
+    # The first status after a reset is published even if it did not change
+    client.publish_hand_status("Right", "palm", ["thumb"])
+    assert len(drain(client)) == 1
+
+
+def test_status_after_reset_cancels_pending_reset(make_client):
+    client = make_client()
+    client.publish_hand_reset()
+    client.publish_hand_status("Right", "palm", [])
+    assert [payload["hand"] for _, payload in drain(client)] == ["Right"]
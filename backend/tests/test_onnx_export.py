@@ -0,0 +1,57 @@
+import importlib.util
+import os
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+
+pytest.importorskip("skl2onnx")
+pytest.importorskip("onnxruntime")
+
+from inference.model_loader import artifact_path, load_artifact
+from inference.registry import class_labels
+
+# Loaded from its file, so the training package's trainers and their dependencies are not imported
+ONNX_EXPORT_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "training", "onnx_export.py"
+)
+_spec = importlib.util.spec_from_file_location("onnx_export", ONNX_EXPORT_PATH)
+onnx_export = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(onnx_export)
+
+
+@pytest.fixture(scope="module")
+def data():
+    rng = np.random.default_rng(0)
+    # float32 values, as the exported graph sees them
+    X = rng.random((300, 42)).astype(np.float32).astype(np.float64)
+    y = (X[:, 0] * 4).astype(int) + (X[:, 1] > 0.5)
+    return X, y
+
+
+@pytest.mark.parametrize("labels, with_scaler", [
+    ("letters", True),   # Custom model: letter labels, separate scaler
+    ("indices", False),  # Online and student models: letter indices, no scaler
+])
+def test_exported_model_matches_sklearn(tmp_path, data, labels, with_scaler):
+    X, y = data
+    if labels == "letters":
+        y = np.array([chr(ord("A") + value) for value in y])
+    scaler = StandardScaler().fit(X) if with_scaler else None
+    model = RandomForestClassifier(n_estimators=10, max_depth=6, random_state=0)
+    model.fit(scaler.transform(X) if scaler is not None else X, y)
+
+    model_path = str(tmp_path / "model.joblib")
+    onnx_path = onnx_export.export_onnx(model, scaler, model_path, X.shape[1])
+
+    # The backend finds the export next to the joblib model and loads it
+    assert artifact_path(model_path, "onnx") == onnx_path
+    onnx_model, onnx_scaler = load_artifact(onnx_path)
+    assert onnx_scaler is None
+    np.testing.assert_array_equal(onnx_model.classes_, model.classes_)
+    assert class_labels("model", onnx_model) == class_labels("model", model)
+
+    # The graph includes the scaler and takes the raw features
+    expected = model.predict_proba(scaler.transform(X) if scaler is not None else X)
+    np.testing.assert_allclose(onnx_model.predict_proba(X), expected, atol=1e-5)
+    np.testing.assert_array_equal(onnx_model.predict(X), model.classes_[np.argmax(expected, axis=1)])
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+from pipeline.protocol import MAGIC, landmarks_to_list, pack_frame, unpack_frame
+
+
+def test_landmarks_to_list_flattens_each_hand():
+    landmarks = np.arange(2 * 21 * 3, dtype=np.float32).reshape(2, 21, 3) / 1000
+    result = landmarks_to_list(landmarks)
+    assert len(result) == 2
+    assert len(result[0]) == 63
+    assert result[1][0] == pytest.approx(landmarks[1, 0, 0], abs=1e-4)
+
+
+def test_landmarks_to_list_without_hands():
+    assert landmarks_to_list(np.empty((0, 21, 3), np.float32)) == []
+
+
+def test_pack_unpack_image_round_trip():
+    metadata = {"hand_detected": True, "asl_letter": "A"}
+    image = b"\xff\xd8jpeg bytes\xff\xd9"
+    result = unpack_frame(pack_frame(metadata, image=image))
+    assert result[0] == metadata
+    assert result[1] == image
+    assert result[2] is None
+
+
+def test_pack_unpack_landmarks_round_trip():
+    landmarks = np.random.default_rng(0).random((2, 21, 3), dtype=np.float32)
+    metadata, image, unpacked = unpack_frame(pack_frame({"hand_detected": True}, landmarks=landmarks))
+    assert metadata == {"hand_detected": True}
+    assert image is None
+    np.testing.assert_array_equal(unpacked, landmarks)
+
+
+def test_pack_unpack_metadata_only():
+    assert unpack_frame(pack_frame({"hand_detected": False})) == ({"hand_detected": False}, None, None)
+
+
+def test_unpack_rejects_invalid_envelopes():
+    packed = pack_frame({})
+    with pytest.raises(ValueError):
+        unpack_frame(packed[:4])
+    with pytest.raises(ValueError):
+        unpack_frame(b"XX" + packed[len(MAGIC):])
+    with pytest.raises(ValueError):
+        unpack_frame(packed[:2] + bytes([99]) + packed[3:])
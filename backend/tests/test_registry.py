@@ -0,0 +1,165 @@
+import threading
+import time
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from inference import registry
+from inference.registry import ModelRegistry, ModelUnavailable
+
+
+def save_model(path, n_estimators=3, seed=0):
+    rng = np.random.default_rng(seed)
+    X = rng.random((60, 42))
+    y = np.arange(60) % 3
+    joblib.dump(RandomForestClassifier(n_estimators=n_estimators, max_depth=3, random_state=seed).fit(X, y), path)
+    return str(path)
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return {name: save_model(tmp_path / f"{name}.joblib", seed=index) for index, name in enumerate(("a", "b", "c"))}
+
+
+def test_models_are_loaded_on_first_use(paths):
+    models = ModelRegistry(paths)
+    assert models.stats()["models"] == {}
+
+    entry = models.get("a")
+    assert models.get("a") is entry
+    assert models.loads == 1
+    assert entry.labels == ["A", "B", "C"]
+    assert list(models.stats()["models"]) == ["a"]
+
+
+def test_least_recently_used_model_is_evicted(paths):
+    models = ModelRegistry(paths, max_models=2)
+    models.get("a")
+    models.get("b")
+    models.get("a")
+    models.get("c")
+
+    assert list(models.stats()["models"]) == ["a", "c"]
+    assert models.evictions == 1
+
+
+def test_unknown_model_type(paths):
+    with pytest.raises(ModelUnavailable):
+        ModelRegistry(paths).get("z")
+
+
+def slow_loads(monkeypatch, delays):
+    """Make loading a model sleep, keyed by the artifact path; return the loaded paths."""
+    loaded = []
+    load_artifact = registry.load_artifact
+
+    def slow_load_artifact(path, mmap_mode=None):
+        loaded.append(path)
+        time.sleep(delays.get(path, 0))
+        return load_artifact(path, mmap_mode=mmap_mode)
+
+    monkeypatch.setattr(registry, "load_artifact", slow_load_artifact)
+    return loaded
+
+
+def test_concurrent_callers_share_a_single_load(paths, monkeypatch):
+    loaded = slow_loads(monkeypatch, {paths["a"]: 0.2})
+    models = ModelRegistry(paths)
+    entries = []
+    threads = [threading.Thread(target=lambda: entries.append(models.get("a"))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert loaded == [paths["a"]]
+    assert len(entries) == 4 and all(entry is entries[0] for entry in entries)
+
+
+def test_loading_a_model_does_not_block_other_models(paths, monkeypatch):
+    slow_loads(monkeypatch, {paths["a"]: 0.5})
+    models = ModelRegistry(paths)
+    models.get("b")
+    thread = threading.Thread(target=models.get, args=("a",))
+    thread.start()
+    time.sleep(0.05)
+
+    start = time.perf_counter()
+    models.get("b")
+    assert time.perf_counter() - start < 0.1
+    thread.join()
+
+
+def test_failed_load_is_not_retried_until_the_artifact_changes(paths, monkeypatch):
+    with open(paths["a"], "wb") as f:
+        f.write(b"not a model")
+    loaded = slow_loads(monkeypatch, {})
+    models = ModelRegistry(paths)
+
+    for _ in range(3):
+        with pytest.raises(ModelUnavailable):
+            models.get("a")
+    assert loaded == [paths["a"]]
+
+    save_model(paths["a"], n_estimators=4)
+    assert models.get("a").model.n_estimators == 4
+
+
+def test_reload_swaps_in_the_new_version(paths):
+    models = ModelRegistry(paths)
+    previous = models.get("a")
+    save_model(paths["a"], n_estimators=4)
+
+    assert models.reload("a", background=False)
+    current = models.get("a")
+    assert current is not previous
+    assert current.version != previous.version
+    # Callers that resolved the previous entry keep predicting with it
+    assert previous.model.n_estimators == 3
+    assert models.reloads == 1
+
+
+def test_refresh_reloads_changed_artifacts_only(paths):
+    models = ModelRegistry(paths)
+    models.get("a")
+    models.get("b")
+    assert models.refresh() == []
+
+    save_model(paths["b"], n_estimators=4)
+    assert models.refresh() == ["b"]
+    deadline = time.monotonic() + 5
+    while models.reloads == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert models.get("b").model.n_estimators == 4
+    assert models.refresh() == []
+
+
+def test_only_one_reload_of_a_model_runs_at_a_time(paths, monkeypatch):
+    slow_loads(monkeypatch, {paths["a"]: 0.2})
+    models = ModelRegistry(paths)
+    assert models.reload("a")
+    assert not models.reload("a")
+    deadline = time.monotonic() + 5
+    while models.reloads == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert models.reload("a", background=False)
+
+
+def test_refresh_skips_an_artifact_that_failed_to_load(paths, monkeypatch):
+    models = ModelRegistry(paths)
+    entry = models.get("a")
+    with open(paths["a"], "wb") as f:
+        f.write(b"not a model")
+    loaded = slow_loads(monkeypatch, {})
+
+    assert models.refresh() == ["a"]
+    deadline = time.monotonic() + 5
+    while not loaded and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+
+    # The broken artifact is not retried, and the previous version keeps serving
+    assert models.refresh() == []
+    assert models.get("a") is entry
+    assert loaded == [paths["a"]]
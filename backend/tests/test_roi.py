@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+from pipeline.hands import HandResults
+from pipeline.roi import HandRegion
+
+
+def hand(seed=0, low=0.4, high=0.6):
+    return np.random.default_rng(seed).uniform(low, high, (21, 3)).astype(np.float32)
+
+
+def test_region_is_a_padded_square_around_the_hands():
+    landmarks = np.zeros((21, 3), np.float32)
+    landmarks[:, :2] = [(0.4, 0.4), (0.5, 0.6)] * 10 + [(0.45, 0.5)]
+    region = HandRegion(padding=0.5, min_size=10)
+    region.update(HandResults([landmarks], None), (1000, 1000, 3))
+
+    x0, y0, x1, y1 = region.box
+    assert x1 - x0 == y1 - y0 == 400
+    assert (x0 + x1) / 2 == pytest.approx(450, abs=1)
+    assert (y0 + y1) / 2 == pytest.approx(500, abs=1)
+
+    region.update(HandResults([], None), (1000, 1000, 3))
+    assert region.box is None
+
+
+def test_region_maps_crop_landmarks_back_to_the_frame():
+    region = HandRegion()
+    region.box = (100, 50, 300, 250)
+    landmarks = hand(low=0, high=1)
+    crop_landmarks = landmarks.copy()
+    results = HandResults([landmarks], None)
+    region.map_to_frame(results, (480, 640, 3))
+
+    # Mapped in place, into the caller's array
+    assert results.hands[0] is landmarks
+    np.testing.assert_allclose(landmarks[:, 0], (100 + crop_landmarks[:, 0] * 200) / 640, rtol=1e-6)
+    np.testing.assert_allclose(landmarks[:, 1], (50 + crop_landmarks[:, 1] * 200) / 480, rtol=1e-6)
+    np.testing.assert_allclose(landmarks[:, 2], crop_landmarks[:, 2] * 200 / 640, rtol=1e-6)
+
+
+def test_crop_is_downscaled_to_max_size():
+    region = HandRegion(max_size=100)
+    frame = np.zeros((480, 640, 3), np.uint8)
+    region.box = (100, 50, 300, 250)
+    assert region.crop(frame).shape == (100, 100, 3)
+
+    region.box = (100, 50, 180, 130)
+    crop = region.crop(frame)
+    assert crop.shape == (80, 80, 3)
+    assert crop.base is frame
@@ -0,0 +1,43 @@
+import numpy as np
+from pipeline.scene import SceneChangeGate
+
+
+def test_scene_gate_thumbnail_size():
+    gate = SceneChangeGate(width=64)
+    thumbnail = gate.thumbnail(np.zeros((480, 640, 3), np.uint8))
+    assert thumbnail.shape == (48, 64)
+    assert thumbnail.dtype == np.uint8
+
+
+def test_scene_gate_reuses_results_of_a_static_scene():
+    gate = SceneChangeGate(pixel_threshold=15, changed_ratio=0.002)
+    reference = np.full((48, 64), 100, np.uint8)
+    assert gate.check(reference) is None
+    gate.update(reference, "results")
+
+    # Differences up to the pixel threshold do not count as changes
+    assert gate.check(reference + 15) == "results"
+
+    # 0.2% of 3072 pixels: 6 changed pixels are tolerated, 7 are not
+    changed = reference.copy()
+    changed.flat[:6] = 200
+    assert gate.check(changed) == "results"
+    changed.flat[:7] = 200
+    assert gate.check(changed) is None
+
+
+def test_scene_gate_forces_detection_every_max_frames():
+    gate = SceneChangeGate(max_frames=2)
+    thumbnail = np.zeros((48, 64), np.uint8)
+    gate.update(thumbnail, "results")
+    assert gate.check(thumbnail) == "results"
+    assert gate.check(thumbnail) == "results"
+    assert gate.check(thumbnail) is None
+
+
+def test_scene_gate_keeps_its_own_copy_of_the_reference():
+    gate = SceneChangeGate()
+    buffer = np.zeros((48, 64), np.uint8)
+    gate.update(buffer, "results")
+    buffer[:] = 255
+    assert gate.check(np.zeros((48, 64), np.uint8)) == "results"
@@ -0,0 +1,27 @@
+import pytest
+from backend_config import PROCESSING_MAX_WIDTH, PROCESSING_MIN_WIDTH
+from pipeline import session as session_module
+from pipeline.session import FrameSession
+
+
+@pytest.mark.parametrize("requested, expected", [
+    (320, 320),
+    (PROCESSING_MAX_WIDTH * 4, PROCESSING_MAX_WIDTH),
+    (1, PROCESSING_MIN_WIDTH),
+    (0, PROCESSING_MAX_WIDTH),
+    (None, PROCESSING_MAX_WIDTH),
+])
+def test_processing_width_is_clamped(requested, expected):
+    session = FrameSession(1)
+    session.update({"processing_width": requested})
+    assert session.processing_width == expected
+    assert session.capture_settings()["width"] == expected
+
+
+def test_processing_width_without_a_maximum(monkeypatch):
+    monkeypatch.setattr(session_module, "PROCESSING_MAX_WIDTH", None)
+    session = FrameSession(1)
+    session.update({"processing_width": 4000})
+    assert session.processing_width == 4000
+    session.update({"processing_width": 0})
+    assert session.processing_width is None
@@ -0,0 +1,52 @@
+import cv2
+import numpy as np
+from pipeline.hands import HandResults
+from pipeline.tracking import KeyframeTracker
+
+
+def hand(seed=0, low=0.4, high=0.6):
+    return np.random.default_rng(seed).uniform(low, high, (21, 3)).astype(np.float32)
+
+
+def test_tracker_follows_a_moving_hand():
+    frame = np.zeros((240, 320), np.uint8)
+    rng = np.random.default_rng(0)
+    frame[60:180, 80:240] = rng.integers(0, 255, (120, 160), dtype=np.uint8)
+    frame = cv2.GaussianBlur(frame, (5, 5), 0)
+    moved = np.roll(frame, 4, axis=1)
+
+    landmarks = hand()
+    tracker = KeyframeTracker(keyframe_interval=2)
+    tracker.update_keyframe(frame, HandResults([landmarks], "handedness"))
+    # The tracker keeps its own copy of the keyframe landmarks
+    original = landmarks.copy()
+    landmarks[:] = 0
+
+    assert not tracker.keyframe_due()
+    results = tracker.track(moved)
+    assert results.multi_handedness == "handedness"
+    np.testing.assert_allclose(results.hands[0][:, 0], original[:, 0] + 4 / 320, atol=0.5 / 320)
+    np.testing.assert_allclose(results.hands[0][:, 1], original[:, 1], atol=0.5 / 240)
+    np.testing.assert_array_equal(results.hands[0][:, 2], original[:, 2])
+    assert tracker.keyframe_due()
+
+
+def test_tracker_needs_a_keyframe_after_losing_the_hand():
+    frame = np.zeros((240, 320), np.uint8)
+    tracker = KeyframeTracker(keyframe_interval=3)
+    tracker.update_keyframe(frame, HandResults([hand()], None))
+    assert tracker.track(np.full_like(frame, 255)) is None
+    assert tracker.tracking_failures == 1
+    assert tracker.keyframe_due()
+
+
+def test_tracking_is_disabled_with_an_interval_of_one():
+    tracker = KeyframeTracker(keyframe_interval=1)
+    tracker.update_keyframe(np.zeros((240, 320), np.uint8), HandResults([hand()], None))
+    assert tracker.keyframe_due()
+
+
+def test_no_tracking_without_hands():
+    tracker = KeyframeTracker(keyframe_interval=5)
+    tracker.update_keyframe(np.zeros((240, 320), np.uint8), HandResults([], None))
+    assert tracker.keyframe_due()
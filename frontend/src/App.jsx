@@ -5,6 +5,7 @@ import Footer from './components/Footer';
 import CameraView from './components/CameraView';
 import ResultView from './components/ResultView';
 import CONFIG from './frontend_config';
+import { parseBinaryFrame } from './utils/protocol';
 import './i18n/i18n_config';
 
 function App() {
@@ -22,19 +23,30 @@ function App() {
   const [selectedModel, setSelectedModel] = useState(CONFIG.ASL.MODEL_TYPE);
   const [aslLetter, setAslLetter] = useState(null);
   const [aslProbabilities, setAslProbabilities] = useState(null);
+  const [frameStats, setFrameStats] = useState(null);
+  const [handLandmarks, setHandLandmarks] = useState(null);
+  const [captureSettings, setCaptureSettings] = useState(null);
   const [showAbout, setShowAbout] = useState(false);
   const [showPrivacy, setShowPrivacy] = useState(false);
   const aboutModalRef = useRef(null);
   const privacyModalRef = useRef(null);
+  const previewUrlRef = useRef(null);
 
   useEffect(() => {
     const connectWebSocket = () => {
       const ws = new WebSocket(CONFIG.WEBSOCKET_URL);
+      ws.binaryType = 'arraybuffer';
 
       ws.onopen = () => {
         console.log("🟢 WebSocket Connected");
         setIsConnected(true);
         setSocket(ws);
+        // Negotiate the frame protocol and response format
+        ws.send(JSON.stringify({ protocol: CONFIG.PROTOCOL }));
+        ws.send(JSON.stringify({
+          response_mode: CONFIG.RESPONSE_MODE,
+          top_k: CONFIG.ASL.TOP_K
+        }));
         // Send initial ASL state and model type
         ws.send(JSON.stringify({ 
           enable_asl: CONFIG.ASL.ENABLED,
@@ -56,10 +68,32 @@ function App() {
       };
 
       ws.onmessage = (event) => {
-        const data = JSON.parse(event.data);
+        let data;
+        if (event.data instanceof ArrayBuffer) {
+          const { metadata, image, landmarks } = parseBinaryFrame(event.data);
+          data = metadata;
+          if (landmarks) {
+            setHandLandmarks(landmarks);
+          }
+          if (image) {
+            if (previewUrlRef.current) {
+              URL.revokeObjectURL(previewUrlRef.current);
+            }
+            previewUrlRef.current = URL.createObjectURL(image);
+            setPreviewImage(previewUrlRef.current);
+          }
+        } else {
+          data = JSON.parse(event.data);
+        }
+        if (data.capture) {
+          setCaptureSettings(data.capture);
+        }
         if (data.image_with_landmarks) {
           setPreviewImage(data.image_with_landmarks);
         }
+        if (data.landmarks !== undefined) {
+          setHandLandmarks(data.landmarks);
+        }
         if (data.hand_detected !== undefined) {
           setIsHandDetected(data.hand_detected);
         }
@@ -81,6 +115,9 @@ function App() {
         if (data.asl_probabilities !== undefined) {
           setAslProbabilities(data.asl_probabilities);
         }
+        if (data.dropped_frames !== undefined) {
+          setFrameStats({ droppedFrames: data.dropped_frames, queueAgeMs: data.queue_age_ms });
+        }
       };
 
       return () => {
@@ -184,6 +221,7 @@ function App() {
             onAslToggle={handleAslToggle}
             selectedModel={selectedModel}
             onModelChange={handleModelChange}
+            captureSettings={captureSettings}
           />
           <ResultView 
             previewImage={previewImage} 
@@ -194,6 +232,8 @@ function App() {
             liftedFingers={liftedFingers}
             aslLetter={aslLetter}
             aslProbabilities={aslProbabilities}
+            frameStats={frameStats}
+            handLandmarks={handLandmarks}
           />
         </div>
       </main>
@@ -3,7 +3,7 @@ import useCamera from '../hooks/useCamera';
 import CONFIG from '../frontend_config';
 import { CameraIcon, ClockIcon, LanguageIcon } from '@heroicons/react/24/outline';
 
-function CameraView({ socket, isConnected, aslEnabled, onAslToggle, selectedModel, onModelChange }) {
+function CameraView({ socket, isConnected, aslEnabled, onAslToggle, selectedModel, onModelChange, captureSettings }) {
   const { t } = useTranslation();
   const {
     cameras,
@@ -14,7 +14,7 @@ function CameraView({ socket, isConnected, aslEnabled, onAslToggle, selectedMode
     handleIntervalChange,
     incrementInterval,
     decrementInterval,
-  } = useCamera(socket, isConnected);
+  } = useCamera(socket, isConnected, captureSettings);
 
   return (
     <div className="w-full md:w-1/2">
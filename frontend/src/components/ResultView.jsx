@@ -1,7 +1,23 @@
+import { useEffect, useRef } from 'react';
 import { useTranslation } from 'react-i18next';
+import { drawHandLandmarks } from '../utils/landmarks';
 
-function ResultView({ previewImage, isHandDetected, fingerCount, handView, handedness, liftedFingers, aslLetter, aslProbabilities }) {
+const OVERLAY_WIDTH = 640;
+const OVERLAY_HEIGHT = 360;
+
+function ResultView({ previewImage, isHandDetected, fingerCount, handView, handedness, liftedFingers, aslLetter, aslProbabilities, frameStats, handLandmarks }) {
   const { t } = useTranslation();
+  const overlayRef = useRef(null);
+
+  // In landmarks response mode the server sends no image, so draw the overlay here
+  useEffect(() => {
+    const canvas = overlayRef.current;
+    if (!canvas) return;
+    const ctx = canvas.getContext('2d');
+    ctx.fillStyle = 'black';
+    ctx.fillRect(0, 0, canvas.width, canvas.height);
+    drawHandLandmarks(ctx, handLandmarks || [], canvas.width, canvas.height);
+  }, [handLandmarks]);
 
   const getFingerName = (index) => {
     const fingerKeys = ['thumb', 'index', 'middle', 'ring', 'pinky'];
@@ -30,6 +46,13 @@ function ResultView({ previewImage, isHandDetected, fingerCount, handView, hande
             alt="Preview"
             className="w-full aspect-video object-contain bg-black rounded"
           />
+        ) : handLandmarks ? (
+          <canvas
+            ref={overlayRef}
+            width={OVERLAY_WIDTH}
+            height={OVERLAY_HEIGHT}
+            className="w-full aspect-video bg-black rounded"
+          />
         ) : (
           <div className="w-full aspect-video bg-gray-100 rounded flex items-center justify-center text-gray-500">
             {t('results.waiting')}
@@ -49,6 +72,11 @@ function ResultView({ previewImage, isHandDetected, fingerCount, handView, hande
         <div className="mt-2 text-sm text-gray-600">
           {t('results.liftedFingers')}: {liftedFingers?.length > 0 ? liftedFingers.map(i => getFingerName(i)).join(', ') : '-'}
         </div>
+        {frameStats && (
+          <div className="mt-2 text-xs text-gray-400">
+            {t('results.stats.droppedFrames')}: {frameStats.droppedFrames} · {t('results.stats.queueAge')}: {frameStats.queueAgeMs}ms
+          </div>
+        )}
         
         {/* ASL Prediction Section */}
         {aslLetter && (
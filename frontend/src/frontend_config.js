@@ -3,6 +3,9 @@ const CONFIG = {
     ? `${window.location.protocol === 'https:' ? 'wss' : 'ws'}://${window.location.host}/ws`
     : 'ws://localhost:8000/ws', // Development URL
 
+  PROTOCOL: 'binary', // 'binary' (raw JPEG frames) or 'json' (base64 data URLs)
+  RESPONSE_MODE: 'image', // 'image' (server-drawn overlay) or 'landmarks' (client-drawn overlay)
+
   DEFAULT_LANGUAGE: 'es', // Default language
   SUPPORTED_LANGUAGES: ['es', 'en'], // Extendable list of supported languages
 
@@ -13,10 +16,12 @@ const CONFIG = {
 
   ASL: {
     ENABLED: false, // Whether ASL recognition is enabled by default
-    MODEL_TYPE: 'custom', // 'custom' or 'online'
+    MODEL_TYPE: 'custom', // 'custom', 'online' or 'student'
+    TOP_K: 3, // Number of letter probabilities requested from the server
     AVAILABLE_MODELS: [
       { id: 'custom', name: 'Custom Model' },
-      { id: 'online', name: 'Online Model' }
+      { id: 'online', name: 'Online Model' },
+      { id: 'student', name: 'Student Model (fast)' }
     ]
   },
 
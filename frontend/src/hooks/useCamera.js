@@ -1,13 +1,17 @@
 import { useState, useEffect, useRef } from 'react';
 import { setCookie, getCookie } from '../utils/cookies';
 import CONFIG from '../frontend_config';
+import { PROTOCOL_BINARY } from '../utils/protocol';
 
-const useCamera = (socket, isConnected) => {
+const useCamera = (socket, isConnected, captureSettings) => {
   const [cameras, setCameras] = useState([]);
   const [selectedCamera, setSelectedCamera] = useState('');
   const videoRef = useRef(null);
   const streamRef = useRef(null);
   const intervalRef = useRef(null);
+  // Capture size and quality requested by the server, read on every frame
+  const captureRef = useRef(captureSettings);
+  captureRef.current = captureSettings;
   const [cameraUpdateInterval, setCameraUpdateInterval] = useState(CONFIG.DEFAULT_CAMERA_UPDATE_INTERVAL);
 
   useEffect(() => {
@@ -98,12 +102,24 @@ const useCamera = (socket, isConnected) => {
         }
 
         try {
-          canvas.width = videoRef.current.videoWidth;
-          canvas.height = videoRef.current.videoHeight;
+          const { videoWidth, videoHeight } = videoRef.current;
+          const capture = captureRef.current;
+          const width = capture?.width ? Math.min(capture.width, videoWidth) : videoWidth;
+          const quality = capture?.jpeg_quality ?? 0.8;
+          canvas.width = width;
+          canvas.height = Math.round(videoHeight * width / videoWidth);
           ctx.drawImage(videoRef.current, 0, 0, canvas.width, canvas.height);
-          const imageData = canvas.toDataURL("image/jpeg", 0.8);
-          
-          socket.send(JSON.stringify({ image: imageData }));
+
+          if (CONFIG.PROTOCOL === PROTOCOL_BINARY) {
+            canvas.toBlob((blob) => {
+              if (blob && socket.readyState === WebSocket.OPEN) {
+                socket.send(blob);
+              }
+            }, "image/jpeg", quality);
+          } else {
+            const imageData = canvas.toDataURL("image/jpeg", quality);
+            socket.send(JSON.stringify({ image: imageData }));
+          }
         } catch (error) {
           console.error("Error sending frame:", error);
         }
@@ -59,6 +59,10 @@ export const en = {
     asl: {
       title: 'ASL Letter',
       confidence: 'Confidence'
+    },
+    stats: {
+      droppedFrames: 'Dropped frames',
+      queueAge: 'Queue age'
     }
   },
   privacy: {
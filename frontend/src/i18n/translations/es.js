@@ -59,6 +59,10 @@ export const es = {
     asl: {
       title: 'Letra ASL',
       confidence: 'Confianza'
+    },
+    stats: {
+      droppedFrames: 'Fotogramas descartados',
+      queueAge: 'Espera en cola'
     }
   },
   privacy: {
@@ -0,0 +1,35 @@
+// MediaPipe hand skeleton, as pairs of landmark indices
+export const HAND_CONNECTIONS = [
+  [0, 1], [1, 2], [2, 3], [3, 4],
+  [0, 5], [5, 6], [6, 7], [7, 8],
+  [5, 9], [9, 10], [10, 11], [11, 12],
+  [9, 13], [13, 14], [14, 15], [15, 16],
+  [13, 17], [0, 17], [17, 18], [18, 19], [19, 20]
+];
+
+// Draw hands given as flat [x, y, z, ...] arrays of normalized coordinates,
+// using the same colors as the server-side overlay
+export function drawHandLandmarks(ctx, hands, width, height) {
+  ctx.lineWidth = 2;
+  hands.forEach((values) => {
+    const point = (i) => [values[i * 3] * width, values[i * 3 + 1] * height];
+
+    ctx.strokeStyle = 'rgb(255, 0, 0)';
+    HAND_CONNECTIONS.forEach(([start, end]) => {
+      const [x1, y1] = point(start);
+      const [x2, y2] = point(end);
+      ctx.beginPath();
+      ctx.moveTo(x1, y1);
+      ctx.lineTo(x2, y2);
+      ctx.stroke();
+    });
+
+    ctx.fillStyle = 'rgb(0, 255, 0)';
+    for (let i = 0; i < values.length / 3; i++) {
+      const [x, y] = point(i);
+      ctx.beginPath();
+      ctx.arc(x, y, 4, 0, 2 * Math.PI);
+      ctx.fill();
+    }
+  });
+}
@@ -0,0 +1,43 @@
+// Binary frame envelope sent by the backend when the 'binary' protocol is negotiated.
+// Layout (little endian): magic "GZ" (2 bytes), version (1), flags (1),
+// metadata length (4), payload length (4), metadata JSON, payload.
+// The payload is either a JPEG or float32 landmarks of shape (hands, 21, 3).
+export const PROTOCOL_JSON = 'json';
+export const PROTOCOL_BINARY = 'binary';
+
+export const RESPONSE_MODE_IMAGE = 'image';
+export const RESPONSE_MODE_LANDMARKS = 'landmarks';
+
+const HEADER_SIZE = 12;
+const FLAG_IMAGE = 0x01;
+const FLAG_LANDMARKS = 0x02;
+const LANDMARK_VALUES = 21 * 3;
+const textDecoder = new TextDecoder();
+
+export function parseBinaryFrame(buffer) {
+  const view = new DataView(buffer);
+  if (buffer.byteLength < HEADER_SIZE || view.getUint8(0) !== 0x47 || view.getUint8(1) !== 0x5a) {
+    throw new Error('Invalid binary frame');
+  }
+  const flags = view.getUint8(3);
+  const metaLength = view.getUint32(4, true);
+  const payloadLength = view.getUint32(8, true);
+  const metaEnd = HEADER_SIZE + metaLength;
+
+  const metadata = JSON.parse(textDecoder.decode(new Uint8Array(buffer, HEADER_SIZE, metaLength)));
+  const image = flags & FLAG_IMAGE
+    ? new Blob([new Uint8Array(buffer, metaEnd, payloadLength)], { type: 'image/jpeg' })
+    : null;
+
+  let landmarks = null;
+  if (flags & FLAG_LANDMARKS) {
+    // Copy out of the message buffer, which is not guaranteed to be 4-byte aligned
+    const values = new Float32Array(buffer.slice(metaEnd, metaEnd + payloadLength));
+    landmarks = [];
+    for (let offset = 0; offset < values.length; offset += LANDMARK_VALUES) {
+      landmarks.push(values.subarray(offset, offset + LANDMARK_VALUES));
+    }
+  }
+
+  return { metadata, image, landmarks };
+}
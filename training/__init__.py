@@ -1,6 +1,7 @@
 from .base_trainer import BaseTrainer
 from .custom_trainer import CustomTrainer
 from .online_trainer import OnlineTrainer
+from .distill_trainer import DistillTrainer
 from .model_factory import ModelFactory
 
-__all__ = ['BaseTrainer', 'CustomTrainer', 'OnlineTrainer', 'ModelFactory']
+__all__ = ['BaseTrainer', 'CustomTrainer', 'OnlineTrainer', 'DistillTrainer', 'ModelFactory']
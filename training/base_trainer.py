@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 import joblib
 import os
 from sklearn.metrics import accuracy_score, classification_report
+from training.onnx_export import export_onnx as export_onnx_model
+from training.splits import save_splits
 
 class BaseTrainer(ABC):
     def __init__(self, model_name, model_path):
@@ -24,8 +26,12 @@ class BaseTrainer(ABC):
         """Preprocess hand landmarks for model input."""
         pass
     
-    def train(self):
-        """Train the model and save it."""
+    def train(self, export_onnx=False):
+        """Train the model and save it.
+        
+        Args:
+            export_onnx: Also export the model to ONNX next to the joblib file
+        """
         # Load and preprocess data
         self.X_train, self.y_train, self.X_test, self.y_test = self.load_data()
         
@@ -36,6 +42,10 @@ class BaseTrainer(ABC):
         os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
         joblib.dump(self.model, self.model_path)
         print(f"Model saved to {self.model_path}")
+        save_splits(self.model_path, self.X_train, self.y_train, self.X_test, self.y_test)
+        
+        if export_onnx:
+            export_onnx_model(self.model, None, self.model_path, self.X_train.shape[1])
     
     def evaluate(self):
         """Evaluate the model's performance."""
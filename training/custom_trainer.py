@@ -9,6 +9,8 @@ import seaborn as sns
 import matplotlib.pyplot as plt
 import joblib
 from config import get_dataset_paths, RANDOM_STATE, TEST_SIZE
+from training.onnx_export import export_onnx as export_onnx_model
+from training.splits import save_splits
 
 class CustomTrainer:
     def __init__(self, dataset_name, model_path):
@@ -24,11 +26,9 @@ class CustomTrainer:
 
     def preprocess_features(self, landmarks):
         """Convert landmarks to feature vectors."""
-        features = []
-        for landmark in landmarks:
-            # Use only x, y coordinates (42 features)
-            features.extend([landmark['x'], landmark['y']])
-        return np.array(features)
+        # Use only x, y coordinates (42 features), interleaved per landmark
+        points = np.array([(landmark['x'], landmark['y']) for landmark in landmarks])
+        return points.ravel()
 
     def load_data(self):
         """Load and preprocess the dataset."""
@@ -86,8 +86,12 @@ class CustomTrainer:
         plt.savefig(f'plots/{title.lower().replace(" ", "_")}.png')
         plt.close()
 
-    def train(self):
-        """Train the model."""
+    def train(self, export_onnx=False):
+        """Train the model.
+
+        Args:
+            export_onnx: Also export the scaler and model to ONNX next to the joblib file
+        """
         print("Loading and preprocessing data...")
         X_train, X_test, y_train, y_test = self.load_data()
 
@@ -117,5 +121,9 @@ class CustomTrainer:
             'model': self.model,
             'scaler': self.scaler
         }, self.model_path)
+        save_splits(self.model_path, X_train, y_train, X_test, y_test)
+
+        if export_onnx:
+            export_onnx_model(self.model, self.scaler, self.model_path, X_train.shape[1])
 
         return self.model, self.scaler
@@ -0,0 +1,168 @@
+import json
+import os
+import time
+import joblib
+import numpy as np
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score
+from training.onnx_export import export_onnx as export_onnx_model
+from training.splits import load_split, save_splits
+
+# Classes below this teacher probability are left out of a sample's soft targets
+MIN_SOFT_PROBABILITY = 0.01
+
+
+class DistillTrainer:
+    """
+    Distills a large teacher forest into a compact student forest.
+
+    The student is a shallow RandomForestClassifier trained on the teacher's
+    soft probabilities: every sample is repeated once per likely class, with
+    the teacher's probability as its sample weight. The transfer set is the
+    teacher's training split, as saved next to the teacher, plus jittered
+    copies labeled by the teacher; the student is evaluated on the teacher's
+    saved test split, so both accuracies are measured on unseen data.
+    The student is saved in the same {'model', 'scaler'} format as the
+    teacher, reusing the teacher's scaler, so the backend serves it unchanged.
+    """
+
+    def __init__(self, teacher_path, model_path, n_estimators=30, max_depth=10,
+                 jitter_copies=2, jitter_std=0.1, random_state=42):
+        """
+        Args:
+            teacher_path: Path of the teacher's joblib artifact, with its saved splits next to it
+            model_path: Path to save the student to
+            n_estimators: Number of trees in the student
+            max_depth: Maximum depth of the student's trees
+            jitter_copies: Number of jittered copies of the training set labeled by the teacher
+            jitter_std: Standard deviation of the jitter, in scaled feature units
+            random_state: Seed for the jitter and the student forest
+        """
+        self.teacher_path = teacher_path
+        self.model_path = model_path
+        self.jitter_copies = jitter_copies
+        self.jitter_std = jitter_std
+        self.rng = np.random.default_rng(random_state)
+        self.model = RandomForestClassifier(
+            n_estimators=n_estimators,
+            max_depth=max_depth,
+            random_state=random_state,
+            n_jobs=-1
+        )
+        self.teacher = None
+        self.scaler = None
+
+    def load_teacher(self):
+        """Load the teacher model and scaler."""
+        saved_data = joblib.load(self.teacher_path)
+        if isinstance(saved_data, dict):
+            self.teacher, self.scaler = saved_data['model'], saved_data.get('scaler')
+        else:
+            self.teacher, self.scaler = saved_data, None
+
+    def load_data(self):
+        """
+        Load the splits the teacher was trained and tested on.
+
+        They are already in the teacher's feature space. Rebuilding them from
+        the dataset would not reproduce the teacher's split, since the
+        online dataset is augmented at random before splitting.
+
+        Returns:
+            tuple: (X_train, y_train, X_test, y_test)
+        """
+        X_train, y_train = load_split(self.teacher_path, "train")
+        X_test, y_test = load_split(self.teacher_path, "test")
+        return X_train, y_train, X_test, y_test
+
+    def soft_targets(self, X):
+        """
+        Expand samples into (sample, class) pairs weighted by the teacher's probabilities.
+
+        Returns:
+            tuple: (features, labels, sample weights)
+        """
+        probabilities = self.teacher.predict_proba(X)
+        rows, columns = np.nonzero(probabilities >= MIN_SOFT_PROBABILITY)
+        return X[rows], self.teacher.classes_[columns], probabilities[rows, columns]
+
+    def transfer_set(self, X_train):
+        """Return the training data plus jittered copies for the teacher to label."""
+        copies = [X_train]
+        for _ in range(self.jitter_copies):
+            copies.append(X_train + self.rng.normal(0, self.jitter_std, X_train.shape))
+        return np.vstack(copies)
+
+    @staticmethod
+    def single_sample_latency_ms(model, X, samples=200):
+        """Return the median latency of single-sample predict_proba, in milliseconds."""
+        timings = []
+        for row in X[:samples]:
+            start = time.perf_counter()
+            model.predict_proba(row.reshape(1, -1))
+            timings.append(time.perf_counter() - start)
+        return float(np.median(timings) * 1000)
+
+    def report(self, X_test, y_test):
+        """Compare the student with the teacher on the test split."""
+        teacher_pred = self.teacher.predict(X_test)
+        student_pred = self.model.predict(X_test)
+        teacher_accuracy = accuracy_score(y_test, teacher_pred)
+        student_accuracy = accuracy_score(y_test, student_pred)
+
+        # Single-threaded latency, as in the backend's per-frame inference
+        self.teacher.set_params(n_jobs=1)
+        self.model.set_params(n_jobs=1)
+
+        return {
+            "teacher_path": self.teacher_path,
+            "student_path": self.model_path,
+            "teacher_accuracy": round(teacher_accuracy, 4),
+            "student_accuracy": round(student_accuracy, 4),
+            "accuracy_delta": round(student_accuracy - teacher_accuracy, 4),
+            "teacher_agreement": round(float(np.mean(teacher_pred == student_pred)), 4),
+            "teacher_size_mb": round(os.path.getsize(self.teacher_path) / 1e6, 2),
+            "student_size_mb": round(os.path.getsize(self.model_path) / 1e6, 2),
+            "teacher_latency_ms": round(self.single_sample_latency_ms(self.teacher, X_test), 3),
+            "student_latency_ms": round(self.single_sample_latency_ms(self.model, X_test), 3),
+            "teacher_trees": len(self.teacher.estimators_),
+            "student_trees": len(self.model.estimators_),
+        }
+
+    def train(self, export_onnx=False):
+        """Distill the teacher, save the student and its report.
+
+        Args:
+            export_onnx: Also export the student to ONNX next to the joblib file
+        """
+        self.load_teacher()
+        X_train, y_train, X_test, y_test = self.load_data()
+
+        print("Labeling transfer set with the teacher...")
+        X_soft, y_soft, weights = self.soft_targets(self.transfer_set(X_train))
+
+        print(f"Training student on {len(X_soft)} soft-labeled samples...")
+        self.model.fit(X_soft, y_soft, sample_weight=weights)
+
+        os.makedirs(os.path.dirname(self.model_path), exist_ok=True)
+        joblib.dump({
+            'model': self.model,
+            'scaler': self.scaler
+        }, self.model_path)
+        print(f"Model saved to {self.model_path}")
+        save_splits(self.model_path, X_train, y_train, X_test, y_test)
+
+        report = self.report(X_test, y_test)
+        report_path = os.path.splitext(self.model_path)[0] + "_report.json"
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+
+        print("\nDistillation report:")
+        for key, value in report.items():
+            print(f"  {key}: {value}")
+        print(f"Report saved to {report_path}")
+
+        if export_onnx:
+            export_onnx_model(self.model, self.scaler, self.model_path, X_train.shape[1])
+
+        return self.model, self.scaler
@@ -1,17 +1,21 @@
 from training.base_trainer import BaseTrainer
 from training.custom_trainer import CustomTrainer
+from training.distill_trainer import DistillTrainer
 from training.online_trainer import OnlineTrainer
 
 class ModelFactory:
     @staticmethod
-    def create_trainer(model_type: str, model_path: str, dataset_name: str = None) -> BaseTrainer:
+    def create_trainer(model_type: str, model_path: str, dataset_name: str = None,
+                       teacher_path: str = None) -> BaseTrainer:
         """
         Create a trainer instance based on the specified model type.
         
         Args:
-            model_type (str): Type of model to create ('custom' or 'online')
+            model_type (str): Type of model to create ('custom', 'online' or 'student')
             model_path (str): Path to save/load the model
             dataset_name (str, optional): Name of the dataset to use for online training
+            teacher_path (str, optional): Path of the teacher model to distill ('student' only);
+                its saved train and test splits are used
             
         Returns:
             BaseTrainer: An instance of the appropriate trainer class
@@ -23,5 +27,9 @@ class ModelFactory:
             return CustomTrainer(dataset_name, model_path)
         elif model_type.lower() == 'online':
             return OnlineTrainer(model_path, dataset_name)
+        elif model_type.lower() == 'student':
+            if teacher_path is None:
+                raise ValueError("A teacher model path is required to train a student model.")
+            return DistillTrainer(teacher_path, model_path)
         else:
-            raise ValueError(f"Invalid model type: {model_type}. Must be 'custom' or 'online'.")
+            raise ValueError(f"Invalid model type: {model_type}. Must be 'custom', 'online' or 'student'.")
@@ -5,6 +5,8 @@ from sklearn.model_selection import train_test_split, GridSearchCV
 from sklearn.preprocessing import StandardScaler
 from sklearn.metrics import accuracy_score, classification_report
 from training.base_trainer import BaseTrainer
+from training.onnx_export import export_onnx as export_onnx_model
+from training.splits import save_splits
 import cv2
 import mediapipe as mp
 from tqdm import tqdm
@@ -81,15 +83,9 @@ class OnlineTrainer(BaseTrainer):
 
     def preprocess_features(self, landmarks):
         """Preprocess hand landmarks for model input."""
-        features = []
-        for landmark in landmarks.landmark:
-            # Use only x, y coordinates (42 features)
-            features.extend([landmark.x, landmark.y])
-        
-        # Convert to numpy array
-        features = np.array(features)
-        
-        return features
+        # Convert the landmarks once, then use only x, y coordinates (42 features)
+        points = np.array([(landmark.x, landmark.y, landmark.z) for landmark in landmarks.landmark])
+        return points[:, :2].ravel()
 
     def augment_features(self, features):
         """Apply data augmentation to features."""
@@ -114,11 +110,12 @@ class OnlineTrainer(BaseTrainer):
             angle = np.random.uniform(-0.1, 0.1)
             cos_angle = np.cos(angle)
             sin_angle = np.sin(angle)
-            
-            for i in range(n_landmarks):
-                x, y = features_reshaped[i, 0], features_reshaped[i, 1]
-                features_reshaped[i, 0] = x * cos_angle - y * sin_angle
-                features_reshaped[i, 1] = x * sin_angle + y * cos_angle
+            # Same arithmetic as the former per-landmark loop, written back in place
+            # like the noise: `features_reshaped` is a view of `features`, so the
+            # caller's copy of the sample is rotated too
+            x, y = features_reshaped[:, 0].copy(), features_reshaped[:, 1].copy()
+            features_reshaped[:, 0] = x * cos_angle - y * sin_angle
+            features_reshaped[:, 1] = x * sin_angle + y * cos_angle
         
         # Flatten back to 1D
         augmented_features = features_reshaped.flatten()
@@ -154,8 +151,12 @@ class OnlineTrainer(BaseTrainer):
         
         return self.model
 
-    def train(self):
-        """Train the model and save it."""
+    def train(self, export_onnx=False):
+        """Train the model and save it.
+        
+        Args:
+            export_onnx: Also export the scaler and model to ONNX next to the joblib file
+        """
         # Load and preprocess data
         self.X_train, self.y_train, self.X_test, self.y_test = self.load_data()
         
@@ -182,5 +183,9 @@ class OnlineTrainer(BaseTrainer):
             'scaler': self.scaler
         }, self.model_path)
         print(f"Model saved to {self.model_path}")
+        save_splits(self.model_path, self.X_train, self.y_train, self.X_test, self.y_test)
+        
+        if export_onnx:
+            export_onnx_model(self.model, self.scaler, self.model_path, self.X_train.shape[1])
         
         return self.model, self.scaler
@@ -0,0 +1,55 @@
+import json
+import os
+
+# Key of the ONNX metadata entry holding the classifier's classes_, in column order.
+# Must match backend/inference/onnx_model.py (checked by backend/tests/test_onnx_export.py)
+CLASSES_METADATA_KEY = "classes"
+
+
+def onnx_path_for(model_path):
+    """Return the path of the ONNX artifact stored next to a joblib model (same as backend/inference/model_loader.py)."""
+    return os.path.splitext(model_path)[0] + ".onnx"
+
+
+def export_onnx(model, scaler, model_path, n_features=42):
+    """
+    Export a fitted scaler + classifier pipeline to ONNX next to the joblib model.
+
+    The scaler is folded into the graph, so the exported model takes the raw
+    landmark features and returns class probabilities. Requires the optional
+    skl2onnx dependency.
+
+    Args:
+        model: Fitted classifier
+        scaler: Fitted scaler applied before the classifier, or None
+        model_path: Path of the joblib model; the ONNX file gets the same name
+        n_features: Number of input features
+
+    Returns:
+        str: Path of the ONNX file, or None if skl2onnx is not installed
+    """
+    try:
+        from onnx import helper
+        from skl2onnx import convert_sklearn
+        from skl2onnx.common.data_types import FloatTensorType
+        from sklearn.pipeline import Pipeline
+    except ImportError:
+        print("skl2onnx is not installed; skipping ONNX export (pip install skl2onnx)")
+        return None
+
+    steps = [('scaler', scaler)] if scaler is not None else []
+    pipeline = Pipeline(steps + [('model', model)])
+
+    onnx_model = convert_sklearn(
+        pipeline,
+        initial_types=[('input', FloatTensorType([None, n_features]))],
+        # Plain probability tensor instead of a list of {label: probability} maps
+        options={id(model): {'zipmap': False}}
+    )
+    helper.set_model_props(onnx_model, {CLASSES_METADATA_KEY: json.dumps(model.classes_.tolist())})
+
+    onnx_path = onnx_path_for(model_path)
+    with open(onnx_path, 'wb') as f:
+        f.write(onnx_model.SerializeToString())
+    print(f"ONNX model saved to {onnx_path}")
+    return onnx_path
@@ -0,0 +1,58 @@
+import os
+import numpy as np
+
+
+def split_path_for(model_path, split):
+    """Return the path of a data split ('train' or 'test') saved next to a joblib model."""
+    return os.path.splitext(model_path)[0] + f"_{split}.npz"
+
+
+def test_split_path_for(model_path):
+    """Return the path of the test split saved next to a joblib model."""
+    return split_path_for(model_path, "test")
+
+
+def save_split(model_path, split, X, y):
+    """
+    Save (scaled) features and labels of a data split next to the model.
+
+    Args:
+        model_path: Path of the joblib model
+        split: Split name, 'train' or 'test'
+        X: Features, as passed to the model
+        y: Labels
+    """
+    path = split_path_for(model_path, split)
+    np.savez_compressed(path, X=np.asarray(X), y=np.asarray(y))
+    print(f"{split.capitalize()} split saved to {path}")
+    return path
+
+
+def save_splits(model_path, X_train, y_train, X_test, y_test):
+    """
+    Save the train and test splits a model was trained and evaluated on.
+
+    Lets later tools evaluate the model on exactly the data it was tested on
+    (the cascade benchmark), or train on exactly the data it was trained on
+    (distillation), without reloading the dataset. Datasets with random
+    augmentation cannot be rebuilt identically.
+    """
+    save_split(model_path, "train", X_train, y_train)
+    save_split(model_path, "test", X_test, y_test)
+
+
+def load_split(model_path, split):
+    """
+    Load a data split saved next to a model.
+
+    Returns:
+        tuple: (X, y)
+
+    Raises:
+        FileNotFoundError: If the model was trained before its splits were saved
+    """
+    path = split_path_for(model_path, split)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No {split} split saved for {model_path} ({path}); retrain the model to create it")
+    with np.load(path, allow_pickle=False) as data:
+        return data["X"], data["y"]
@@ -0,0 +1,7 @@
+import os
+import sys
+
+# Same import paths as `PYTHONPATH=. python training/train.py`: the training
+# directory first (for its `config` module), then the repository root
+TRAINING_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [TRAINING_DIR, os.path.dirname(TRAINING_DIR)]
@@ -0,0 +1,60 @@
+import json
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import StandardScaler
+from training.distill_trainer import DistillTrainer
+from training.splits import load_split, save_splits
+
+
+@pytest.fixture
+def teacher_path(tmp_path):
+    """Train a small teacher and save it with its splits, like the trainers do."""
+    rng = np.random.default_rng(0)
+    X = rng.random((400, 42))
+    y = (X[:, 0] * 3).astype(int)
+    scaler = StandardScaler().fit(X[:300])
+    X_train, X_test = scaler.transform(X[:300]), scaler.transform(X[300:])
+    teacher = RandomForestClassifier(n_estimators=20, random_state=0).fit(X_train, y[:300])
+
+    path = str(tmp_path / "teacher.joblib")
+    joblib.dump({'model': teacher, 'scaler': scaler}, path)
+    save_splits(path, X_train, y[:300], X_test, y[300:])
+    return path
+
+
+def test_distills_on_the_teacher_splits(teacher_path, tmp_path):
+    student_path = str(tmp_path / "student.joblib")
+    trainer = DistillTrainer(teacher_path, student_path, n_estimators=5, max_depth=5)
+    trainer.train()
+
+    # The student is evaluated on exactly the teacher's test split
+    X_test, y_test = load_split(teacher_path, "test")
+    student_X_test, student_y_test = load_split(student_path, "test")
+    np.testing.assert_array_equal(student_X_test, X_test)
+    np.testing.assert_array_equal(student_y_test, y_test)
+
+    with open(str(tmp_path / "student_report.json")) as f:
+        report = json.load(f)
+    teacher = joblib.load(teacher_path)['model']
+    assert report["teacher_accuracy"] == round(float(np.mean(teacher.predict(X_test) == y_test)), 4)
+    assert report["student_trees"] == 5
+
+    saved = joblib.load(student_path)
+    assert saved['scaler'].mean_.tolist() == joblib.load(teacher_path)['scaler'].mean_.tolist()
+
+
+def test_transfer_set_excludes_the_test_split(teacher_path, tmp_path):
+    trainer = DistillTrainer(teacher_path, str(tmp_path / "student.joblib"), jitter_copies=1)
+    X_train, _, X_test, _ = trainer.load_data()
+    transfer = trainer.transfer_set(X_train)
+    assert len(transfer) == 2 * len(X_train)
+    assert not any((transfer == row).all(axis=1).any() for row in X_test)
+
+
+def test_teacher_without_saved_splits_is_rejected(tmp_path):
+    path = str(tmp_path / "old_teacher.joblib")
+    joblib.dump({'model': None, 'scaler': None}, path)
+    with pytest.raises(FileNotFoundError, match="retrain"):
+        DistillTrainer(path, str(tmp_path / "student.joblib")).load_data()
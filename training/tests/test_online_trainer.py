@@ -0,0 +1,36 @@
+import numpy as np
+from training.online_trainer import OnlineTrainer
+
+
+def augment_with_loop(features):
+    """The original per-landmark augmentation, kept as the reference."""
+    if np.random.random() < 0.3:
+        return None
+    features_reshaped = features.reshape(21, 2)
+    features_reshaped += np.random.normal(0, 0.02, features_reshaped.shape)
+    if np.random.random() < 0.5:
+        angle = np.random.uniform(-0.1, 0.1)
+        cos_angle = np.cos(angle)
+        sin_angle = np.sin(angle)
+        for i in range(21):
+            x, y = features_reshaped[i, 0], features_reshaped[i, 1]
+            features_reshaped[i, 0] = x * cos_angle - y * sin_angle
+            features_reshaped[i, 1] = x * sin_angle + y * cos_angle
+    return features_reshaped.flatten()
+
+
+def test_augment_features_matches_the_per_landmark_loop():
+    rng = np.random.default_rng(0)
+    for seed in range(50):
+        original = rng.random(42)
+        expected_sample, sample = original.copy(), original.copy()
+        np.random.seed(seed)
+        expected = augment_with_loop(expected_sample)
+        np.random.seed(seed)
+        augmented = OnlineTrainer.augment_features(None, sample)
+
+        assert (augmented is None) == (expected is None)
+        if expected is not None:
+            np.testing.assert_array_equal(augmented, expected)
+        # The sample itself is augmented in place, as it always was
+        np.testing.assert_array_equal(sample, expected_sample)
@@ -5,23 +5,30 @@ from training.model_factory import ModelFactory
 def main():
     parser = argparse.ArgumentParser(description='Train ASL recognition models')
     parser.add_argument('--model-type', type=str, required=True,
-                      choices=['custom', 'online'],
+                      choices=['custom', 'online', 'student'],
                       help='Type of model to train')
     parser.add_argument('--model-path', type=str, required=True,
                       help='Path to save the trained model')
     parser.add_argument('--dataset-name', type=str, required=True,
                       help='Name of the dataset to use')
+    parser.add_argument('--teacher-path', type=str, default=None,
+                      help='Path of the teacher model to distill (student models only)')
+    parser.add_argument('--export-onnx', action='store_true',
+                      help='Also export the trained model to ONNX (requires skl2onnx)')
     args = parser.parse_args()
 
     # Create output directory if it doesn't exist
     os.makedirs(os.path.dirname(args.model_path), exist_ok=True)
     
     # Create trainer instance
-    trainer = ModelFactory.create_trainer(args.model_type, args.model_path, args.dataset_name)
+    trainer = ModelFactory.create_trainer(
+        args.model_type, args.model_path, args.dataset_name,
+        teacher_path=args.teacher_path
+    )
     
     # Train the model
     print(f"Training {args.model_type} model...")
-    trainer.train()
+    trainer.train(export_onnx=args.export_onnx)
 
     print(f"Training completed. Model saved to {args.model_path}")
 